@@ -182,10 +182,22 @@ async def override_rate_limit(user_id: str, new_limit: int):
     return {"status": "SUCCESS", "user_id": user_id, "new_limit": new_limit}
 
 @router.post("/control/kill-swarm")
-async def terminate_session(session_id: str):
-    """Emergency system kill switch for a specific swarm session."""
+async def terminate_session(session_id: str, reason: str = "Terminated by administrator"):
+    """
+    Emergency system kill switch for a specific swarm session (mission, Forge session or goal id).
+    In-flight LLM calls and sandbox processes are aborted; unused prepaid credits are refunded by the stream.
+    """
+    from core.mission_registry import mission_registry
+    if not mission_registry.cancel(session_id, reason=reason):
+        raise HTTPException(status_code=404, detail=f"No running swarm session {session_id} on this worker.")
     return {"status": "TERMINATED", "session_id": session_id}
 
+@router.get("/control/missions")
+async def list_running_missions():
+    """Lists swarm sessions currently running on this worker."""
+    from core.mission_registry import mission_registry
+    return {"missions": mission_registry.list_active()}
+
 @router.get("/organizations")
 async def list_organizations():
     """Lists all research institutions in the registry."""
@@ -440,3 +452,73 @@ async def get_sandbox_metrics():
             {"time": "2026-03-24T14:15:22Z", "reason": "RESOURCE_EXHAUSTION"}
         ]
     }
+
+@router.get("/metrics/llm-cache")
+async def get_llm_cache_metrics():
+    """
+    Returns hit/miss counters and estimated token/latency savings for the LLM response cache,
+    plus single-flight coalescing and provider prompt-cache counters.
+    """
+    from core_config import config
+    from core.response_cache import response_cache
+    from core.request_coalescer import request_coalescer
+    from core.token_controller import prompt_cache_stats
+
+    return {
+        "enabled": config.ENABLE_RESPONSE_CACHE,
+        **response_cache.get_stats(),
+        "coalescing": {
+            "enabled": config.ENABLE_REQUEST_COALESCING,
+            **request_coalescer.get_stats()
+        },
+        "prompt_cache": prompt_cache_stats.get_stats()
+    }
+
+@router.get("/metrics/model-cascade")
+async def get_model_cascade_metrics():
+    """
+    Returns per-call-site model cascade acceptance and escalation rates.
+    """
+    from core_config import config
+    from core.model_cascade import CASCADE_POLICIES, cascade_stats
+
+    return {
+        "enabled": config.ENABLE_MODEL_CASCADE,
+        "policies": {
+            site: {"tiers": policy.tiers, "description": policy.description}
+            for site, policy in CASCADE_POLICIES.items()
+        },
+        "sites": cascade_stats.get_diagnostics()
+    }
+
+@router.get("/metrics/hedging")
+async def get_hedging_metrics():
+    """
+    Returns hedged-request counts, win rate inputs and extra spend against the budget cap.
+    """
+    from core_config import config
+    from core.request_hedger import request_hedger
+
+    return {
+        "enabled": config.ENABLE_REQUEST_HEDGING,
+        "roles": config.HEDGE_ROLES,
+        "target": config.HEDGE_TARGET,
+        "budget_pct": config.HEDGE_BUDGET_PCT,
+        **request_hedger.get_diagnostics()
+    }
+
+@router.get("/metrics/stage-cache")
+async def get_stage_cache_metrics():
+    """
+    Returns per-agent hit rates (exact reuse vs warm start) of the semantic planner/architect cache.
+    """
+    from core_config import config
+    from core.stage_cache import stage_result_cache
+
+    return {
+        "enabled": config.ENABLE_STAGE_CACHE,
+        "embedder": config.STAGE_CACHE_EMBEDDER,
+        "reuse_threshold": stage_result_cache.reuse_threshold,
+        "warm_start_threshold": stage_result_cache.warm_start_threshold,
+        "agents": stage_result_cache.get_stats()
+    }
@@ -3,18 +3,22 @@ from __future__ import annotations
 Decoupling Layer for Ascension Platform.
 Wraps core intelligence components to prevent direct HTTP/Platform coupling.
 """
-from typing import AsyncGenerator
+from typing import Any, AsyncGenerator
 from pathlib import Path
 import asyncio
 import json
-import uuid
 import time
 
 from core.cognition import CognitionCore
+from core.mission_registry import MissionCancelled, settle_prepaid_cost
+from core.mission_checkpoint import is_valid_mission_id, new_mission_id
 from api.usage_db import SessionLocal, SwarmMission
 from api.notifications import NotificationService
 from utils.logger import logger
 
+# Seconds of silence on the event stream before a keep-alive ping is sent
+KEEPALIVE_INTERVAL = 5.0
+
 class CoreAdapter:
     """
     Service adapter for the Ascension Cognition Core.
@@ -25,68 +29,105 @@ class CoreAdapter:
         self.cognition = CognitionCore()
         self.notifications = NotificationService()
 
+    def start_planning_prefetch(self, objective: str, user_id: str, swarm_config: dict | None = None) -> asyncio.Task:
+        """
+        Starts gathering a mission's planning inputs in the background while it is being admitted.
+        Pass the task to `run_swarm_stream`, or cancel it if the mission is rejected.
+        """
+        config = swarm_config or {"agents": {"auditor": True, "optimizer": True, "critic": True}}
+        return asyncio.create_task(self.cognition.swarm.prefetch_planning(objective, config, user_id=user_id))
+
     async def run_swarm_stream(
         self, 
         objective: str, 
         user_id: str, 
         parent_id: str | None = None, 
         experiment_id: str | None = None,
-        swarm_config: dict | None = None
+        swarm_config: dict | None = None,
+        mission_id: str | None = None,
+        prepaid_cost: float = 0.0,
+        ledger: Any = None,
+        prefetch: asyncio.Task | None = None
     ) -> AsyncGenerator[str, None]:
         """
         Executes a swarm task and yields progress updates as SSE events.
-        Includes Keep-Alive pings to prevent proxy timeouts during deep reasoning.
+        Stage transitions and streamed agent output (DELTA events) are relayed as they are produced;
+        Keep-Alive pings are only sent when the swarm has been silent for KEEPALIVE_INTERVAL seconds.
+        Passing the `mission_id` of a failed run resumes it from its last checkpointed stage; callers
+        must have verified that `user_id` owns it. New missions always get a server-generated ID.
+        If the mission is cancelled, the unused share of `prepaid_cost` is refunded through `ledger`.
+        A `prefetch` task from `start_planning_prefetch` feeds the planning stage.
         """
         config = swarm_config or {"agents": {"auditor": True, "optimizer": True, "critic": True}}
         logger.info(f"ADAPTER: Starting stream for {user_id} -> {objective[:30]} with Config: {config}")
         
-        # Initial simulation phases for UI feedback
-        phases = [
-            ("PLANNING", "Swarm calibrating for objective..."),
-            ("DESIGN", "Architecting structural implementation..."),
-            ("IMPLEMENT", "Implementer agent generating code base...")
-        ]
-        
-        if config.get("agents", {}).get("critic"):
-            phases.append(("CRITIQUE", "Refining tactical approach via critic agent..."))
-        if config.get("agents", {}).get("auditor"):
-            phases.append(("AUDIT", "Auditor agent verifying security and logic..."))
-
-        for status, msg in phases:
-            yield f"data: {json.dumps({'status': status, 'message': msg})}\n\n"
-            await asyncio.sleep(1.2)
+        # Assigned up front so stage checkpoints are keyed by it and a failed run can be resumed.
+        # The ID becomes a sandbox path below, so a resumed one must be a well-formed server ID.
+        if mission_id is not None and not is_valid_mission_id(mission_id):
+            raise ValueError(f"Invalid mission ID {mission_id!r}.")
+        mission_id = mission_id or new_mission_id()
 
-        # Execute swarm logic with a keep-alive wrapper
+        # Stage transitions and token deltas are pushed here by the orchestrator as they happen
+        events: asyncio.Queue = asyncio.Queue()
         swarm_task = asyncio.create_task(
             self.cognition.swarm.execute_swarm_objective(
                 objective=objective,
-                config=config
+                config=config,
+                mission_id=mission_id,
+                event_sink=events.put,
+                prefetch=prefetch,
+                user_id=user_id
             )
         )
-        
-        while not swarm_task.done():
-            # Yield Keep-Alive ping to prevent 30s timeouts on Render/Vercel
-            yield f"data: {json.dumps({'status': 'PROCESSING', 'message': 'Swarm thinking...'})}\n\n"
-            try:
-                # Wait for task or timeout for the next ping
-                await asyncio.wait_for(asyncio.shield(swarm_task), timeout=5.0)
-            except asyncio.TimeoutError:
-                continue
-            except Exception:
-                # Task raised an exception, done() will be true, we handle it below
-                break
+
+        getter = None
+        try:
+            while True:
+                getter = getter or asyncio.ensure_future(events.get())
+                done, _ = await asyncio.wait({getter, swarm_task}, timeout=KEEPALIVE_INTERVAL, return_when=asyncio.FIRST_COMPLETED)
+
+                if getter in done:
+                    batch = [getter.result()]
+                    getter = None
+                    while not events.empty():
+                        batch.append(events.get_nowait())
+                    for event in self._coalesce_deltas(batch):
+                        yield f"data: {json.dumps(event)}\n\n"
+                    continue
+
+                if swarm_task.done():
+                    getter.cancel()
+                    remaining = []
+                    while not events.empty():
+                        remaining.append(events.get_nowait())
+                    for event in self._coalesce_deltas(remaining):
+                        yield f"data: {json.dumps(event)}\n\n"
+                    break
+
+                # Nothing arrived within the window: Keep-Alive ping to prevent 30s timeouts on Render/Vercel
+                yield f"data: {json.dumps({'status': 'PROCESSING', 'message': 'Swarm thinking...'})}\n\n"
+        finally:
+            if getter is not None and not getter.done():
+                getter.cancel()
 
         try:
             swarm_result = await swarm_task
+        except MissionCancelled as e:
+            refund = settle_prepaid_cost(prepaid_cost, e.token_usage)
+            if refund and ledger is not None:
+                await ledger.process_transaction(user_id=user_id, amount=refund, tx_type="REFUND", reason=f"Cancelled mission {mission_id}: unused budget")
+            logger.warning(f"ADAPTER: Mission {mission_id} cancelled ({e.reason}); refunded {refund} of {prepaid_cost}.")
+            yield f"data: {json.dumps({'status': 'CANCELLED', 'message': e.reason, 'mission_id': mission_id, 'tokens_used': e.token_usage.get('used', 0), 'refund': refund})}\n\n"
+            return
         except Exception as e:
             msg = str(e)
             if "MISSION_FAILED" in msg:
                 # User-friendly billing error
                 clean_msg = msg.replace("MISSION_FAILED: ", "")
-                yield f"data: {json.dumps({'status': 'ERROR', 'message': f'Engine Notice: {clean_msg}'})}\n\n"
+                yield f"data: {json.dumps({'status': 'ERROR', 'message': f'Engine Notice: {clean_msg}', 'mission_id': mission_id})}\n\n"
             else:
                 logger.error(f"ADAPTER: Swarm Execution Failed: {e}")
-                yield f"data: {json.dumps({'status': 'ERROR', 'message': f'Swarm critical failure: {msg}'})}\n\n"
+                yield f"data: {json.dumps({'status': 'ERROR', 'message': f'Swarm critical failure: {msg}', 'mission_id': mission_id})}\n\n"
             return
             
         # Extract structured data with fallback safety
@@ -98,14 +139,14 @@ class CoreAdapter:
         is_multifile = swarm_result.get("is_multifile", False)
         
         # PERSISTENCE LAYER: Save the generated codebase to the mission sandbox
-        mission_id = str(uuid.uuid4())[:8]
-        
         # 1. Database Persistence (Primary for Production)
         file_ext = "html" if "<html" in content.lower() else "txt"
         filename = f"mission_result.{file_ext}"
         
         try:
             with SessionLocal() as db:
+                if db.query(SwarmMission).filter(SwarmMission.id == mission_id).first() is not None:
+                    raise ValueError(f"Mission {mission_id} already has a stored result.")
                 mission = SwarmMission(
                     id=mission_id,
                     user_id=user_id,
@@ -158,6 +199,25 @@ class CoreAdapter:
         }
         yield f"data: {json.dumps(completion_data)}\n\n"
 
+    @staticmethod
+    def _coalesce_deltas(events: list) -> list:
+        """
+        Merges consecutive DELTA events for the same stage so bursts of tokens go out as one SSE frame.
+        """
+        merged: list = []
+        for event in events:
+            prev = merged[-1] if merged else None
+            if (
+                prev is not None
+                and event.get("status") == "DELTA"
+                and prev.get("status") == "DELTA"
+                and prev.get("stage") == event.get("stage")
+            ):
+                prev["delta"] += event.get("delta", "")
+            else:
+                merged.append(dict(event))
+        return merged
+
     async def execute_direct(self, objective: str) -> str:
         """
         Standard non-streaming execution.
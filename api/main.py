@@ -1,8 +1,8 @@
 from fastapi import FastAPI, Header, HTTPException, Depends, Request
-from fastapi.responses import StreamingResponse
+from fastapi.responses import StreamingResponse, PlainTextResponse
 from fastapi.middleware.cors import CORSMiddleware
 from pydantic import BaseModel
-from typing import List
+from typing import List, Optional
 import uuid
 import json
 import asyncio
@@ -31,6 +31,11 @@ from core.abuse_detector import AbuseDetector
 from core.billing_ledger import BillingLedger
 from core.rate_limiter import rate_limiter
 from core.circuit_breaker import circuit_registry
+from core.llm_client_registry import llm_client_registry
+from core.trace_writer import trace_writer
+from core.mission_checkpoint import mission_checkpoints, is_valid_mission_id
+from core.adaptive_limiter import limiter_registry
+from metrics.llm_metrics import llm_metrics
 
 from utils.logger import logger
 
@@ -85,10 +90,12 @@ class SwarmConfig(BaseModel):
     agents: dict = {"auditor": True, "optimizer": True, "critic": True}
     creativity: float = 0.5
     strictness: float = 0.8
+    stage_cache: bool = True  # Set false to skip the semantic planner/architect cache for this mission
 
 class ExecutionRequest(BaseModel):
     objective: str
     config: SwarmConfig = SwarmConfig()
+    mission_id: Optional[str] = None  # Resume one of your failed missions from its last checkpointed stage; new missions get a server ID
 
 @app.get("/")
 async def root():
@@ -117,8 +124,16 @@ async def readiness_check():
             "abuse_detector": abuse_detector is not None,
         },
         "circuits": circuit_registry.get_all_diagnostics(),
+        "llm_clients": llm_client_registry.get_diagnostics(),
+        "llm_limiters": limiter_registry.get_all_diagnostics(),
+        "trace_writer": trace_writer.get_stats(),
     }
 
+@app.get("/metrics", response_class=PlainTextResponse)
+async def prometheus_metrics():
+    """Prometheus scrape target: per-call LLM latency, TTFT and token histograms."""
+    return PlainTextResponse(llm_metrics.render_prometheus(), media_type="text/plain; version=0.0.4")
+
 @app.get("/v1/system/info")
 async def get_system_info():
     """Returns engine transparency metadata."""
@@ -191,23 +206,37 @@ async def execute_swarm_stream(
     if not swarm_circuit.allow_request():
         raise HTTPException(status_code=503, detail="Swarm execution circuit is OPEN. System is recovering from errors.")
 
-    # 1. Anti-Abuse Check
-    if not abuse_detector.check_for_abuse(x_clerk_user_id, 0.0): # 0.0 as we compute cost next
-        raise HTTPException(status_code=429, detail="Resource burst limit exceeded.")
+    # 0.8 Resume Authorization: only the owner of a checkpointed mission may resume it
+    if request.mission_id is not None:
+        if not is_valid_mission_id(request.mission_id):
+            raise HTTPException(status_code=400, detail="Malformed mission_id.")
+        if await mission_checkpoints.get_owner(request.mission_id) != x_clerk_user_id:
+            raise HTTPException(status_code=404, detail="No resumable mission with this ID.")
 
-    # 2. Dynamic Pricing
-    cost = pricing_engine.calculate_cost(request.objective, "DEFAULT")
-    
-    # 3. Signed Transaction Pre-Check (Debit)
-    success = await ledger_service.process_transaction(
-        user_id=x_clerk_user_id,
-        amount=-cost,
-        tx_type="DEBIT",
-        reason=f"Mission Execution: {request.objective[:30]}..."
-    )
-    
-    if not success:
-        raise HTTPException(status_code=402, detail="Insufficient credits in signed ledger.")
+    # 0.9 Speculative planning inputs (knowledge retrieval, plan-cache lookup) overlap the billing
+    # checks below and are discarded if the mission is not admitted
+    prefetch = adapter.start_planning_prefetch(request.objective, x_clerk_user_id, request.config.dict())
+    try:
+        # 1. Anti-Abuse Check
+        if not abuse_detector.check_for_abuse(x_clerk_user_id, 0.0): # 0.0 as we compute cost next
+            raise HTTPException(status_code=429, detail="Resource burst limit exceeded.")
+
+        # 2. Dynamic Pricing
+        cost = pricing_engine.calculate_cost(request.objective, "DEFAULT")
+
+        # 3. Signed Transaction Pre-Check (Debit)
+        success = await ledger_service.process_transaction(
+            user_id=x_clerk_user_id,
+            amount=-cost,
+            tx_type="DEBIT",
+            reason=f"Mission Execution: {request.objective[:30]}..."
+        )
+
+        if not success:
+            raise HTTPException(status_code=402, detail="Insufficient credits in signed ledger.")
+    except BaseException:
+        prefetch.cancel()
+        raise
 
     log_audit_trail(x_clerk_user_id, "SWARM_STREAM_EXEC", {"objective": request.objective, "cost": cost, "config": request.config.dict()})
     
@@ -216,7 +245,11 @@ async def execute_swarm_stream(
         adapter.run_swarm_stream(
             objective=request.objective, 
             user_id=x_clerk_user_id,
-            swarm_config=request.config.dict()
+            swarm_config=request.config.dict(),
+            mission_id=request.mission_id,
+            prepaid_cost=cost,
+            ledger=ledger_service,
+            prefetch=prefetch
         ), 
         media_type="text/event-stream"
     )
@@ -287,7 +320,7 @@ async def startup_lifecycle():
         try:
             logger.info("STARTUP: Warming intelligence core in background...")
             adapter = CoreAdapter() # CognitionCore init inside
-            reasoning = ReasoningEngine()
+            reasoning = adapter.cognition.reasoning  # Reuse the core's engine and its pooled client
             coordinator = GlobalCoordinator(reasoning)
             ledger_service = TokenLedgerService()
             pricing_engine = AdaptivePricingEngine(coordinator)
@@ -300,3 +333,11 @@ async def startup_lifecycle():
     asyncio.create_task(warm_engines())
     logger.info(f"Astraeus v5.3.0 listening on {os.getenv('PORT', '10000')}. Core warming initiated.")
 
+@app.on_event("shutdown")
+async def shutdown_lifecycle():
+    """
+    Flushes queued trace rows and releases pooled provider connections on worker shutdown.
+    """
+    await trace_writer.drain()
+    await llm_client_registry.aclose()
+    logger.info("SHUTDOWN: LLM client pools closed.")
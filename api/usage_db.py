@@ -185,6 +185,23 @@ class MissionTraceStep(Base):
     code_snapshot = Column(String) # JSON blob of the code state at this step
     timestamp = Column(DateTime, default=datetime.datetime.utcnow)
 
+class MissionCheckpoint(Base):
+    """
+    Durable output of a completed swarm stage, used to resume a mission after a failure or restart.
+    """
+    __tablename__ = "mission_checkpoints"
+    
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    mission_id = Column(String, index=True)
+    user_id = Column(String, index=True, nullable=True) # Owner; only they may resume the mission
+    stage = Column(String) # 'planning', 'architecture', 'implementation', 'review'
+    fingerprint = Column(String) # Hash of objective + swarm config; stale checkpoints are ignored
+    objective = Column(String)
+    config_json = Column(String)
+    output = Column(String)
+    next_step_index = Column(Integer) # Chronos step index to continue from
+    created_at = Column(DateTime, default=datetime.datetime.utcnow, index=True)
+
 class ResearchArtifact(Base):
     """
     Formal scientific records generated from platform telemetry and evolution cycles.
@@ -234,7 +234,7 @@ export default function ArenaPage() {
                                 </div>
                             </div>
                         ) : forgeData && (
-                            <ForgePortal objective={task} branches={forgeData.branches} onSelect={(label) => console.log("Selected branch", label)} />
+                            <ForgePortal objective={task} branches={forgeData.branches} winner={forgeData.winner} onSelect={(label) => console.log("Selected branch", label)} />
                         )}
                     </motion.div>
                 ) : (
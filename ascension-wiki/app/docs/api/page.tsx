@@ -40,6 +40,7 @@ const SECTIONS: { label: string; icon: React.ReactNode; endpoints: Endpoint[] }[
 }`,
                 responseBody: `{"status": "THINKING", "message": "Analyzing objective..."}
 {"status": "PLANNING", "message": "Decomposing into sub-tasks..."}
+{"status": "DELTA", "stage": "PLANNING", "delta": "1. Define token schema..."}
 {"status": "IMPLEMENT", "message": "Generating auth module..."}
 {"status": "RESULT", "message": "<code>", "file_map": {...}}
 {"status": "COMPLETED", "message": "Mission complete."}`,
@@ -1,32 +1,30 @@
 "use client";
 
 import { motion, AnimatePresence } from "framer-motion";
-import { Zap, Shield, Code, Activity, Trophy, ArrowRight, Gauge, Layers } from "lucide-react";
+import { Zap, Code, Activity, Trophy, ArrowRight, Gauge, Layers, ShieldCheck } from "lucide-react";
 import { useState } from "react";
 import { cn } from "@/lib/utils";
 
 interface BranchMetrics {
-    latency_ms: number;
-    complexity_score: number;
-    security_rating: string;
+    latency_ms?: number | null;
+    latency_ci95_ms?: [number, number] | null;
+    tests_passed?: boolean;
+    rank?: number | null;
+    cyclomatic_complexity?: number | null;
+    pruned_at?: string;
     tokens_used: number;
 }
 
 interface ForgePortalProps {
     objective: string;
     branches: Record<string, BranchMetrics>;
+    winner?: string | null;
     onSelect: (label: string) => void;
 }
 
-export function ForgePortal({ objective, branches, onSelect }: ForgePortalProps) {
+export function ForgePortal({ objective, branches, winner, onSelect }: ForgePortalProps) {
     const [hovered, setHovered] = useState<string | null>(null);
 
-    // Find the "Winner" (Mock logic: best complexity vs latency)
-    const winner = Object.keys(branches).reduce((a, b) =>
-        (branches[a].complexity_score + (100 / branches[a].latency_ms)) >
-            (branches[b].complexity_score + (100 / branches[b].latency_ms)) ? a : b
-    );
-
     return (
         <div className="flex flex-col gap-8 w-full">
             {/* Header: Performance Duel */}
@@ -96,20 +94,19 @@ export function ForgePortal({ objective, branches, onSelect }: ForgePortalProps)
                             <MetricRow
                                 icon={<Gauge size={12} />}
                                 label="Latency"
-                                value={`${metrics.latency_ms}ms`}
-                                highlight={metrics.latency_ms < 15}
+                                value={metrics.latency_ms != null ? `${metrics.latency_ms.toFixed(2)}ms` : (metrics.pruned_at ? `Pruned (${metrics.pruned_at})` : "n/a")}
+                                highlight={metrics.rank === 1}
                             />
                             <MetricRow
-                                icon={<Activity size={12} />}
-                                label="Complexity"
-                                value={metrics.complexity_score.toFixed(2)}
-                                highlight={metrics.complexity_score < 0.7}
+                                icon={<ShieldCheck size={12} />}
+                                label="Tests"
+                                value={metrics.pruned_at ? "-" : (metrics.tests_passed ? "Passed" : "Failed")}
+                                highlight={!!metrics.tests_passed}
                             />
                             <MetricRow
-                                icon={<Shield size={12} />}
-                                label="Security"
-                                value={metrics.security_rating}
-                                highlight
+                                icon={<Activity size={12} />}
+                                label="Complexity"
+                                value={metrics.cyclomatic_complexity != null ? metrics.cyclomatic_complexity.toFixed(2) : "n/a"}
                             />
                             <MetricRow
                                 icon={<Code size={12} />}
@@ -0,0 +1,139 @@
+"""
+Adaptive (AIMD) concurrency control for outbound LLM calls.
+Grows the number of in-flight provider requests additively while calls succeed and
+cuts it multiplicatively on rate-limit or timeout signals. Excess requests queue
+with a deadline instead of failing outright.
+"""
+import asyncio
+import time
+from typing import Dict, Optional
+
+from utils.logger import logger
+
+
+class AdaptiveConcurrencyLimiter:
+    """
+    Per-provider AIMD limiter.
+
+    The limit grows by `increase_step / limit` per success (roughly +increase_step per
+    full window of successful calls) and is multiplied by `decrease_factor` on overload,
+    at most once per `decrease_cooldown` so a burst of simultaneous 429s counts once.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        initial_limit: int = 8,
+        min_limit: int = 1,
+        max_limit: int = 64,
+        increase_step: float = 1.0,
+        decrease_factor: float = 0.5,
+        decrease_cooldown: float = 1.0,
+    ):
+        self.name = name
+        self.min_limit = min_limit
+        self.max_limit = max_limit
+        self.increase_step = increase_step
+        self.decrease_factor = decrease_factor
+        self.decrease_cooldown = decrease_cooldown
+
+        self._limit = float(max(min_limit, min(initial_limit, max_limit)))
+        self._in_flight = 0
+        self._queued = 0
+        self._last_decrease = 0.0
+        self._condition: Optional[asyncio.Condition] = None
+
+        self.successes = 0
+        self.overloads = 0
+        self.queue_timeouts = 0
+
+    @property
+    def limit(self) -> int:
+        return max(self.min_limit, int(self._limit))
+
+    @property
+    def in_flight(self) -> int:
+        return self._in_flight
+
+    def _get_condition(self) -> asyncio.Condition:
+        if self._condition is None:
+            self._condition = asyncio.Condition()
+        return self._condition
+
+    async def acquire(self, timeout: Optional[float] = None) -> None:
+        """
+        Waits for an in-flight slot. Raises asyncio.TimeoutError if none frees up within `timeout` seconds.
+        """
+        condition = self._get_condition()
+        async with condition:
+            if self._in_flight < self.limit:
+                self._in_flight += 1
+                return
+
+            self._queued += 1
+            try:
+                await asyncio.wait_for(
+                    condition.wait_for(lambda: self._in_flight < self.limit),
+                    timeout=timeout if timeout is None else max(0.0, timeout),
+                )
+            except asyncio.TimeoutError:
+                self.queue_timeouts += 1
+                raise
+            finally:
+                self._queued -= 1
+            self._in_flight += 1
+
+    async def release(self, overloaded: bool = False, succeeded: bool = True) -> None:
+        """
+        Frees a slot and feeds the outcome into the AIMD controller.
+        Non-overload failures (bad requests, schema errors) leave the limit untouched.
+        """
+        condition = self._get_condition()
+        async with condition:
+            self._in_flight = max(0, self._in_flight - 1)
+
+            if overloaded:
+                self.overloads += 1
+                now = time.monotonic()
+                if now - self._last_decrease >= self.decrease_cooldown:
+                    previous = self.limit
+                    self._limit = max(float(self.min_limit), self._limit * self.decrease_factor)
+                    self._last_decrease = now
+                    logger.warning(f"LLM_LIMITER: [{self.name}] Overload signal. Concurrency {previous} -> {self.limit}")
+            elif succeeded:
+                self.successes += 1
+                self._limit = min(float(self.max_limit), self._limit + self.increase_step / max(self._limit, 1.0))
+
+            condition.notify_all()
+
+    def get_diagnostics(self) -> Dict:
+        return {
+            "provider": self.name,
+            "limit": self.limit,
+            "in_flight": self._in_flight,
+            "queued": self._queued,
+            "successes": self.successes,
+            "overloads": self.overloads,
+            "queue_timeouts": self.queue_timeouts,
+        }
+
+
+class LimiterRegistry:
+    """
+    Global registry of per-provider adaptive limiters.
+    """
+
+    def __init__(self):
+        self._limiters: Dict[str, AdaptiveConcurrencyLimiter] = {}
+
+    def get_or_create(self, provider: str, **kwargs) -> AdaptiveConcurrencyLimiter:
+        if provider not in self._limiters:
+            self._limiters[provider] = AdaptiveConcurrencyLimiter(name=provider, **kwargs)
+        return self._limiters[provider]
+
+    def get_all_diagnostics(self) -> list:
+        return [limiter.get_diagnostics() for limiter in self._limiters.values()]
+
+
+# Singleton registry
+limiter_registry = LimiterRegistry()
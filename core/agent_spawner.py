@@ -54,7 +54,8 @@ class AgentSpawner:
                 response = await self.reasoning.generate_response(
                     system_prompt="You are the Meta-Orchestrator. You design specialized AI personas to solve architectural gaps.",
                     user_prompt=prompt,
-                    temperature=self.config.generation_temperature
+                    temperature=self.config.generation_temperature,
+                    call_site="spawner.biosynthesize_specialist"
                 )
                 
                 # Extract JSON
@@ -0,0 +1,287 @@
+"""
+Offline batch inference for non-interactive LLM workloads.
+Accumulates chat requests into JSONL batches, submits them to a batch provider,
+polls for completion and resolves each awaiting caller's future with its result.
+"""
+import asyncio
+import json
+import time
+import uuid
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from pydantic import BaseModel
+
+from core_config import config
+from utils.logger import logger
+
+
+class BatchProvider:
+    """
+    Interface for a provider-side batch API.
+    """
+
+    async def submit(self, jsonl: bytes) -> str:
+        """Uploads a JSONL batch and returns the provider's batch id."""
+        raise NotImplementedError
+
+    async def poll(self, batch_id: str) -> str:
+        """Returns the batch status: 'in_progress', 'completed', 'failed', 'expired' or 'cancelled'."""
+        raise NotImplementedError
+
+    async def fetch_results(self, batch_id: str) -> List[Dict[str, Any]]:
+        """Returns one result record per request: {'custom_id', 'response': {'body'}, 'error'}."""
+        raise NotImplementedError
+
+
+class OpenAIBatchProvider(BatchProvider):
+    """
+    OpenAI Batch API (/v1/batches) backed by the Files endpoint.
+    """
+
+    def __init__(self, client: Any, completion_window: str = "24h"):
+        self.client = client
+        self.completion_window = completion_window
+
+    async def submit(self, jsonl: bytes) -> str:
+        upload = await self.client.files.create(file=("ascension_batch.jsonl", jsonl), purpose="batch")
+        batch = await self.client.batches.create(
+            input_file_id=upload.id,
+            endpoint="/v1/chat/completions",
+            completion_window=self.completion_window,
+        )
+        return batch.id
+
+    async def poll(self, batch_id: str) -> str:
+        batch = await self.client.batches.retrieve(batch_id)
+        if batch.status in ("validating", "in_progress", "finalizing", "cancelling"):
+            return "in_progress"
+        return batch.status
+
+    async def fetch_results(self, batch_id: str) -> List[Dict[str, Any]]:
+        batch = await self.client.batches.retrieve(batch_id)
+        records: List[Dict[str, Any]] = []
+        for file_id in (batch.output_file_id, batch.error_file_id):
+            if not file_id:
+                continue
+            content = await self.client.files.content(file_id)
+            for line in content.text.splitlines():
+                if line.strip():
+                    records.append(json.loads(line))
+        return records
+
+
+class LocalBatchProvider(BatchProvider):
+    """
+    In-process fake provider for tests and offline development.
+    `responder(body) -> str` produces the completion text for each request body.
+    """
+
+    def __init__(self, responder: Optional[Callable[[Dict[str, Any]], str]] = None, latency: float = 0.0):
+        self.responder = responder or (lambda body: "Simulated batch response.")
+        self.latency = latency
+        self._batches: Dict[str, Tuple[float, List[Dict[str, Any]]]] = {}
+
+    async def submit(self, jsonl: bytes) -> str:
+        batch_id = f"local_batch_{uuid.uuid4().hex[:12]}"
+        lines = [json.loads(line) for line in jsonl.decode("utf-8").splitlines() if line.strip()]
+        self._batches[batch_id] = (time.monotonic() + self.latency, lines)
+        return batch_id
+
+    async def poll(self, batch_id: str) -> str:
+        ready_at, _ = self._batches[batch_id]
+        return "completed" if time.monotonic() >= ready_at else "in_progress"
+
+    async def fetch_results(self, batch_id: str) -> List[Dict[str, Any]]:
+        _, lines = self._batches.pop(batch_id)
+        records = []
+        for line in lines:
+            try:
+                content = self.responder(line["body"])
+            except Exception as e:
+                records.append({"custom_id": line["custom_id"], "response": None, "error": {"message": str(e)}})
+                continue
+            tokens = len(json.dumps(line["body"])) // 4 + len(content) // 4
+            records.append({
+                "custom_id": line["custom_id"],
+                "response": {
+                    "status_code": 200,
+                    "body": {
+                        "choices": [{"message": {"role": "assistant", "content": content}}],
+                        "usage": {"total_tokens": tokens},
+                    },
+                },
+                "error": None,
+            })
+        return records
+
+
+def build_chat_body(
+    messages: List[Dict[str, str]],
+    model: str,
+    temperature: float,
+    response_model: Optional[type[BaseModel]] = None
+) -> Dict[str, Any]:
+    """Builds a /v1/chat/completions request body, with a JSON schema response format for structured calls."""
+    body: Dict[str, Any] = {"model": model, "messages": messages, "temperature": temperature}
+    if response_model is not None:
+        body["response_format"] = {
+            "type": "json_schema",
+            "json_schema": {"name": response_model.__name__, "schema": response_model.model_json_schema()},
+        }
+    return body
+
+
+class BatchInferenceQueue:
+    """
+    Collects requests until `max_batch_size` is reached or `max_wait` seconds pass,
+    then ships them as one batch. Each batch is polled by its own background task.
+    """
+
+    def __init__(
+        self,
+        provider: BatchProvider,
+        max_batch_size: int = 100,
+        max_wait: float = 30.0,
+        poll_interval: float = 30.0,
+        batch_timeout: float = 86400.0,
+    ):
+        self.provider = provider
+        self.max_batch_size = max_batch_size
+        self.max_wait = max_wait
+        self.poll_interval = poll_interval
+        self.batch_timeout = batch_timeout
+
+        self._pending: List[Tuple[str, Dict[str, Any], Optional[type[BaseModel]], asyncio.Future]] = []
+        self._timer: Optional[asyncio.TimerHandle] = None
+        self._running: set = set()
+
+        self.batches_submitted = 0
+        self.requests_submitted = 0
+
+    async def submit(self, body: Dict[str, Any], response_model: Optional[type[BaseModel]] = None) -> Tuple[Any, int]:
+        """
+        Enqueues a chat request body and waits for its batch to complete.
+
+        Returns:
+            Tuple[Any, int]: The parsed result (text or Pydantic instance) and total tokens used.
+        """
+        loop = asyncio.get_running_loop()
+        future: asyncio.Future = loop.create_future()
+        self._pending.append((uuid.uuid4().hex, body, response_model, future))
+
+        if len(self._pending) >= self.max_batch_size:
+            self._flush_pending()
+        elif self._timer is None:
+            self._timer = loop.call_later(self.max_wait, self._flush_pending)
+
+        return await future
+
+    async def flush(self) -> None:
+        """Ships whatever is pending immediately and waits for every running batch to settle."""
+        self._flush_pending()
+        if self._running:
+            await asyncio.gather(*self._running, return_exceptions=True)
+
+    def _flush_pending(self) -> None:
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+
+        items = [item for item in self._pending if not item[3].done()]
+        self._pending = []
+        if not items:
+            return
+
+        task = asyncio.ensure_future(self._run_batch(items))
+        self._running.add(task)
+        task.add_done_callback(self._running.discard)
+
+    async def _run_batch(self, items: List[Tuple[str, Dict[str, Any], Optional[type[BaseModel]], asyncio.Future]]) -> None:
+        by_id = {custom_id: (response_model, future) for custom_id, _, response_model, future in items}
+        try:
+            jsonl = "\n".join(
+                json.dumps({"custom_id": custom_id, "method": "POST", "url": "/v1/chat/completions", "body": body})
+                for custom_id, body, _, _ in items
+            ).encode("utf-8")
+            batch_id = await self.provider.submit(jsonl)
+            self.batches_submitted += 1
+            self.requests_submitted += len(items)
+            logger.info(f"BATCH: Submitted {batch_id} with {len(items)} requests.")
+
+            deadline = time.monotonic() + self.batch_timeout
+            while True:
+                status = await self.provider.poll(batch_id)
+                if status == "completed":
+                    break
+                if status in ("failed", "expired", "cancelled"):
+                    raise RuntimeError(f"Batch {batch_id} ended with status '{status}'")
+                if time.monotonic() >= deadline:
+                    raise RuntimeError(f"Batch {batch_id} did not complete within {self.batch_timeout:.0f}s")
+                await asyncio.sleep(self.poll_interval)
+
+            for record in await self.provider.fetch_results(batch_id):
+                entry = by_id.pop(record.get("custom_id"), None)
+                if entry is None:
+                    continue
+                response_model, future = entry
+                if future.done():
+                    continue
+                try:
+                    future.set_result(self._parse_record(record, response_model))
+                except Exception as e:
+                    future.set_exception(e)
+
+            if by_id:
+                raise RuntimeError(f"Batch {batch_id} returned no result for {len(by_id)} requests")
+            logger.info(f"BATCH: {batch_id} resolved.")
+        except Exception as e:
+            logger.error(f"BATCH: Batch execution failed: {e}")
+            for _, future in by_id.values():
+                if not future.done():
+                    future.set_exception(e)
+
+    @staticmethod
+    def _parse_record(record: Dict[str, Any], response_model: Optional[type[BaseModel]]) -> Tuple[Any, int]:
+        if record.get("error"):
+            raise RuntimeError(f"Batch request failed: {record['error'].get('message', record['error'])}")
+        response = record.get("response") or {}
+        if response.get("status_code", 200) != 200:
+            raise RuntimeError(f"Batch request failed with HTTP {response.get('status_code')}")
+
+        body = response["body"]
+        content = body["choices"][0]["message"]["content"]
+        usage = (body.get("usage") or {}).get("total_tokens", 0)
+        if response_model is None:
+            return content, usage
+        return response_model.model_validate_json(content), usage
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            "pending": len(self._pending),
+            "running_batches": len(self._running),
+            "batches_submitted": self.batches_submitted,
+            "requests_submitted": self.requests_submitted,
+        }
+
+
+_batch_queue: Optional[BatchInferenceQueue] = None
+
+
+def get_batch_queue() -> BatchInferenceQueue:
+    """
+    Returns the process-wide batch queue, building its provider from config on first use.
+    """
+    global _batch_queue
+    if _batch_queue is None:
+        if config.BATCH_PROVIDER == "local":
+            provider: BatchProvider = LocalBatchProvider()
+        else:
+            from core.llm_client_registry import llm_client_registry
+            provider = OpenAIBatchProvider(llm_client_registry.get_client("openai", config.OPENAI_API_KEY))
+        _batch_queue = BatchInferenceQueue(
+            provider,
+            max_batch_size=config.BATCH_MAX_SIZE,
+            max_wait=config.BATCH_MAX_WAIT_SECONDS,
+            poll_interval=config.BATCH_POLL_INTERVAL,
+        )
+    return _batch_queue
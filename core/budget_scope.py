@@ -0,0 +1,86 @@
+"""
+Context-local token budget scopes.
+Missions and agent delegations each open a scope carried in a ContextVar, so concurrent
+branches (forge swarms, consensus fan-out) keep independent counters while every charge
+still rolls up into its enclosing mission total.
+"""
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Dict, Iterator, List, Optional
+
+from utils.logger import logger
+
+
+class BudgetScope:
+    """
+    A node in the budget tree. Charges propagate to every ancestor; a request is allowed
+    only if no scope on the path to the root would exceed its limit.
+    """
+
+    def __init__(self, name: str, limit: Optional[int] = None, parent: Optional["BudgetScope"] = None):
+        self.name = name
+        self.limit = limit
+        self.parent = parent
+        self.used = 0
+        self.children: List["BudgetScope"] = []
+        if parent is not None:
+            parent.children.append(self)
+
+    def charge(self, tokens: int) -> None:
+        scope: Optional[BudgetScope] = self
+        while scope is not None:
+            scope.used += tokens
+            scope = scope.parent
+
+    def exhausted_by(self, estimated_tokens: int = 0) -> Optional["BudgetScope"]:
+        """Returns the innermost scope whose limit the next request would exceed, if any."""
+        scope: Optional[BudgetScope] = self
+        while scope is not None:
+            if scope.limit is not None and scope.used + estimated_tokens > scope.limit:
+                return scope
+            scope = scope.parent
+        return None
+
+    def usage_ratio(self) -> float:
+        """Fraction consumed of the tightest limited scope on the path to the root."""
+        ratio = 0.0
+        scope: Optional[BudgetScope] = self
+        while scope is not None:
+            if scope.limit:
+                ratio = max(ratio, scope.used / scope.limit)
+            scope = scope.parent
+        return ratio
+
+    def get_report(self) -> Dict[str, Any]:
+        """Usage tree; repeated delegations to the same agent are summed under one entry."""
+        children: Dict[str, Dict[str, Any]] = {}
+        for child in self.children:
+            report = child.get_report()
+            if child.name in children:
+                children[child.name]["used"] += report["used"]
+                children[child.name]["calls"] += 1
+            else:
+                children[child.name] = {**report, "calls": 1}
+        return {"name": self.name, "limit": self.limit, "used": self.used, "children": list(children.values())}
+
+
+_current_scope: ContextVar[Optional[BudgetScope]] = ContextVar("budget_scope", default=None)
+
+
+def current_budget_scope() -> Optional[BudgetScope]:
+    return _current_scope.get()
+
+
+@contextmanager
+def budget_scope(name: str, limit: Optional[int] = None) -> Iterator[BudgetScope]:
+    """
+    Opens a child of the current scope for the duration of the block.
+    Tasks spawned inside the block inherit it as their parent.
+    """
+    scope = BudgetScope(name, limit, parent=_current_scope.get())
+    token = _current_scope.set(scope)
+    try:
+        yield scope
+    finally:
+        _current_scope.reset(token)
+        logger.debug(f"BUDGET: Scope {name} closed at {scope.used}/{limit or 'unbounded'} tokens.")
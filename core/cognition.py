@@ -2,14 +2,21 @@
 Core cognitive hub for Project Ascension.
 Provides the central loop integrating planning, reasoning, memory, and decision making.
 """
-from typing import Optional, Any
+from typing import Optional, Any, Dict
+import asyncio
+import uuid
 from core_config import config
 from utils.logger import logger
 
 from core.reasoning_engine import ReasoningEngine
 from core.goal_planner import GoalPlanner, Plan, TaskDefinition
-from core.decision_engine import DecisionEngine, NextAction
+from core.decision_engine import DecisionEngine, NextAction, ToolCallDecision
+from learning.performance_analyzer import PerformanceAnalyzer
 from core.refinement_loop import RefinementLoop
+from core.context_compactor import ContextCompactor, WorkingMemory, clip_output
+from core.task_dag import DAGExecutor, TaskOutcome
+from core.budget_scope import budget_scope
+from core.mission_registry import mission_registry, check_cancelled, acknowledge_cancellation, MissionCancelled
 from tools.tool_registry import ToolRegistry
 from tools.tool_executor import ToolExecutor
 from tools.file_system_tool import FileSystemTool
@@ -49,8 +56,10 @@ class CognitionCore:
         
         # Legacy components
         self.planner = GoalPlanner(engine=self.reasoning)
-        self.decision = DecisionEngine(engine=self.reasoning)
+        self.performance = PerformanceAnalyzer()
+        self.decision = DecisionEngine(engine=self.reasoning, heuristics=self.performance)
         self.refiner = RefinementLoop(engine=self.reasoning, token_controller=self.reasoning.tokens)
+        self.compactor = ContextCompactor(engine=self.reasoning)
         
         self.tool_registry = ToolRegistry()
         self.tool_registry.register(FileSystemTool())
@@ -59,13 +68,33 @@ class CognitionCore:
         self.tool_executor = ToolExecutor(registry=self.tool_registry)
         logger.info("CognitionCore initialized with Swarm and Evolution tiers.")
 
-    async def execute_goal(self, goal: str) -> None:
+    async def execute_goal(self, goal: str, goal_id: Optional[str] = None) -> Dict[str, TaskOutcome]:
         """
-        The main processing loop. Breaks a goal into tasks, then loops through them.
+        The main processing loop. Breaks a goal into a DAG of tasks, then runs each task
+        as soon as its dependencies complete.
         
         Args:
             goal (str): The primary objective to accomplish.
+            goal_id (Optional[str]): Mission registry id, used to cancel the goal while it runs.
+
+        Returns:
+            Dict[str, TaskOutcome]: Outcome of every planned task, keyed by task id.
+
+        Raises:
+            MissionCancelled: If the goal was cancelled through the mission registry.
         """
+        goal_id = goal_id or f"goal-{uuid.uuid4().hex[:8]}"
+        with mission_registry.track(goal_id) as cancel_token, budget_scope("goal", limit=config.GLOBAL_TOKEN_BUDGET) as goal_budget:
+            try:
+                return await self._run_goal(goal)
+            except asyncio.CancelledError:
+                if not cancel_token.cancelled:
+                    raise
+                acknowledge_cancellation()
+                logger.warning(f"Goal {goal_id} cancelled after {goal_budget.used} tokens.")
+                raise MissionCancelled(goal_id, cancel_token.cancel_reason, goal_budget.get_report()) from None
+
+    async def _run_goal(self, goal: str) -> Dict[str, TaskOutcome]:
         logger.info(f"Spawning cognitive lifecycle for goal: {goal}")
 
         # 1. Expand the objective into a DAG of subtasks
@@ -77,22 +106,37 @@ class CognitionCore:
 
         logger.info(f"Derived Plan strategy: {plan.plan_overview}")
 
-        # 2. Iterate executable tasks sequentially (simplified execution DAG for now)
-        for task in plan.tasks:
-            await self._execute_task(task)
-            
-        logger.warning("Goal lifecycle completed. Awaiting full tool architecture for complete functionality.")
+        # 2. Execute the task DAG; independent tasks run concurrently under per-task budgets
+        async def run_task(task: TaskDefinition, dependency_outputs: Dict[str, str]) -> TaskOutcome:
+            with budget_scope(f"task:{task.id}", limit=config.TASK_TOKEN_LIMIT):
+                return await self._execute_task(task, dependency_outputs)
 
-    async def _execute_task(self, task: TaskDefinition) -> None:
+        check_cancelled()
+        executor = DAGExecutor(run_task, max_concurrency=config.PLAN_MAX_CONCURRENCY, fail_fast=config.PLAN_FAIL_FAST)
+        outcomes = await executor.execute(plan)
+
+        completed = sum(1 for outcome in outcomes.values() if outcome.success)
+        logger.info(f"Goal lifecycle completed: {completed}/{len(outcomes)} tasks succeeded.")
+        return outcomes
+
+    async def _execute_task(self, task: TaskDefinition, dependency_outputs: Optional[Dict[str, str]] = None) -> TaskOutcome:
         """
         Tackles a single distinct task until completion or failure.
+        Outputs of prerequisite tasks are seeded into its working memory.
         """
         logger.info(f"Initializing task context -> ID: {task.id}")
         
         step_count = 0
-        working_memory = f"Starting Task:\n{task.description}\nExpected Outcome:\n{task.expected_outcome}\n"
+        header = f"Starting Task:\n{task.description}\nExpected Outcome:\n{task.expected_outcome}\n"
+        if dependency_outputs:
+            header += "\nPrerequisite Results:\n" + "".join(
+                f"[{dep_id}]\n{clip_output(output, config.COMPACTION_TOOL_OUTPUT_CHARS)}\n"
+                for dep_id, output in dependency_outputs.items()
+            )
+        working_memory = WorkingMemory(header=header, compactor=self.compactor)
 
         while step_count < config.MAX_PLANNING_STEPS:
+            check_cancelled()
             step_count += 1
             
             # Enforce token limit and check bandwidth
@@ -100,47 +144,85 @@ class CognitionCore:
             if bandwidth < 0.1:
                 logger.warning(f"Extremely low bandwidth ({bandwidth:.2f}). Emergency optimization required.")
 
-            decision: NextAction = await self.decision.decide_next_step(
-                task_description=task.description,
-                recent_memory=working_memory,
-                available_tools=self.tool_registry.get_all_schemas()
-            )
+            # Tools named early in the streamed verdict start while its rationale is still generating
+            speculative: Dict[str, Any] = {}
+
+            def start_tool_early(action_type: str, tool_call: Optional[ToolCallDecision]) -> None:
+                if action_type == "USE_TOOL" and tool_call and self._is_early_dispatch_safe(tool_call):
+                    logger.debug(f"Early tool dispatch -> {tool_call.tool_name}")
+                    speculative["call"] = tool_call
+                    speculative["task"] = asyncio.ensure_future(self.tool_executor.execute(tool_call))
+
+            try:
+                decision: NextAction = await self.decision.decide_next_step(
+                    task_description=task.description,
+                    recent_memory=await working_memory.render(),
+                    available_tools=self.tool_registry.get_all_schemas(),
+                    on_action=start_tool_early
+                )
+            except BaseException:
+                self._discard_speculative(speculative)
+                raise
 
             # Route Decision
+            if decision.action_type != "USE_TOOL":
+                self._discard_speculative(speculative)
+
             if decision.action_type == "TASK_COMPLETE":
                 logger.info(f"Task {task.id} finalized.")
                 
                 if config.DISABLE_REFINEMENT:
                     logger.info("Refinement skipped (DISABLE_REFINEMENT=True)")
-                    return
+                    return TaskOutcome(task_id=task.id, success=True, output=decision.response_or_summary or "", steps=step_count)
                 
                 logger.info("Triggering final refinement pass.")
                 # Multi-pass iterative refinement for the final response
-                refined_response = await self.refiner.run_refinement(task.description, working_memory)
+                refined_response = await self.refiner.run_refinement(task.description, await working_memory.render())
                 logger.info(f"Refined Result Size: {len(refined_response)} chars")
-                return
+                return TaskOutcome(task_id=task.id, success=True, output=refined_response, steps=step_count)
 
             elif decision.action_type == "FAIL":
                 logger.error(f"Task {task.id} unrecoverable fail: {decision.response_or_summary}")
                 # TODO: Trigger Error feedback loop / multi-agent assist
-                return
+                return TaskOutcome(task_id=task.id, success=False, error=decision.response_or_summary or "Task failed", steps=step_count)
 
             elif decision.action_type == "USE_TOOL":
                 if decision.tool_call:
                     logger.info(f"Tool Dispatch -> {decision.tool_call.tool_name}({decision.tool_call.arguments})")
-                    from core.decision_engine import ToolCallDecision
                     
                     tool_decision = ToolCallDecision(
                         tool_name=decision.tool_call.tool_name, 
                         arguments=decision.tool_call.arguments
                     )
                     
-                    tool_result = await self.tool_executor.execute(tool_decision)
+                    if speculative.get("call") == tool_decision:
+                        tool_result = await speculative["task"]
+                    else:
+                        self._discard_speculative(speculative)
+                        tool_result = await self.tool_executor.execute(tool_decision)
                     logger.debug(f"Tool Execution Result Loop: {len(tool_result)} bytes")
-                    working_memory += f"\n[Step {step_count}] Used {decision.tool_call.tool_name}. Outcome:\n{tool_result}\n"
+                    working_memory.add_step(step_count, decision.tool_call.tool_name, tool_result)
                 
             else:
                 logger.warning(f"Unknown action type generated: {decision.action_type}")
-                return
+                return TaskOutcome(task_id=task.id, success=False, error=f"Unknown action type: {decision.action_type}", steps=step_count)
                 
         logger.error(f"Task {task.id} exceeded max steps ({config.MAX_PLANNING_STEPS}). Aborting.")
+        return TaskOutcome(task_id=task.id, success=False, error=f"Exceeded max steps ({config.MAX_PLANNING_STEPS})", steps=step_count)
+
+    @staticmethod
+    def _is_early_dispatch_safe(tool_call: ToolCallDecision) -> bool:
+        """Only read-only, idempotent calls on the allow-list may run before the verdict is final."""
+        allowed = config.EARLY_DISPATCH_SAFE_TOOLS
+        action = tool_call.arguments.get("action")
+        return tool_call.tool_name in allowed or (
+            isinstance(action, str) and f"{tool_call.tool_name}:{action}" in allowed
+        )
+
+    @staticmethod
+    def _discard_speculative(speculative: Dict[str, Any]) -> None:
+        """Cancels an early-dispatched tool whose call the final verdict did not confirm."""
+        task = speculative.pop("task", None)
+        if task is not None and not task.done():
+            logger.warning(f"Cancelling early tool dispatch of {speculative['call'].tool_name}: not confirmed by final verdict.")
+            task.cancel()
@@ -0,0 +1,153 @@
+"""
+Context compaction for CognitionCore working memory.
+Keeps the most recent steps verbatim, clips large tool outputs to head and tail, and
+folds older steps into a rolling summary once the memory or task budget passes
+ADAPTIVE_COMPRESSION_THRESHOLD, so each decision prompt stays bounded. A compaction only
+re-triggers after enough new steps and budget growth, so a task sitting above the
+threshold is not summarized on every step.
+"""
+from typing import List, Optional
+from pydantic import BaseModel
+
+from core_config import config
+from core.reasoning_engine import ReasoningEngine
+from utils.logger import logger
+
+
+class StepRecord(BaseModel):
+    """One executed step of a task."""
+    index: int
+    tool_name: str
+    outcome: str
+
+    def render(self) -> str:
+        return f"\n[Step {self.index}] Used {self.tool_name}. Outcome:\n{self.outcome}\n"
+
+
+def clip_output(text: str, max_chars: int) -> str:
+    """Keeps the head and tail of an oversized tool output, where errors and results usually live."""
+    if len(text) <= max_chars:
+        return text
+    half = max_chars // 2
+    elided = len(text) - 2 * half
+    return f"{text[:half]}\n... [{elided} chars elided] ...\n{text[-half:]}"
+
+
+class WorkingMemory:
+    """
+    Structured replacement for the concatenated working-memory string of a single task.
+    """
+
+    def __init__(self, header: str, compactor: "ContextCompactor"):
+        self.header = header
+        self.compactor = compactor
+        self.summary = ""
+        self.steps: List[StepRecord] = []
+        # Hysteresis state: budget ratio and step index at the last compaction
+        self.compacted_ratio = 0.0
+        self.compacted_through = 0
+
+    def add_step(self, index: int, tool_name: str, outcome: str) -> None:
+        self.steps.append(StepRecord(
+            index=index,
+            tool_name=tool_name,
+            outcome=clip_output(outcome, self.compactor.max_tool_output_chars)
+        ))
+
+    def text(self) -> str:
+        rendered = self.header
+        if self.summary:
+            rendered += f"\n[Earlier Steps Summary]\n{self.summary}\n"
+        return rendered + "".join(step.render() for step in self.steps)
+
+    async def render(self) -> str:
+        """Compacts if a budget threshold has been crossed, then returns the prompt-ready memory."""
+        await self.compactor.compact(self)
+        return self.text()
+
+
+class ContextCompactor:
+    """
+    Summarizes older working-memory steps with a cheap model when compaction triggers.
+    Unset limits are read from config on every use, so runtime config changes apply.
+    """
+
+    def __init__(
+        self,
+        engine: ReasoningEngine,
+        keep_recent: Optional[int] = None,
+        max_tool_output_chars: Optional[int] = None,
+        memory_token_budget: Optional[int] = None,
+        threshold: Optional[float] = None,
+    ):
+        self.engine = engine
+        self._keep_recent = keep_recent
+        self._max_tool_output_chars = max_tool_output_chars
+        self._memory_token_budget = memory_token_budget
+        self._threshold = threshold
+        self.compactions = 0
+
+    @property
+    def keep_recent(self) -> int:
+        return self._keep_recent if self._keep_recent is not None else config.COMPACTION_KEEP_RECENT_STEPS
+
+    @property
+    def max_tool_output_chars(self) -> int:
+        if self._max_tool_output_chars is not None:
+            return self._max_tool_output_chars
+        return config.COMPACTION_TOOL_OUTPUT_CHARS
+
+    @property
+    def memory_token_budget(self) -> int:
+        if self._memory_token_budget is not None:
+            return self._memory_token_budget
+        return config.WORKING_MEMORY_TOKEN_BUDGET
+
+    @property
+    def threshold(self) -> float:
+        return self._threshold if self._threshold is not None else config.ADAPTIVE_COMPRESSION_THRESHOLD
+
+    def should_compact(self, memory: WorkingMemory) -> bool:
+        new_steps = sum(1 for step in memory.steps if step.index > memory.compacted_through)
+        if len(memory.steps) <= self.keep_recent or new_steps < config.COMPACTION_MIN_NEW_STEPS:
+            return False
+        tokens = self.engine.tokens
+        ratio = tokens.usage_ratio()
+        if ratio > self.threshold and ratio >= memory.compacted_ratio + config.COMPACTION_RATIO_MARGIN:
+            return True
+        return tokens.count_tokens(memory.text()) > self.memory_token_budget * self.threshold
+
+    async def compact(self, memory: WorkingMemory) -> None:
+        if not self.should_compact(memory):
+            return
+
+        older, memory.steps = memory.steps[:-self.keep_recent], memory.steps[-self.keep_recent:]
+        transcript = "".join(step.render() for step in older)
+        summary = await self._summarize(memory.summary, transcript)
+        memory.summary = clip_output(summary, self.max_tool_output_chars)
+        memory.compacted_ratio = self.engine.tokens.usage_ratio()
+        memory.compacted_through = memory.steps[-1].index
+        self.compactions += 1
+        logger.info(f"CONTEXT_COMPACTION: Folded {len(older)} steps into summary ({len(memory.summary)} chars).")
+
+    async def _summarize(self, previous_summary: str, transcript: str) -> str:
+        sys_prompt = (
+            "You compress an autonomous agent's working memory.\n"
+            "Merge the previous summary with the new steps into a concise factual digest: "
+            "what was tried, concrete results (paths, values, errors), and what remains open. "
+            "Drop redundant output. Never invent facts."
+        )
+        user_prompt = f"Previous Summary:\n{previous_summary or '(none)'}\n\nNew Steps:\n{transcript}"
+        try:
+            return await self.engine.generate_response(
+                system_prompt=sys_prompt,
+                user_prompt=user_prompt,
+                temperature=0.1,
+                model_override=config.SECONDARY_MODEL,
+                call_site="memory.compact_working_memory"
+            )
+        except Exception as e:
+            # Deterministic fallback keeps the bound even if the summarizer is unavailable
+            logger.warning(f"CONTEXT_COMPACTION: Summarizer failed ({e}); keeping step headlines only.")
+            headlines = [line for line in transcript.splitlines() if line.startswith("[Step ")]
+            return "\n".join(filter(None, [previous_summary, *headlines]))
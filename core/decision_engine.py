@@ -2,10 +2,13 @@
 Decision Engine for Project Ascension.
 Determines the granular next action to take for a specific goal or subtask.
 """
-from typing import List, Optional, Any, Dict
+from typing import List, Optional, Any, Dict, Callable
+import json
 from pydantic import BaseModel, Field
 
+from core_config import config
 from core.reasoning_engine import ReasoningEngine
+from learning.performance_analyzer import PerformanceAnalyzer
 from utils.logger import logger
 
 
@@ -20,11 +23,13 @@ class ToolCallDecision(BaseModel):
 class NextAction(BaseModel):
     """
     Structured envelope for the Decision Engine's verdict.
+    Field order is the generation order: the actionable fields come first so a streamed
+    verdict can be dispatched before the rationale finishes.
     """
-    thought_process: str = Field(description="Step by step reasoning for the decision.")
-    confidence_score: float = Field(description="0.0 to 1.0. How certain are you this action is mathematically/logically optimal. BE HONEST. Overconfidence is heavily penalized in system calibration loops.")
     action_type: str = Field(description="Must be one of: 'USE_TOOL', 'TASK_COMPLETE', 'FAIL'.")
     tool_call: Optional[ToolCallDecision] = Field(default=None, description="Populated if action_type is USE_TOOL.")
+    thought_process: str = Field(description="Step by step reasoning for the decision.")
+    confidence_score: float = Field(description="0.0 to 1.0. How certain are you this action is mathematically/logically optimal. BE HONEST. Overconfidence is heavily penalized in system calibration loops.")
     response_or_summary: Optional[str] = Field(default=None, description="Populated if action_type is TASK_COMPLETE or FAIL. Summarizes outcome.")
 
 
@@ -33,18 +38,48 @@ class DecisionEngine:
     Evaluates current state against the active task and selects the optimal next action.
     """
 
-    def __init__(self, engine: ReasoningEngine):
+    def __init__(self, engine: ReasoningEngine, heuristics: Optional[PerformanceAnalyzer] = None):
         """
-        Initializes the engine with an LLM execution proxy.
+        Initializes the engine with an LLM execution proxy and, optionally, the store of
+        learned rules appended to the static prompt prefix.
         """
         self.engine = engine
+        self.heuristics = heuristics
+        self.learned_heuristics: str = ""
+        self._heuristic_rules: tuple = ()
         logger.info("DecisionEngine initialized.")
 
+    def _refresh_learned_heuristics(self) -> str:
+        """
+        Re-renders the learned-heuristics block only when the rules change, so the block
+        stays byte-identical (and inside the cached prompt prefix) between updates.
+        """
+        if self.heuristics is None:
+            return self.learned_heuristics
+        self.heuristics.refresh()
+        rules = tuple(self.heuristics.learned_rules)
+        if rules != self._heuristic_rules:
+            self._heuristic_rules = rules
+            self.learned_heuristics = self.heuristics.get_learned_heuristics() if rules else ""
+        return self.learned_heuristics
+
+    @staticmethod
+    def _render_tool_block(available_tools: List[Dict[str, Any]]) -> str:
+        """
+        Renders tool schemas deterministically (sorted by name, sorted keys) so the block is
+        byte-identical across steps and stays inside the provider's cached prompt prefix.
+        """
+        block = "Available Tools:\n"
+        for tool in sorted(available_tools, key=lambda t: t["name"]):
+            block += f"- {tool['name']}: {tool['description']}\n  Schema: {json.dumps(tool['schema'], sort_keys=True)}\n"
+        return block
+
     async def decide_next_step(
         self,
         task_description: str,
         recent_memory: str,
-        available_tools: List[Dict[str, Any]]
+        available_tools: List[Dict[str, Any]],
+        on_action: Optional[Callable[[str, Optional[ToolCallDecision]], None]] = None
     ) -> NextAction:
         """
         Calculates the single next optimal move for the AGI to progress its active task.
@@ -53,6 +88,8 @@ class DecisionEngine:
             task_description (str): What the system is currently trying to accomplish.
             recent_memory (str): Observations, tool outputs, and short term context.
             available_tools (List[Dict[str, Any]]): Schemas describing available tools.
+            on_action (Optional[Callable]): Called with (action_type, tool_call) as soon as both are
+                complete in the streamed verdict, before the rest of the response arrives.
             
         Returns:
             NextAction: Structured instruction mapping to concrete execution pathways.
@@ -70,18 +107,43 @@ class DecisionEngine:
             "6. META-COGNITION CALIBRATION: Evaluate your `confidence_score` critically. If you are hallucinating or guessing, lower the score below 0.5. Calibration metrics penalize high-confidence errors exponentially.\n"
         )
 
+        # Static prefix (persona -> tool schemas -> learned heuristics) is identical every step;
+        # only the task and memory below vary.
+        static_context = [self._render_tool_block(available_tools), self._refresh_learned_heuristics()]
+
         user_prompt = f"Current Task:\n{task_description}\n\n"
-        user_prompt += f"Recent Context / Memory:\n{recent_memory}\n\n"
-        user_prompt += "Available Tools:\n"
-        for tool in available_tools:
-            user_prompt += f"- {tool['name']}: {tool['description']}\n  Schema: {tool['schema']}\n"
+        user_prompt += f"Recent Context / Memory:\n{recent_memory}\n"
 
         logger.debug("Requesting NextAction verdict from LLM...")
-        decision = await self.engine.generate_response(
-            system_prompt=sys_prompt,
-            user_prompt=user_prompt,
-            temperature=0.1,  # Highly deterministic
-            response_model=NextAction
-        )
+        if on_action is not None and config.ENABLE_EARLY_TOOL_DISPATCH:
+            decision = await self.engine.stream_structured_response(
+                system_prompt=sys_prompt,
+                user_prompt=user_prompt,
+                response_model=NextAction,
+                early_fields=("action_type", "tool_call"),
+                on_early=lambda fields: self._dispatch_early(fields, on_action),
+                temperature=0.1,
+                static_context=static_context,
+                call_site="decision.decide_next_step"
+            )
+        else:
+            decision = await self.engine.generate_response(
+                system_prompt=sys_prompt,
+                user_prompt=user_prompt,
+                temperature=0.1,  # Highly deterministic
+                response_model=NextAction,
+                static_context=static_context,
+                call_site="decision.decide_next_step"
+            )
         logger.info(f"Decision made: {decision.action_type}")
         return decision
+
+    @staticmethod
+    def _dispatch_early(fields: Dict[str, Any], on_action: Callable[[str, Optional[ToolCallDecision]], None]) -> None:
+        """Validates the early fields of a streamed verdict and hands them to the caller."""
+        try:
+            tool_call = ToolCallDecision(**fields["tool_call"]) if fields.get("tool_call") else None
+        except Exception as e:
+            logger.debug(f"Early tool_call failed validation; waiting for the full verdict: {e}")
+            return
+        on_action(fields.get("action_type"), tool_call)
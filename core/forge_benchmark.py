@@ -0,0 +1,289 @@
+"""
+Sandboxed benchmarking of Forge variants.
+One test-and-workload harness is generated per objective and every variant runs against it in
+the SandboxManager, bound only through its entry point: a failing test gate disqualifies the
+variant, otherwise repeated timings of the same workload on the same input and the process's peak
+RSS are collected, and variants are ranked by mean latency with 95% CIs.
+"""
+import ast
+import asyncio
+import json
+import math
+import re
+import statistics
+from typing import Any, Dict, List, Optional, Tuple
+
+from pydantic import BaseModel, Field
+
+from core_config import config
+from core.reasoning_engine import ReasoningEngine
+from core.sandbox_manager import SandboxManager
+from core.mission_registry import check_cancelled
+from utils.logger import logger
+
+# Two-sided 95% Student t critical values by degrees of freedom; 1.96 beyond the table
+_T95 = {
+    1: 12.706, 2: 4.303, 3: 3.182, 4: 2.776, 5: 2.571, 6: 2.447, 7: 2.365, 8: 2.306, 9: 2.262, 10: 2.228,
+    11: 2.201, 12: 2.179, 13: 2.160, 14: 2.145, 15: 2.131, 16: 2.120, 17: 2.110, 18: 2.101, 19: 2.093,
+    20: 2.086, 21: 2.080, 22: 2.074, 23: 2.069, 24: 2.064, 25: 2.060, 26: 2.056, 27: 2.052, 28: 2.048,
+    29: 2.045, 30: 2.042,
+}
+
+RESULT_MARKER = "BENCH_RESULT:"
+
+# Entry script: loads the shared harness, binds the variant's entry point, runs the test gate,
+# then times the workload in-process on the harness's input
+_RUNNER = """
+import importlib, json, sys, time
+sys.path.insert(0, ".")
+result = {{"tests_passed": False, "samples_ms": [], "error": None}}
+try:
+    ns = {{"__name__": "bench_harness"}}
+    with open("bench_harness.py") as f:
+        exec(compile(f.read(), "bench_harness.py", "exec"), ns)
+    impl = getattr(importlib.import_module({module!r}), {attribute!r})
+    ns["run_tests"](impl)
+    result["tests_passed"] = True
+    data = ns["make_input"]()
+    for _ in range({warmup}):
+        ns["workload"](impl, data)
+    for _ in range({samples}):
+        started = time.perf_counter()
+        ns["workload"](impl, data)
+        result["samples_ms"].append((time.perf_counter() - started) * 1000.0)
+except BaseException as e:
+    result["error"] = f"{{type(e).__name__}}: {{e}}"[:500]
+print("{marker}" + json.dumps(result))
+"""
+
+
+class VariantBinding(BaseModel):
+    """Where a variant's entry point lives."""
+    label: str = Field(description="Variant label, exactly as given.")
+    module: str = Field(description="Importable module name of the entry point, e.g. 'solution'.")
+    attribute: str = Field(description="Name of the function or class in that module that implements the objective.")
+
+
+class BenchmarkHarness(BaseModel):
+    """Generated harness shared by all variants of one objective."""
+    test_code: str = Field(description="Python source defining run_tests(impl), which asserts that impl, a variant's entry point, behaves correctly.")
+    workload_code: str = Field(description="Python source defining make_input(), returning deterministic representative input, and workload(impl, data), one call through impl on that input taking 1-100 ms.")
+    bindings: List[VariantBinding] = Field(description="The entry point of every variant.")
+
+
+class VariantBenchmark(BaseModel):
+    """Measured outcome for one variant."""
+    label: str
+    benchmarkable: bool = True
+    tests_passed: bool = False
+    error: Optional[str] = None
+    samples_ms: List[float] = Field(default_factory=list)
+    mean_ms: Optional[float] = None
+    stdev_ms: Optional[float] = None
+    ci95_ms: Optional[Tuple[float, float]] = None
+    peak_rss_mb: Optional[float] = None
+    complexity: Optional[float] = None  # Mean cyclomatic complexity per function
+    rank: Optional[int] = None
+    significant: Optional[bool] = None  # For the winner: CI strictly below the runner-up's
+
+
+def confidence_interval(samples: List[float]) -> Tuple[float, float, Tuple[float, float]]:
+    """Returns (mean, stdev, 95% CI) using Student's t."""
+    mean = statistics.fmean(samples)
+    if len(samples) < 2:
+        return mean, 0.0, (mean, mean)
+    stdev = statistics.stdev(samples)
+    half_width = _T95.get(len(samples) - 1, 1.96) * stdev / math.sqrt(len(samples))
+    return mean, stdev, (mean - half_width, mean + half_width)
+
+
+_DECISION_NODES = (ast.If, ast.For, ast.AsyncFor, ast.While, ast.IfExp, ast.ExceptHandler, ast.Assert, ast.comprehension, ast.match_case)
+
+
+def cyclomatic_complexity(sources: Dict[str, str]) -> Optional[float]:
+    """
+    Mean McCabe complexity over the functions in the variant's Python files: 1 plus one per
+    branch, loop, handler, comprehension clause and extra boolean operand.
+    """
+    scores: List[int] = []
+    for path, content in sources.items():
+        if not path.endswith(".py"):
+            continue
+        try:
+            tree = ast.parse(content)
+        except SyntaxError:
+            continue
+        for node in ast.walk(tree):
+            if not isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
+                continue
+            score = 1
+            for child in ast.walk(node):
+                if isinstance(child, _DECISION_NODES):
+                    score += 1 + (len(child.ifs) if isinstance(child, ast.comprehension) else 0)
+                elif isinstance(child, ast.BoolOp):
+                    score += len(child.values) - 1
+            scores.append(score)
+    return round(statistics.fmean(scores), 2) if scores else None
+
+
+def extract_sources(result: Dict[str, Any]) -> Optional[Dict[str, str]]:
+    """
+    Maps a swarm result to importable Python files, or None if it holds no runnable Python.
+    Single-file output becomes `solution.py`.
+    """
+    if result.get("is_multifile"):
+        files = {path: content for path, content in (result.get("file_map") or {}).items() if isinstance(content, str)}
+        return files if any(path.endswith(".py") for path in files) else None
+
+    content = (result.get("content") or "").strip()
+    fenced = re.search(r"```(?:python|py)?\s*\n(.*?)```", content, re.DOTALL)
+    if fenced:
+        content = fenced.group(1)
+    try:
+        compile(content, "solution.py", "exec")
+    except SyntaxError:
+        return None
+    return {"solution.py": content}
+
+
+class ForgeBenchmarker:
+    """
+    Benchmarks variants concurrently through a bounded pool of sandbox workers.
+    """
+
+    def __init__(
+        self,
+        engine: ReasoningEngine,
+        sandbox: Optional[SandboxManager] = None,
+        workers: int = 2,
+        samples: int = 15,
+        warmup: int = 3,
+        timeout: float = 30.0,
+    ):
+        self.engine = engine
+        self.sandbox = sandbox or SandboxManager({
+            "timeout": timeout,
+            "max_memory_mb": config.SANDBOX_MAX_MEMORY_MB,
+            "strict_isolation": config.ENABLE_STRICT_ISOLATION,
+        })
+        self.samples = max(2, samples)
+        self.warmup = max(0, warmup)
+        self.timeout = timeout
+        self._pool = asyncio.Semaphore(max(1, workers))
+
+    async def benchmark(self, objective: str, variants: Dict[str, Dict[str, Any]]) -> Dict[str, VariantBenchmark]:
+        """
+        Benchmarks every variant (label -> swarm result) against one shared harness and ranks the
+        ones that pass its tests.
+        """
+        sources = {label: extract_sources(result) for label, result in variants.items()}
+        runnable = {label: files for label, files in sources.items() if files is not None}
+
+        harness, harness_error = None, None
+        if runnable:
+            try:
+                harness = await self._generate_harness(objective, runnable)
+            except Exception as e:
+                harness_error = f"Harness generation failed: {e}"
+        bindings = {binding.label: binding for binding in harness.bindings} if harness else {}
+
+        labels = list(variants)
+        outcomes = await asyncio.gather(*[
+            self._benchmark_one(label, sources[label], harness, bindings.get(label), harness_error)
+            for label in labels
+        ])
+        results = dict(zip(labels, outcomes))
+        self._rank(results)
+        return results
+
+    async def _benchmark_one(
+        self,
+        label: str,
+        sources: Optional[Dict[str, str]],
+        harness: Optional[BenchmarkHarness],
+        binding: Optional[VariantBinding],
+        harness_error: Optional[str] = None,
+    ) -> VariantBenchmark:
+        if sources is None:
+            return VariantBenchmark(label=label, benchmarkable=False, error="Variant contains no runnable Python.")
+        complexity = cyclomatic_complexity(sources)
+        if harness is None:
+            return VariantBenchmark(label=label, complexity=complexity, error=harness_error or "No harness.")
+        if binding is None or not self._valid_binding(binding):
+            return VariantBenchmark(label=label, complexity=complexity, error="Harness did not bind a valid entry point for this variant.")
+
+        files = dict(sources)
+        files["bench_harness.py"] = f"{harness.test_code}\n\n{harness.workload_code}\n"
+        runner = _RUNNER.format(
+            module=binding.module, attribute=binding.attribute,
+            warmup=self.warmup, samples=self.samples, marker=RESULT_MARKER
+        )
+
+        async with self._pool:
+            # A variant queued behind the pool must not start a sandbox once the session is killed
+            check_cancelled()
+            logger.info(f"FORGE_BENCH: Running {label} ({self.samples} samples).")
+            run = await self.sandbox.execute_python_isolated(runner, timeout=self.timeout, files=files)
+
+        bench = VariantBenchmark(label=label, complexity=complexity, peak_rss_mb=round(run.memory_peak_mb, 2) if run.memory_peak_mb else None)
+        report = self._parse_report(run.stdout)
+        if run.is_timeout:
+            bench.error = f"Timed out after {self.timeout}s."
+        elif report is None:
+            bench.error = (run.stderr.strip().splitlines() or ["Harness produced no result."])[-1][:500]
+        else:
+            bench.tests_passed = bool(report.get("tests_passed"))
+            bench.error = report.get("error")
+            bench.samples_ms = [round(sample, 4) for sample in report.get("samples_ms", [])]
+
+        if bench.tests_passed and len(bench.samples_ms) == self.samples:
+            mean, stdev, (low, high) = confidence_interval(bench.samples_ms)
+            bench.mean_ms, bench.stdev_ms = round(mean, 4), round(stdev, 4)
+            bench.ci95_ms = (round(max(0.0, low), 4), round(high, 4))
+        return bench
+
+    @staticmethod
+    def _valid_binding(binding: VariantBinding) -> bool:
+        return all(part.isidentifier() for part in binding.module.split(".")) and binding.attribute.isidentifier()
+
+    @staticmethod
+    def _parse_report(stdout: str) -> Optional[Dict[str, Any]]:
+        for line in reversed(stdout.splitlines()):
+            if line.startswith(RESULT_MARKER):
+                try:
+                    return json.loads(line[len(RESULT_MARKER):])
+                except json.JSONDecodeError:
+                    return None
+        return None
+
+    async def _generate_harness(self, objective: str, variants: Dict[str, Dict[str, str]]) -> BenchmarkHarness:
+        listing = "\n\n".join(
+            f"## Variant: {label}\n" + "\n\n".join(f"# File: {path}\n{content}" for path, content in files.items())
+            for label, files in variants.items()
+        )
+        return await self.engine.generate_response(
+            system_prompt=(
+                "You write one micro-benchmark harness that is run, unchanged, against several competing "
+                "implementations of the same objective. Each variant's files sit alone in the working directory "
+                "and are importable by module name. Interact with a variant only through its entry point `impl`, "
+                "using the calling convention the objective implies; never depend on a variant's internals. "
+                "Use only the standard library; no network, no file or process side effects. run_tests(impl) must "
+                "raise on incorrect behaviour. make_input() must be deterministic (fixed seeds) and realistic. "
+                "Bind every variant listed."
+            ),
+            user_prompt=f"Objective: {objective}\n\nVariants:\n{listing}",
+            temperature=0.0,
+            response_model=BenchmarkHarness,
+            model_override=config.SECONDARY_MODEL,
+            call_site="forge.generate_benchmark_harness"
+        )
+
+    @staticmethod
+    def _rank(results: Dict[str, VariantBenchmark]) -> None:
+        ranked = sorted((bench for bench in results.values() if bench.mean_ms is not None), key=lambda bench: bench.mean_ms)
+        for position, bench in enumerate(ranked, 1):
+            bench.rank = position
+        if len(ranked) >= 2:
+            ranked[0].significant = ranked[0].ci95_ms[1] < ranked[1].ci95_ms[0]
+        elif ranked:
+            ranked[0].significant = True
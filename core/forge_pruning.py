@@ -0,0 +1,121 @@
+"""
+Successive-halving pruning for Forge sessions.
+Parallel branches meet at a gate after selected stages; each gate scores the branches'
+stage outputs with a cheap model and lets only the top half continue, so the expensive
+implementation and review stages run for the strongest designs only.
+"""
+import asyncio
+import math
+from typing import Awaitable, Callable, Dict, List, Optional
+
+from pydantic import BaseModel, Field
+
+from utils.logger import logger
+
+# (branch label, stage, stage output) -> score; higher is better
+BranchScorer = Callable[[str, str, str], Awaitable[float]]
+
+
+class BranchPruned(Exception):
+    """Raised inside a branch that was eliminated at a gate."""
+
+    def __init__(self, branch: str, stage: str, score: float):
+        super().__init__(f"Branch {branch} pruned after {stage} (score {score:.2f}).")
+        self.branch = branch
+        self.stage = stage
+        self.score = score
+
+
+class StageScore(BaseModel):
+    """Cheap-model verdict on one branch's stage output."""
+    score: float = Field(description="Quality from 0 (unusable) to 10 (excellent).")
+    rationale: str = Field(description="One sentence justification.")
+
+
+class _Rung:
+    """Barrier for one gated stage."""
+
+    def __init__(self):
+        self.outputs: Dict[str, str] = {}
+        self.scores: Dict[str, float] = {}
+        self.survivors: Optional[List[str]] = None
+        self.decided = asyncio.Event()
+
+
+class SuccessiveHalvingGate:
+    """
+    Coordinates the branches of one Forge session.
+
+    At every stage in `stages`, the gate waits for all live branches, scores them concurrently,
+    and keeps the best ceil(n / 2) (never fewer than `min_survivors`). Branches that fail
+    before reaching a gate must call `withdraw` so the others are not held up.
+    """
+
+    def __init__(self, branches: List[str], scorer: BranchScorer, stages: List[str], min_survivors: int = 1):
+        self.live: List[str] = list(branches)
+        self.scorer = scorer
+        self.stages = list(stages)
+        self.min_survivors = max(1, min_survivors)
+        self._rungs: Dict[str, _Rung] = {stage: _Rung() for stage in self.stages}
+        self.pruned: Dict[str, BranchPruned] = {}
+
+    def for_branch(self, branch: str) -> Callable[[str, str], Awaitable[None]]:
+        """Returns the `stage_gate` callback for one branch's swarm run."""
+        async def stage_gate(stage: str, output: str) -> None:
+            await self.arrive(branch, stage, output)
+        return stage_gate
+
+    async def arrive(self, branch: str, stage: str, output: str) -> None:
+        rung = self._rungs.get(stage)
+        if rung is None:
+            return
+        rung.outputs[branch] = output
+        await self._maybe_decide(stage)
+        await rung.decided.wait()
+        if branch not in rung.survivors:
+            raise self.pruned[branch]
+
+    def withdraw(self, branch: str) -> None:
+        if branch in self.live:
+            self.live.remove(branch)
+            for stage in self.stages:
+                asyncio.ensure_future(self._maybe_decide(stage))
+
+    async def _maybe_decide(self, stage: str) -> None:
+        rung = self._rungs[stage]
+        waiting = [branch for branch in self.live if branch in rung.outputs]
+        if rung.survivors is not None or not waiting or len(waiting) < len(self.live):
+            return
+        if len(waiting) <= self.min_survivors:
+            rung.survivors = waiting
+            rung.decided.set()
+            return
+        rung.survivors = []  # Claim the decision before awaiting the scorer
+
+        decided = False
+        try:
+            scores = await asyncio.gather(*[self._score(branch, stage, rung.outputs[branch]) for branch in waiting])
+            rung.scores = dict(zip(waiting, scores))
+            ranked = sorted(waiting, key=lambda branch: -rung.scores[branch])  # Stable: ties keep branch order
+            keep = max(self.min_survivors, math.ceil(len(ranked) / 2))
+            rung.survivors = ranked[:keep]
+
+            for branch in ranked[keep:]:
+                self.pruned[branch] = BranchPruned(branch, stage, rung.scores[branch])
+                if branch in self.live:
+                    self.live.remove(branch)
+            decided = True
+            logger.info(f"FORGE_PRUNE: [{stage}] scores {rung.scores}; continuing with {rung.survivors}.")
+        finally:
+            # The deciding branch was cancelled or scoring broke: release the others with no pruning
+            if not decided:
+                rung.survivors = waiting
+                logger.warning(f"FORGE_PRUNE: [{stage}] decision aborted; all {len(waiting)} branches continue.")
+            rung.decided.set()
+
+    async def _score(self, branch: str, stage: str, output: str) -> float:
+        try:
+            return float(await self.scorer(branch, stage, output))
+        except Exception as e:
+            logger.warning(f"FORGE_PRUNE: Scoring {branch} at {stage} failed ({e}); ranking it last.")
+            return float("-inf")
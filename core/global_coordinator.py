@@ -9,6 +9,7 @@ import random
 from api.usage_db import SessionLocal, SwarmCluster
 from core.swarm_cluster import SwarmInstance
 from core.reasoning_engine import ReasoningEngine
+from core.model_cascade import extract_json
 from utils.logger import logger
 
 class RoutingVerdict(BaseModel):
@@ -65,12 +66,12 @@ class GlobalCoordinator:
         response = await self.reasoning.generate_response(
             system_prompt="You are the Global Coordinator. You route AGI missions to specialized regional clusters.",
             user_prompt=prompt,
-            temperature=0.2
+            temperature=0.2,
+            call_site="coordinator.route_mission"
         )
 
         try:
-            import json
-            data = json.loads(response)
+            data = extract_json(response)
             return RoutingVerdict(**data)
         except:
             # Fallback to random cluster
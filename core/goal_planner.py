@@ -64,7 +64,8 @@ class GoalPlanner:
             system_prompt=sys_prompt,
             user_prompt=user_prompt,
             temperature=0.3,
-            response_model=Plan
+            response_model=Plan,
+            call_site="planner.create_plan"
         )
         logger.info(f"Plan generated successfully with {len(plan.tasks)} tasks.")
         return plan
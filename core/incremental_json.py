@@ -0,0 +1,96 @@
+"""
+Incremental JSON object parser for streamed structured outputs.
+Reports each top-level field as soon as its value is syntactically complete,
+so callers can act on early fields while later ones are still being generated.
+"""
+import json
+from typing import Any, Callable, Dict, List, Optional, Sequence
+
+
+class IncrementalObjectParser:
+    """
+    Scans a JSON object chunk by chunk and decodes top-level fields as they close.
+
+    `watch` names the fields that gate `on_ready`; the callback fires exactly once,
+    with the decoded values of those fields, when all of them are complete.
+    """
+
+    def __init__(self, watch: Sequence[str] = (), on_ready: Optional[Callable[[Dict[str, Any]], None]] = None):
+        self.watch = tuple(watch)
+        self.on_ready = on_ready
+        self.fields: Dict[str, Any] = {}
+        self.ready = False
+
+        self._pos = 0
+        self._depth = 0
+        self._in_string = False
+        self._escaped = False
+        self._key_start: Optional[int] = None
+        self._current_key: Optional[str] = None
+        self._value_start: Optional[int] = None
+        self._text = ""
+
+    def feed(self, chunk: str) -> List[str]:
+        """
+        Consumes the next chunk of JSON text.
+
+        Returns:
+            List[str]: Names of the top-level fields completed by this chunk.
+        """
+        self._text += chunk
+        completed: List[str] = []
+
+        while self._pos < len(self._text):
+            ch = self._text[self._pos]
+
+            if self._in_string:
+                if self._escaped:
+                    self._escaped = False
+                elif ch == "\\":
+                    self._escaped = True
+                elif ch == '"':
+                    self._in_string = False
+                    if self._depth == 1 and self._key_start is not None:
+                        self._current_key = json.loads(self._text[self._key_start:self._pos + 1])
+                        self._key_start = None
+                self._pos += 1
+                continue
+
+            if ch == '"':
+                self._in_string = True
+                if self._depth == 1 and self._value_start is None:
+                    self._key_start = self._pos
+            elif ch in "{[":
+                self._depth += 1
+            elif ch in "}]":
+                if self._depth == 1 and self._value_start is not None:
+                    self._close_field(self._pos, completed)
+                self._depth -= 1
+            elif self._depth == 1:
+                if ch == ":" and self._current_key is not None:
+                    self._value_start = self._pos + 1
+                elif ch == "," and self._value_start is not None:
+                    self._close_field(self._pos, completed)
+            self._pos += 1
+
+        if completed and not self.ready and self.watch and all(name in self.fields for name in self.watch):
+            self.ready = True
+            if self.on_ready is not None:
+                self.on_ready({name: self.fields[name] for name in self.watch})
+        return completed
+
+    def _close_field(self, end: int, completed: List[str]) -> None:
+        raw = self._text[self._value_start:end].strip()
+        try:
+            self.fields[self._current_key] = json.loads(raw)
+            completed.append(self._current_key)
+        except ValueError:
+            # Malformed value; leave it to the final schema validation to reject
+            pass
+        self._current_key = None
+        self._value_start = None
+
+    @property
+    def text(self) -> str:
+        """The full text fed so far."""
+        return self._text
@@ -1,3 +1,4 @@
+import asyncio
 import logging
 from typing import Dict, Any, List, Optional
 import uuid
@@ -9,6 +10,9 @@ import os
 
 logger = logging.getLogger(__name__)
 
+# Default for `org_id` arguments: use the org the bridge is currently bound to
+_BOUND_ORG: Any = object()
+
 class KnowledgeBridge:
     """
     Distills insights from completed missions and retrieves relevant pattern
@@ -151,11 +155,18 @@ class KnowledgeBridge:
         except Exception as e:
             logger.error(f"KNOWLEDGE: Vector Index optimization failed: {e}")
 
-    async def retrieve_relevant_knowledge(self, query: str, limit: int = 3) -> List[Dict[str, Any]]:
+    async def retrieve_relevant_knowledge(self, query: str, limit: int = 3, org_id: Optional[str] = _BOUND_ORG) -> List[Dict[str, Any]]:
         """
         Retrieves past insights relevant to the current objective query.
-        Uses vector embeddings similarity search via ChromaDB.
+        Uses vector embeddings similarity search via ChromaDB, off the event loop.
+        An explicit `org_id` (None included) overrides the bridge's bound org, for lookups made
+        before a mission binds it.
         """
+        if org_id is _BOUND_ORG:
+            org_id = self.org_id
+        return await asyncio.to_thread(self._retrieve_relevant_knowledge, query, limit, org_id)
+
+    def _retrieve_relevant_knowledge(self, query: str, limit: int, org_id: Optional[str]) -> List[Dict[str, Any]]:
         logger.info(f"KNOWLEDGE: Retrieving context for query: {query}")
         
         results = []
@@ -164,7 +175,7 @@ class KnowledgeBridge:
             search_results = self.collection.query(
                 query_texts=[query],
                 n_results=limit,
-                where={"org_id": self.org_id or "GLOBAL"}
+                where={"org_id": org_id or "GLOBAL"}
             )
             
             if search_results["documents"] and search_results["documents"][0]:
@@ -181,7 +192,7 @@ class KnowledgeBridge:
         except Exception as e:
             logger.error(f"KNOWLEDGE: Vector search failed: {e}. Falling back to standard DB.")
             with SessionLocal() as db:
-                knowledge_items = db.query(MissionKnowledge).filter(MissionKnowledge.org_id == self.org_id).limit(limit).all()
+                knowledge_items = db.query(MissionKnowledge).filter(MissionKnowledge.org_id == org_id).limit(limit).all()
                 for item in knowledge_items:
                     results.append({
                         "title": item.title,
@@ -0,0 +1,181 @@
+"""
+Record/replay transport for the Reasoning Engine.
+A live run records every request/response pair to a compact JSONL cassette; later runs
+replay them at memory speed so benchmarks measure orchestration overhead, not the network.
+"""
+import json
+import os
+import re
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, List, Optional
+
+from pydantic import BaseModel
+
+from core.response_cache import build_request_key
+from utils.logger import logger
+
+
+class CassetteMissError(RuntimeError):
+    """Raised in replay mode when a request has no recorded response."""
+
+
+# Volatile tokens that differ between otherwise identical runs (ids, clocks, counters)
+_VOLATILE_PATTERNS = [
+    (re.compile(r"\b[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}\b", re.I), "<uuid>"),
+    (re.compile(r"\b\d{4}-\d{2}-\d{2}[T ]\d{2}:\d{2}:\d{2}(?:\.\d+)?(?:Z|[+-]\d{2}:?\d{2})?\b"), "<ts>"),
+    (re.compile(r"\b[0-9a-f]{8,}\b", re.I), "<hex>"),
+    (re.compile(r"\d+(?:\.\d+)?"), "<n>"),
+    (re.compile(r"\s+"), " "),
+]
+
+
+def _normalize(text: str) -> str:
+    for pattern, placeholder in _VOLATILE_PATTERNS:
+        text = pattern.sub(placeholder, text)
+    return text.strip()
+
+
+class LLMCassette:
+    """
+    Process-wide cassette deck. Modes:
+      - 'off': pass-through.
+      - 'record': live calls are appended to the cassette file.
+      - 'replay': calls are answered from the cassette; nothing reaches the provider.
+
+    Matching:
+      - 'strict': exact model, prompts, temperature and schema (the response cache key).
+      - 'fuzzy': model, schema name and prompts with ids, timestamps, numbers and
+        whitespace normalized away; temperature is ignored.
+
+    Repeated identical requests replay their recordings in order; once exhausted,
+    the last recording is reused.
+    """
+
+    def __init__(self):
+        self.mode = "off"
+        self.match = "strict"
+        self.path: Optional[str] = None
+        self._tracks: Dict[str, List[Dict[str, Any]]] = {}
+        self._cursors: Dict[str, int] = {}
+
+        self.hits = 0
+        self.misses = 0
+        self.recorded = 0
+
+    @property
+    def replaying(self) -> bool:
+        return self.mode == "replay"
+
+    @property
+    def recording(self) -> bool:
+        return self.mode == "record"
+
+    def load(self, path: str, mode: str = "replay", match: str = "strict") -> None:
+        """Inserts a cassette. Record mode truncates an existing file at `path`."""
+        if mode not in ("record", "replay"):
+            raise ValueError(f"Unknown cassette mode: {mode}")
+        if match not in ("strict", "fuzzy"):
+            raise ValueError(f"Unknown cassette match mode: {match}")
+
+        self.eject()
+        self.path, self.mode, self.match = path, mode, match
+
+        if mode == "record":
+            os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+            open(path, "w").close()
+        else:
+            if not os.path.exists(path):
+                raise FileNotFoundError(f"Cassette not found: {path}")
+            with open(path, "r", encoding="utf-8") as f:
+                for line in f:
+                    if line.strip():
+                        entry = json.loads(line)
+                        self._tracks.setdefault(entry[match], []).append(entry)
+        logger.info(f"CASSETTE: Loaded {path} ({mode}, {match}; {sum(len(t) for t in self._tracks.values())} tracks)")
+
+    def eject(self) -> None:
+        if self.mode != "off":
+            logger.info(f"CASSETTE: Ejected {self.path} (hits={self.hits}, misses={self.misses}, recorded={self.recorded})")
+        self.mode, self.path = "off", None
+        self._tracks.clear()
+        self._cursors.clear()
+        self.hits = self.misses = self.recorded = 0
+
+    @contextmanager
+    def use(self, path: str, mode: str = "replay", match: str = "strict") -> Iterator["LLMCassette"]:
+        """Scopes a cassette to a block, ejecting it afterwards."""
+        self.load(path, mode, match)
+        try:
+            yield self
+        finally:
+            self.eject()
+
+    @staticmethod
+    def _keys(
+        model: str,
+        messages: List[Dict[str, str]],
+        temperature: float,
+        response_model: Optional[type[BaseModel]]
+    ) -> Dict[str, str]:
+        system_prompt, user_prompt = messages[0]["content"], messages[-1]["content"]
+        schema_name = response_model.__name__ if response_model is not None else None
+        return {
+            "strict": build_request_key(model, system_prompt, user_prompt, temperature, response_model),
+            "fuzzy": build_request_key(model, _normalize(system_prompt), _normalize(f"{schema_name}|{user_prompt}"), 0.0, None),
+        }
+
+    def replay(
+        self,
+        model: str,
+        messages: List[Dict[str, str]],
+        temperature: float,
+        response_model: Optional[type[BaseModel]]
+    ) -> Dict[str, Any]:
+        """Returns the next recorded entry ({'kind', 'payload', 'tokens'}) for a request."""
+        key = self._keys(model, messages, temperature, response_model)[self.match]
+        track = self._tracks.get(key)
+        if not track:
+            self.misses += 1
+            raise CassetteMissError(f"No recorded response for {model} request {key[:12]} ({self.match} match)")
+
+        cursor = self._cursors.get(key, 0)
+        self._cursors[key] = cursor + 1
+        self.hits += 1
+        return track[min(cursor, len(track) - 1)]
+
+    def record(
+        self,
+        model: str,
+        messages: List[Dict[str, str]],
+        temperature: float,
+        response_model: Optional[type[BaseModel]],
+        result: Any,
+        tokens: int
+    ) -> None:
+        """Appends a live request/response pair to the cassette."""
+        if result is None:
+            return
+        entry = {
+            **self._keys(model, messages, temperature, response_model),
+            "model": model,
+            "kind": "text" if response_model is None else "model",
+            "payload": result if response_model is None else result.model_dump_json(),
+            "tokens": tokens or 0,
+        }
+        with open(self.path, "a", encoding="utf-8") as f:
+            f.write(json.dumps(entry, separators=(",", ":")) + "\n")
+        self.recorded += 1
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            "mode": self.mode,
+            "match": self.match,
+            "path": self.path,
+            "hits": self.hits,
+            "misses": self.misses,
+            "recorded": self.recorded,
+        }
+
+
+# Singleton cassette deck
+llm_cassette = LLMCassette()
@@ -0,0 +1,114 @@
+"""
+Process-wide registry of pooled LLM provider clients.
+Every ReasoningEngine borrows its client from here so a worker keeps one
+keep-alive connection pool per provider instead of one per component.
+"""
+from typing import Any, Dict, Optional, Tuple
+
+import httpx
+import openai
+
+from core_config import config
+from utils.logger import logger
+
+
+class LLMClientRegistry:
+    """
+    Lazily builds one AsyncOpenAI client per (provider, api_key), each backed by a
+    shared httpx connection pool with per-provider connection limits.
+
+    Borrowers get the SDK's own retries unless they pass `sdk_retries=False`, which only
+    callers whose 429/timeout backoff is owned by the adaptive limiter should do.
+    """
+
+    def __init__(
+        self,
+        max_connections: int = 64,
+        max_keepalive_connections: int = 32,
+        keepalive_expiry: float = 30.0,
+        request_timeout: float = 120.0,
+        provider_limits: Optional[Dict[str, int]] = None,
+    ):
+        self.max_connections = max_connections
+        self.max_keepalive_connections = max_keepalive_connections
+        self.keepalive_expiry = keepalive_expiry
+        self.request_timeout = request_timeout
+        self.provider_limits: Dict[str, int] = provider_limits or {}
+
+        self._clients: Dict[Tuple[str, str], openai.AsyncOpenAI] = {}
+        self._no_retry_clients: Dict[Tuple[str, str], openai.AsyncOpenAI] = {}
+        self._http_clients: Dict[Tuple[str, str], httpx.AsyncClient] = {}
+        self._borrows: Dict[Tuple[str, str], int] = {}
+
+    def _limits_for(self, provider: str) -> httpx.Limits:
+        max_conn = self.provider_limits.get(provider, self.max_connections)
+        return httpx.Limits(
+            max_connections=max_conn,
+            max_keepalive_connections=min(self.max_keepalive_connections, max_conn),
+            keepalive_expiry=self.keepalive_expiry,
+        )
+
+    def get_client(
+        self, provider: str = "openai", api_key: Optional[str] = None, sdk_retries: bool = True
+    ) -> openai.AsyncOpenAI:
+        """
+        Returns the shared client for a provider, creating its connection pool on first use.
+        With `sdk_retries=False` the client shares the same pool but never retries on its own.
+        """
+        if provider != "openai":
+            raise ValueError(f"Unsupported LLM provider: {provider}")
+
+        api_key = api_key or config.OPENAI_API_KEY or "dummy"
+        key = (provider, api_key)
+        client = self._clients.get(key)
+        if client is None:
+            http_client = httpx.AsyncClient(
+                limits=self._limits_for(provider),
+                timeout=httpx.Timeout(self.request_timeout, connect=10.0),
+            )
+            client = openai.AsyncOpenAI(api_key=api_key, http_client=http_client)
+            self._clients[key] = client
+            self._no_retry_clients[key] = client.with_options(max_retries=0)
+            self._http_clients[key] = http_client
+            self._borrows[key] = 0
+            logger.info(
+                f"LLM_CLIENTS: Pooled client created for '{provider}' "
+                f"(max_connections={self._limits_for(provider).max_connections})"
+            )
+
+        self._borrows[key] += 1
+        return client if sdk_retries else self._no_retry_clients[key]
+
+    async def aclose(self) -> None:
+        """Closes every pooled connection. Called on application shutdown."""
+        for key, http_client in list(self._http_clients.items()):
+            try:
+                await http_client.aclose()
+            except Exception as e:
+                logger.warning(f"LLM_CLIENTS: Failed to close pool for '{key[0]}': {e}")
+        self._clients.clear()
+        self._no_retry_clients.clear()
+        self._http_clients.clear()
+        self._borrows.clear()
+
+    def get_diagnostics(self) -> list:
+        """Returns pool configuration and borrower counts per provider (API keys are never exposed)."""
+        return [
+            {
+                "provider": provider,
+                "borrowers": self._borrows.get((provider, api_key), 0),
+                "max_connections": self._limits_for(provider).max_connections,
+                "max_keepalive_connections": self._limits_for(provider).max_keepalive_connections,
+                "keepalive_expiry": self.keepalive_expiry,
+            }
+            for provider, api_key in self._clients.keys()
+        ]
+
+
+# Singleton registry
+llm_client_registry = LLMClientRegistry(
+    max_connections=config.LLM_MAX_CONNECTIONS,
+    max_keepalive_connections=config.LLM_MAX_KEEPALIVE_CONNECTIONS,
+    keepalive_expiry=config.LLM_KEEPALIVE_EXPIRY,
+    request_timeout=config.LLM_REQUEST_TIMEOUT,
+)
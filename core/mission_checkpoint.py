@@ -0,0 +1,159 @@
+"""
+Durable per-stage checkpoints for swarm missions.
+Each completed stage's output is committed before the next stage starts, so a mission
+re-run under the same ID after a worker restart or provider failure skips finished stages.
+"""
+import asyncio
+import datetime
+import hashlib
+import json
+import re
+import uuid
+from typing import Any, Callable, Dict, Optional
+
+from pydantic import BaseModel
+
+from utils.logger import logger
+
+# Server-issued mission IDs: the first 8 hex digits of a uuid4. Client-supplied IDs (resume only)
+# must match exactly, since they end up in filesystem paths and checkpoint queries.
+MISSION_ID_PATTERN = re.compile(r"^[0-9a-f]{8}$")
+
+
+def new_mission_id() -> str:
+    return str(uuid.uuid4())[:8]
+
+
+def is_valid_mission_id(mission_id: Optional[str]) -> bool:
+    return bool(mission_id) and MISSION_ID_PATTERN.fullmatch(mission_id) is not None
+
+
+class StageCheckpoint(BaseModel):
+    """Output of one completed stage."""
+    stage: str
+    output: str
+    next_step_index: int
+
+
+class MissionCheckpointStore:
+    """
+    Reads and writes MissionCheckpoint rows. Writes are synchronous commits on a worker thread:
+    unlike trace steps, a checkpoint must be durable before the mission moves on.
+    """
+
+    def __init__(self, session_factory: Optional[Callable[[], Any]] = None):
+        self._session_factory = session_factory
+        self.saves = 0
+        self.stages_resumed = 0
+        self.rows_cleared = 0
+
+    def _session(self) -> Any:
+        if self._session_factory is None:
+            from api.usage_db import SessionLocal
+            self._session_factory = SessionLocal
+        return self._session_factory()
+
+    @staticmethod
+    def fingerprint(objective: str, swarm_config: Dict[str, Any]) -> str:
+        payload = json.dumps({"objective": objective, "config": swarm_config}, sort_keys=True, default=str)
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    async def save(self, mission_id: str, objective: str, swarm_config: Dict[str, Any], checkpoint: StageCheckpoint, user_id: Optional[str] = None) -> None:
+        """Persists a stage output, replacing any earlier checkpoint of the same stage."""
+        try:
+            await asyncio.to_thread(self._save, mission_id, objective, swarm_config, checkpoint, user_id)
+            self.saves += 1
+        except Exception as e:
+            # A lost checkpoint only costs a re-run of this stage on resume
+            logger.error(f"CHECKPOINT: Failed to persist {mission_id}/{checkpoint.stage}: {e}")
+
+    def _save(self, mission_id: str, objective: str, swarm_config: Dict[str, Any], checkpoint: StageCheckpoint, user_id: Optional[str]) -> None:
+        from api.usage_db import MissionCheckpoint
+        with self._session() as db:
+            db.query(MissionCheckpoint).filter(
+                MissionCheckpoint.mission_id == mission_id,
+                MissionCheckpoint.stage == checkpoint.stage
+            ).delete()
+            db.add(MissionCheckpoint(
+                mission_id=mission_id,
+                user_id=user_id,
+                stage=checkpoint.stage,
+                fingerprint=self.fingerprint(objective, swarm_config),
+                objective=objective,
+                config_json=json.dumps(swarm_config, default=str),
+                output=checkpoint.output,
+                next_step_index=checkpoint.next_step_index
+            ))
+            db.commit()
+
+    async def load(self, mission_id: str, objective: str, swarm_config: Dict[str, Any], user_id: Optional[str] = None) -> Dict[str, StageCheckpoint]:
+        """
+        Returns stage -> checkpoint for the mission, ignoring checkpoints of a different objective,
+        config or owner.
+        """
+        try:
+            return await asyncio.to_thread(self._load, mission_id, self.fingerprint(objective, swarm_config), user_id)
+        except Exception as e:
+            logger.error(f"CHECKPOINT: Failed to load checkpoints for {mission_id}: {e}")
+            return {}
+
+    def _load(self, mission_id: str, fingerprint: str, user_id: Optional[str]) -> Dict[str, StageCheckpoint]:
+        from api.usage_db import MissionCheckpoint
+        with self._session() as db:
+            rows = db.query(MissionCheckpoint).filter(
+                MissionCheckpoint.mission_id == mission_id,
+                MissionCheckpoint.fingerprint == fingerprint,
+                MissionCheckpoint.user_id == user_id
+            ).all()
+            return {
+                row.stage: StageCheckpoint(stage=row.stage, output=row.output or "", next_step_index=row.next_step_index or 0)
+                for row in rows
+            }
+
+    async def get_mission_spec(self, mission_id: str) -> Optional[Dict[str, Any]]:
+        """Returns the objective and swarm config a mission was checkpointed with, if any."""
+        def query() -> Optional[Dict[str, Any]]:
+            from api.usage_db import MissionCheckpoint
+            with self._session() as db:
+                row = db.query(MissionCheckpoint).filter(
+                    MissionCheckpoint.mission_id == mission_id
+                ).order_by(MissionCheckpoint.created_at.desc()).first()
+                if row is None:
+                    return None
+                return {"objective": row.objective, "config": json.loads(row.config_json or "{}")}
+        return await asyncio.to_thread(query)
+
+    async def get_owner(self, mission_id: str) -> Optional[str]:
+        """Returns the user that owns a checkpointed mission, or None if it has no checkpoints."""
+        def query() -> Optional[str]:
+            from api.usage_db import MissionCheckpoint
+            with self._session() as db:
+                row = db.query(MissionCheckpoint.user_id).filter(MissionCheckpoint.mission_id == mission_id).first()
+                return row.user_id if row else None
+        return await asyncio.to_thread(query)
+
+    async def clear(self, mission_id: str, retention_hours: Optional[float] = None) -> None:
+        """
+        Deletes a finished mission's checkpoints and, with `retention_hours`, any checkpoint older
+        than that (missions that failed and were never resumed).
+        """
+        def delete() -> int:
+            from api.usage_db import MissionCheckpoint
+            with self._session() as db:
+                deleted = db.query(MissionCheckpoint).filter(MissionCheckpoint.mission_id == mission_id).delete()
+                if retention_hours is not None:
+                    cutoff = datetime.datetime.utcnow() - datetime.timedelta(hours=retention_hours)
+                    deleted += db.query(MissionCheckpoint).filter(MissionCheckpoint.created_at < cutoff).delete()
+                db.commit()
+                return deleted
+        try:
+            self.rows_cleared += await asyncio.to_thread(delete)
+        except Exception as e:
+            logger.error(f"CHECKPOINT: Failed to clear checkpoints for {mission_id}: {e}")
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {"saves": self.saves, "stages_resumed": self.stages_resumed, "rows_cleared": self.rows_cleared}
+
+
+# Singleton checkpoint store
+mission_checkpoints = MissionCheckpointStore()
@@ -0,0 +1,159 @@
+"""
+Registry of running missions and their cancellation tokens.
+Cancelling a mission cancels the asyncio task driving it, which aborts in-flight provider
+requests and sandbox subprocesses at their current await. Long-running loops also poll
+`check_cancelled()` at stage and step boundaries as a backstop.
+"""
+import asyncio
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Dict, Iterator, List, Optional, Set
+
+from utils.logger import logger
+
+
+class MissionCancelled(Exception):
+    """
+    Raised to the caller of a mission that was cancelled through the registry.
+    Carries the token usage accumulated up to the cancellation for settlement.
+    """
+
+    def __init__(self, mission_id: str, reason: str, token_usage: Optional[Dict[str, Any]] = None):
+        super().__init__(f"Mission {mission_id} cancelled: {reason}")
+        self.mission_id = mission_id
+        self.reason = reason
+        self.token_usage = token_usage or {}
+
+
+class CancellationToken:
+    """
+    Cancellation state of one mission. A token is also cancelled when any enclosing
+    mission's token is (e.g. a Forge branch when its session is killed).
+    """
+
+    def __init__(self, mission_id: str, parent: Optional["CancellationToken"] = None):
+        self.mission_id = mission_id
+        self.parent = parent
+        self.reason: Optional[str] = None
+        self.started_at = time.time()
+        self._tasks: Set[asyncio.Task] = set()
+
+    @property
+    def cancelled(self) -> bool:
+        token: Optional[CancellationToken] = self
+        while token is not None:
+            if token.reason is not None:
+                return True
+            token = token.parent
+        return False
+
+    @property
+    def cancel_reason(self) -> Optional[str]:
+        token: Optional[CancellationToken] = self
+        while token is not None:
+            if token.reason is not None:
+                return token.reason
+            token = token.parent
+        return None
+
+    def cancel(self, reason: str) -> None:
+        if self.reason is not None:
+            return
+        self.reason = reason
+        for task in list(self._tasks):
+            if not task.done():
+                task.cancel(msg=f"Mission {self.mission_id} cancelled: {reason}")
+
+    def raise_if_cancelled(self) -> None:
+        if self.cancelled:
+            raise asyncio.CancelledError(f"Mission {self.mission_id} cancelled: {self.cancel_reason}")
+
+
+_current_token: ContextVar[Optional[CancellationToken]] = ContextVar("cancellation_token", default=None)
+
+
+def current_cancellation_token() -> Optional[CancellationToken]:
+    return _current_token.get()
+
+
+def check_cancelled() -> None:
+    """Cooperative checkpoint: raises CancelledError if the current mission was cancelled."""
+    token = _current_token.get()
+    if token is not None:
+        token.raise_if_cancelled()
+
+
+def acknowledge_cancellation() -> None:
+    """
+    Withdraws the current task's pending cancel request after a registry cancellation was
+    caught, so the mission can finish by raising MissionCancelled to its caller.
+    """
+    task = asyncio.current_task()
+    if task is not None and task.cancelling():
+        task.uncancel()
+
+
+class MissionRegistry:
+    """
+    Process-local map of mission id -> CancellationToken for every mission in flight.
+    """
+
+    def __init__(self):
+        self._tokens: Dict[str, CancellationToken] = {}
+        self.cancellations = 0
+
+    @contextmanager
+    def track(self, mission_id: str) -> Iterator[CancellationToken]:
+        """
+        Registers the current task as the driver of `mission_id` for the duration of the block.
+        """
+        token = CancellationToken(mission_id, parent=_current_token.get())
+        task = asyncio.current_task()
+        if task is not None:
+            token._tasks.add(task)
+        self._tokens[mission_id] = token
+        context_token = _current_token.set(token)
+        try:
+            yield token
+        finally:
+            _current_token.reset(context_token)
+            if self._tokens.get(mission_id) is token:
+                del self._tokens[mission_id]
+
+    def cancel(self, mission_id: str, reason: str = "Cancelled by operator") -> bool:
+        token = self._tokens.get(mission_id)
+        if token is None:
+            return False
+        logger.warning(f"MISSION_REGISTRY: Cancelling {mission_id}: {reason}")
+        self.cancellations += 1
+        token.cancel(reason)
+        return True
+
+    def list_active(self) -> List[Dict[str, Any]]:
+        now = time.time()
+        return [
+            {
+                "mission_id": mission_id,
+                "parent": token.parent.mission_id if token.parent else None,
+                "running_seconds": round(now - token.started_at, 1),
+                "cancelling": token.cancelled,
+            }
+            for mission_id, token in self._tokens.items()
+        ]
+
+
+def settle_prepaid_cost(prepaid_cost: float, token_usage: Dict[str, Any]) -> float:
+    """
+    Portion of an upfront mission charge to refund after cancellation: the share of the
+    mission's token budget that was never consumed.
+    """
+    limit = token_usage.get("limit")
+    if not prepaid_cost or not limit:
+        return 0.0
+    consumed = min(1.0, max(0.0, token_usage.get("used", 0) / limit))
+    return round(prepaid_cost * (1.0 - consumed), 4)
+
+
+# Singleton registry
+mission_registry = MissionRegistry()
@@ -0,0 +1,157 @@
+"""
+Model cascade routing for the Reasoning Engine.
+Cheap call sites try SECONDARY_MODEL first and escalate to the primary model only
+when schema validation or a per-site acceptance check fails.
+"""
+import json
+import re
+from typing import Any, Callable, Dict, List, Optional
+
+from core_config import config
+from utils.logger import logger
+
+
+class CascadePolicy:
+    """
+    Describes how a single call site (or agent role) cascades across model tiers.
+
+    `accept` receives the parsed result of a cheap tier and returns True if it is good
+    enough to keep. The final tier's result is always accepted.
+    """
+
+    def __init__(
+        self,
+        call_site: str,
+        accept: Optional[Callable[[Any], bool]] = None,
+        tiers: Optional[List[str]] = None,
+        description: str = "",
+    ):
+        self.call_site = call_site
+        self.accept = accept or (lambda result: True)
+        self._tiers = tiers
+        self.description = description
+
+    @property
+    def tiers(self) -> List[str]:
+        """Models to try in order. Resolved lazily so config overrides apply at runtime."""
+        tiers = self._tiers or [config.SECONDARY_MODEL, config.DEFAULT_MODEL]
+        # Collapse duplicates (e.g. when both config models point at the same deployment) and unset models
+        return [model for model in dict.fromkeys(tiers) if model]
+
+
+def _min_confidence(field: str, threshold: float) -> Callable[[Any], bool]:
+    return lambda result: float(getattr(result, field, 0.0) or 0.0) >= threshold
+
+
+_JSON_FENCE = re.compile(r"```(?:json)?\s*\n?(.*?)```", re.DOTALL)
+
+
+def extract_json(text: str) -> Any:
+    """
+    Parses the JSON body of a model response, tolerating markdown fences and surrounding prose.
+    Raises ValueError if no JSON value can be found.
+    """
+    if not isinstance(text, str):
+        raise ValueError("Response is not text.")
+    fenced = _JSON_FENCE.search(text)
+    candidate = (fenced.group(1) if fenced else text).strip()
+    try:
+        return json.loads(candidate)
+    except ValueError:
+        start = min((i for i in (candidate.find("{"), candidate.find("[")) if i >= 0), default=-1)
+        if start < 0:
+            raise
+        value, _ = json.JSONDecoder().raw_decode(candidate[start:])
+        return value
+
+
+def _json_min_confidence(threshold: float) -> Callable[[Any], bool]:
+    """Acceptance check for text responses that are expected to carry a JSON body with `confidence`."""
+    def check(result: Any) -> bool:
+        try:
+            data = extract_json(result)
+        except ValueError:
+            return False
+        return isinstance(data, dict) and float(data.get("confidence", 0.0) or 0.0) >= threshold
+    return check
+
+
+# Call site -> cascade policy. Sites not listed here always use the requested model.
+CASCADE_POLICIES: Dict[str, CascadePolicy] = {
+    "planner.create_plan": CascadePolicy(
+        "planner.create_plan",
+        accept=lambda plan: len(plan.tasks) > 0,
+        description="Goal decomposition; escalate on empty plans.",
+    ),
+    "recovery.analyze_failure": CascadePolicy(
+        "recovery.analyze_failure",
+        accept=_min_confidence("confidence_in_fix", 0.6),
+        description="Failure diagnosis; escalate on low-confidence fixes.",
+    ),
+    "memory.compress_episode": CascadePolicy(
+        "memory.compress_episode",
+        accept=lambda summary: bool(summary.compressed_fact.strip()),
+        description="Episode compression; escalate on empty distillations.",
+    ),
+    "safety.evaluate_action": CascadePolicy(
+        "safety.evaluate_action",
+        accept=lambda check: check.is_safe,
+        description="Ethical screening; unsafe verdicts are confirmed by the primary model.",
+    ),
+    "coordinator.route_mission": CascadePolicy(
+        "coordinator.route_mission",
+        accept=_json_min_confidence(0.6),
+        description="Cluster routing; escalate on unparsable or low-confidence verdicts.",
+    ),
+}
+
+
+def get_cascade_policy(call_site: Optional[str]) -> Optional[CascadePolicy]:
+    if not call_site or not config.ENABLE_MODEL_CASCADE:
+        return None
+    return CASCADE_POLICIES.get(call_site)
+
+
+class CascadeStats:
+    """
+    Per-site counters for how often cheap tiers were accepted versus escalated.
+    """
+
+    def __init__(self):
+        self._sites: Dict[str, Dict[str, Any]] = {}
+
+    def _site(self, call_site: str) -> Dict[str, Any]:
+        if call_site not in self._sites:
+            self._sites[call_site] = {
+                "calls": 0,
+                "escalations": 0,
+                "schema_failures": 0,
+                "check_failures": 0,
+                "accepted_by_model": {},
+            }
+        return self._sites[call_site]
+
+    def record_escalation(self, call_site: str, from_model: str, reason: str) -> None:
+        site = self._site(call_site)
+        site["escalations"] += 1
+        site["schema_failures" if reason == "schema" else "check_failures"] += 1
+        logger.info(f"CASCADE: [{call_site}] Escalating from {from_model} ({reason} check failed)")
+
+    def record_accept(self, call_site: str, model: str) -> None:
+        site = self._site(call_site)
+        site["calls"] += 1
+        site["accepted_by_model"][model] = site["accepted_by_model"].get(model, 0) + 1
+
+    def get_diagnostics(self) -> Dict[str, Any]:
+        report = {}
+        for call_site, site in self._sites.items():
+            calls = site["calls"]
+            report[call_site] = {
+                **site,
+                "escalation_rate": round(site["escalations"] / calls, 4) if calls else 0.0,
+            }
+        return report
+
+
+# Process-wide escalation counters
+cascade_stats = CascadeStats()
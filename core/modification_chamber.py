@@ -4,7 +4,7 @@ Handles sandboxed A/B testing of evolved swarm architectures against a frozen co
 """
 from typing import Dict, List, Any, Optional
 from pydantic import BaseModel
-from core.swarm_orchestrator import SwarmOrchestrator
+from core.swarm_orchestrator import SwarmOrchestrator, DEFAULT_SWARM_CONFIG
 from agents.swarm_profiles import AGENT_REGISTRY
 from core.stability_engine import StabilityEngine
 from utils.logger import logger
@@ -51,13 +51,15 @@ class SelfModificationChamber:
         # 1. Run Baseline (Control)
         # We manually swap the registry for the test duration
         original_registry = self.orchestrator.active_agents.copy()
+        # Both arms must generate their own plans, not replay a cached one
+        ab_config = {**DEFAULT_SWARM_CONFIG, "stage_cache": False}
         self.orchestrator.active_agents = self.frozen_baseline
-        res_a = await self.orchestrator.execute_swarm_objective(objective)
+        res_a = await self.orchestrator.execute_swarm_objective(objective, config=ab_config)
         fit_a = self.stability.calculate_fitness({"avg_complexity": 10, "test_success_rate": 1.0}) # Simplified mock metrics
         
         # 2. Run Proposed (Experiment)
         self.orchestrator.active_agents = self.active_test.proposed_agents
-        res_b = await self.orchestrator.execute_swarm_objective(objective)
+        res_b = await self.orchestrator.execute_swarm_objective(objective, config=ab_config)
         fit_b = self.stability.calculate_fitness({"avg_complexity": 8, "test_success_rate": 1.0}) # Simplified mock metrics favoring improvement
 
         delta = fit_b - fit_a
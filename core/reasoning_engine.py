@@ -2,14 +2,28 @@
 LLM abstraction layer and reasoning context engine.
 Handles generic inference requests against language models and enforces strict responses.
 """
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Tuple, AsyncIterator, Callable, Sequence
+import asyncio
 import openai
 import json
+import random
+import re
+import time
 from pydantic import BaseModel, ValidationError
 
 from core_config import config
 from utils.logger import logger
 from core.token_controller import TokenController
+from core.response_cache import response_cache, build_request_key
+from core.request_coalescer import request_coalescer
+from core.llm_client_registry import llm_client_registry
+from core.adaptive_limiter import limiter_registry
+from core.model_cascade import CascadePolicy, get_cascade_policy, cascade_stats
+from core.batch_inference import get_batch_queue, build_chat_body
+from core.llm_cassette import llm_cassette
+from core.incremental_json import IncrementalObjectParser
+from metrics.llm_metrics import llm_metrics, current_call_site, role_for_call_site
+from core.request_hedger import request_hedger
 
 
 class ReasoningEngine:
@@ -49,10 +63,18 @@ class ReasoningEngine:
                 logger.warning("OPENAI_API_KEY is missing. Falling back to simulation mode.")
                 config.USE_MOCK = True
             
-            # Note: We still initialize a client skeleton if mock is on for architecture consistency
-            self.client = openai.AsyncOpenAI(api_key=config.OPENAI_API_KEY or "dummy")
+            # Note: We still initialize a client skeleton if mock is on for architecture consistency.
+            # The client is borrowed from the process-wide pool rather than built per engine.
+            # SDK retries are off: 429/timeout backoff is owned by the adaptive limiter.
+            self.client = llm_client_registry.get_client("openai", config.OPENAI_API_KEY, sdk_retries=False)
             
         self.model = config.DEFAULT_MODEL
+        self.limiter = limiter_registry.get_or_create(
+            "openai",
+            initial_limit=config.LLM_INITIAL_CONCURRENCY,
+            min_limit=config.LLM_MIN_CONCURRENCY,
+            max_limit=config.LLM_MAX_CONCURRENCY,
+        )
         self.tokens = TokenController(model_name=self.model)
         self.system_prompt: str = "You are a helpful AGI core."
         logger.info(f"ReasoningEngine initialized with model: {self.model} (MockMode: {config.USE_MOCK})")
@@ -63,7 +85,10 @@ class ReasoningEngine:
         user_prompt: str,
         temperature: float = 0.5,
         response_model: Optional[type[BaseModel]] = None,
-        model_override: Optional[str] = None
+        model_override: Optional[str] = None,
+        call_site: Optional[str] = None,
+        static_context: Optional[List[str]] = None,
+        batch: bool = False
     ) -> Any:
         """
         Generates a response from the LLM, optionally constrained to a Pydantic schema.
@@ -73,78 +98,586 @@ class ReasoningEngine:
             user_prompt (str): Task execution input.
             temperature (float): The reasoning temperature (hallucination variable).
             response_model (Optional[type[BaseModel]]): A Pydantic model type to parse the output against.
+            model_override (Optional[str]): Forces a specific model and bypasses cascade routing.
+            call_site (Optional[str]): Stable identifier of the caller (e.g. 'recovery.analyze_failure'),
+                used to look up its model cascade policy.
+            static_context (Optional[List[str]]): Ordered blocks that rarely change between calls
+                (tool schemas, learned heuristics). Placed after the persona, ahead of all volatile input.
+            batch (bool): Marks the call as non-interactive. When ENABLE_BATCH_INFERENCE is on, the request
+                is queued for the provider's batch API and may take minutes to hours to resolve.
 
         Returns:
             Any: A string if response_model is None, else a parsed Pydantic instance.
         """
-        messages = [
-            {"role": "system", "content": system_prompt or self.system_prompt},
+        messages = self._build_messages(system_prompt, user_prompt, static_context)
+        call_site_token = current_call_site.set(call_site)
+
+        try:
+            # Bypass limit check and generation if in mock mode (a replaying cassette takes precedence)
+            if config.USE_MOCK and not llm_cassette.replaying:
+                return await self._generate_mock_response(user_prompt, response_model)
+
+            policy = None if model_override else get_cascade_policy(call_site)
+            batch = batch and config.ENABLE_BATCH_INFERENCE
+            if policy is not None:
+                return await self._generate_cascaded(policy, messages, temperature, response_model, batch)
+            return await self._generate(messages, model_override or self.model, temperature, response_model, batch)
+
+        except Exception as e:
+            return await self._handle_generation_error(e, user_prompt, response_model)
+        finally:
+            current_call_site.reset(call_site_token)
+
+    def _build_messages(self, system_prompt: str, user_prompt: str, static_context: Optional[List[str]] = None) -> List[Dict[str, str]]:
+        """
+        Assembles the chat payload with every static block ahead of volatile content.
+        Provider prompt caching matches on exact prefixes, so the system message is built only
+        from stable parts in a fixed order: persona first, then each static block as given.
+        """
+        blocks = [system_prompt or self.system_prompt] + [block for block in (static_context or []) if block]
+        return [
+            {"role": "system", "content": "\n\n".join(blocks)},
             {"role": "user", "content": user_prompt}
         ]
 
+    async def _generate_cascaded(
+        self,
+        policy: CascadePolicy,
+        messages: List[Dict[str, str]],
+        temperature: float,
+        response_model: Optional[type[BaseModel]],
+        batch: bool = False
+    ) -> Any:
+        """
+        Walks the policy's model tiers cheapest-first, escalating when the schema or acceptance check fails.
+        """
+        tiers = policy.tiers or [self.model]
+        for i, model in enumerate(tiers):
+            is_last = i == len(tiers) - 1
+            try:
+                result = await self._generate(messages, model, temperature, response_model, batch)
+            except (ValidationError, ValueError) as e:
+                if is_last:
+                    raise
+                cascade_stats.record_escalation(policy.call_site, model, "schema")
+                logger.debug(f"CASCADE: [{policy.call_site}] {model} schema failure: {e}")
+                continue
+
+            if is_last:
+                cascade_stats.record_accept(policy.call_site, model)
+                return result
+
+            try:
+                accepted = policy.accept(result)
+            except Exception:
+                accepted = False
+            if accepted:
+                cascade_stats.record_accept(policy.call_site, model)
+                return result
+            cascade_stats.record_escalation(policy.call_site, model, "confidence")
+
+    async def _generate(
+        self,
+        messages: List[Dict[str, str]],
+        model: str,
+        temperature: float,
+        response_model: Optional[type[BaseModel]],
+        batch: bool = False
+    ) -> Any:
+        """
+        Single-model generation through the cache, coalescing and upstream layers. Raises on failure.
+        Batch requests skip coalescing and the live provider path, going through the batch queue instead.
+        """
+        user_prompt = messages[-1]["content"]
+
+        if llm_cassette.replaying:
+            entry = llm_cassette.replay(model, messages, temperature, response_model)
+            self.tokens.track_usage(entry["tokens"])
+            return self._decode_cached(entry, response_model)
+
+        # Serve replayed prompts from the response cache when enabled
+        request_key = None
+        if config.ENABLE_RESPONSE_CACHE or config.ENABLE_REQUEST_COALESCING:
+            request_key = build_request_key(model, messages[0]["content"], user_prompt, temperature, response_model)
+
+        # While recording, every request must reach the provider so the cassette is complete
+        if config.ENABLE_RESPONSE_CACHE and not llm_cassette.recording:
+            cached = await response_cache.get(request_key)
+            if cached is not None:
+                logger.debug(f"RESPONSE_CACHE: Hit ({cached['kind']}) for {request_key[:12]}")
+                return self._decode_cached(cached, response_model)
+
+        if batch:
+            return await self._generate_batched(messages, model, temperature, response_model, request_key)
+
+        # Identical concurrent requests share a single upstream call
+        if config.ENABLE_REQUEST_COALESCING:
+            return await request_coalescer.run(
+                request_key,
+                lambda: self._generate_upstream(messages, model, temperature, response_model, request_key)
+            )
+        return await self._generate_upstream(messages, model, temperature, response_model, request_key)
+
+    async def stream_response(
+        self,
+        system_prompt: str,
+        user_prompt: str,
+        temperature: float = 0.5,
+        model_override: Optional[str] = None,
+        static_context: Optional[List[str]] = None,
+        call_site: Optional[str] = None
+    ) -> AsyncIterator[str]:
+        """
+        Streams a text completion from the LLM as it is generated.
+
+        Args:
+            system_prompt (str): High-level system instructions.
+            user_prompt (str): Task execution input.
+            temperature (float): The reasoning temperature (hallucination variable).
+
+        Yields:
+            str: Content deltas in arrival order. Joined, they equal the full completion.
+        """
+        messages = self._build_messages(system_prompt, user_prompt, static_context)
+        model = model_override or self.model
+
+        if llm_cassette.replaying:
+            entry = llm_cassette.replay(model, messages, temperature, None)
+            self.tokens.track_usage(entry["tokens"])
+            yield entry["payload"]
+            return
+
+        if config.USE_MOCK:
+            mock_text = await self._generate_mock_response(user_prompt, None)
+            for piece in re.findall(r"\S+\s*", mock_text):
+                yield piece
+            return
+
+        request_key = None
+        if config.ENABLE_RESPONSE_CACHE:
+            request_key = build_request_key(model, messages[0]["content"], user_prompt, temperature, None)
+            cached = None if llm_cassette.recording else await response_cache.get(request_key)
+            if cached is not None:
+                yield cached["payload"]
+                return
+
+        if not self.tokens.check_limit():
+            raise RuntimeError("Token limit reached. Aborting generation.")
+
         try:
-            # Bypass limit check and generation if in mock mode
-            if config.USE_MOCK:
-                return await self._generate_mock_response(user_prompt, response_model)
+            await self.limiter.acquire(timeout=config.LLM_QUEUE_DEADLINE)
+        except asyncio.TimeoutError:
+            raise RuntimeError(f"LLM request deadline exceeded after {config.LLM_QUEUE_DEADLINE:.0f}s in queue")
+
+        started = time.perf_counter()
+        first_token_at: Optional[float] = None
+        parts: List[str] = []
+        usage = None
+        usage_detail = None
+        overloaded = False
+        try:
+            stream = await self.client.chat.completions.create(
+                model=model,
+                messages=messages,
+                temperature=temperature,
+                stream=True,
+                stream_options={"include_usage": True},
+            )
+            async for chunk in stream:
+                if getattr(chunk, "usage", None):
+                    usage = chunk.usage.total_tokens
+                    usage_detail = chunk.usage
+                    self._track_prompt_usage(chunk.usage)
+                if not chunk.choices:
+                    continue
+                delta = chunk.choices[0].delta.content
+                if delta:
+                    if first_token_at is None:
+                        first_token_at = time.perf_counter()
+                    parts.append(delta)
+                    yield delta
+        except Exception as e:
+            overloaded = self._is_overload_error(e)
+            llm_metrics.record_call(call_site, model, time.perf_counter() - started, error=e,
+                                    ttft=first_token_at - started if first_token_at else None)
+            if parts:
+                # Can't splice a fallback into a half-delivered stream
+                logger.error(f"ReasoningEngine stream interrupted after {len(parts)} chunks: {e}")
+                raise RuntimeError(f"Engine stream error: {e}")
+            fallback = await self._handle_generation_error(e, user_prompt, None)
+            yield fallback
+            return
+        finally:
+            await self.limiter.release(overloaded=overloaded, succeeded=not overloaded and bool(parts))
 
-            # Enforce token limit check before generation
-            if not self.tokens.check_limit():
-                raise RuntimeError("Token limit reached. Aborting generation.")
+        content = "".join(parts)
+        usage = usage or self.tokens.count_tokens(content)
+        self.tokens.track_usage(usage)
+        llm_metrics.record_call(
+            call_site, model, time.perf_counter() - started,
+            ttft=first_token_at - started if first_token_at else None,
+            prompt_tokens=getattr(usage_detail, "prompt_tokens", None),
+            completion_tokens=getattr(usage_detail, "completion_tokens", None),
+        )
+        if llm_cassette.recording:
+            llm_cassette.record(model, messages, temperature, None, content, usage)
+        if request_key and content:
+            await response_cache.put(request_key, kind="text", payload=content, tokens=usage, latency=time.perf_counter() - started)
 
-            # Standard text generation
-            if response_model is None:
-                response = await self.client.chat.completions.create(
-                    model=model_override or self.model,
-                    messages=messages,
-                    temperature=temperature,
-                )
-                content = response.choices[0].message.content
-                # Track usage
-                usage = response.usage.total_tokens if response.usage else self.tokens.count_tokens(content)
-                self.tokens.track_usage(usage)
-                return content
-
-            # Structured JSON parsing
-            else:
-                response = await self.client.beta.chat.completions.parse(
-                    model=model_override or self.model,
-                    messages=messages,
-                    response_format=response_model,
-                    temperature=temperature,
-                )
-                parsed_response = response.choices[0].message.parsed
-                if parsed_response is None:
-                    raise ValueError("Model failed to adhere to the required JSON schema.")
-                
-                # Track usage
-                usage = response.usage.total_tokens if hasattr(response, 'usage') and response.usage else self.tokens.count_tokens(str(parsed_response))
-                self.tokens.track_usage(usage or 0)
-                
-                return parsed_response
+    async def stream_structured_response(
+        self,
+        system_prompt: str,
+        user_prompt: str,
+        response_model: type[BaseModel],
+        early_fields: Sequence[str],
+        on_early: Callable[[Dict[str, Any]], None],
+        temperature: float = 0.5,
+        model_override: Optional[str] = None,
+        static_context: Optional[List[str]] = None,
+        call_site: Optional[str] = None
+    ) -> BaseModel:
+        """
+        Streams a structured completion, parsing the JSON incrementally.
+
+        `on_early` is called once, with the raw decoded values of `early_fields`, as soon as all of
+        them are complete in the stream (so fields declared first in the schema arrive first).
+        It must not block; schedule any work it starts. Mock, replay and cache paths call it
+        with the final values before returning.
+
+        Returns:
+            BaseModel: The fully validated response_model instance.
+        """
+        messages = self._build_messages(system_prompt, user_prompt, static_context)
+        model = model_override or self.model
+        parser = IncrementalObjectParser(early_fields, on_early)
+
+        def emit_from(result: BaseModel) -> BaseModel:
+            if not parser.ready:
+                parser.ready = True
+                dumped = result.model_dump()
+                on_early({name: dumped.get(name) for name in early_fields})
+            return result
+
+        request_key = None
+        if config.ENABLE_RESPONSE_CACHE:
+            request_key = build_request_key(model, messages[0]["content"], user_prompt, temperature, response_model)
+            cached = None if llm_cassette.recording else await response_cache.get(request_key)
+            if cached is not None:
+                return emit_from(self._decode_cached(cached, response_model))
+
+        if config.USE_MOCK or llm_cassette.replaying:
+            return emit_from(await self.generate_response(
+                system_prompt, user_prompt, temperature, response_model, model_override,
+                call_site=call_site, static_context=static_context
+            ))
+
+        if not self.tokens.check_limit():
+            raise RuntimeError("Token limit reached. Aborting generation.")
 
+        try:
+            await self.limiter.acquire(timeout=config.LLM_QUEUE_DEADLINE)
+        except asyncio.TimeoutError:
+            raise RuntimeError(f"LLM request deadline exceeded after {config.LLM_QUEUE_DEADLINE:.0f}s in queue")
+
+        started = time.perf_counter()
+        first_token_at: Optional[float] = None
+        overloaded = False
+        succeeded = False
+        failure: Optional[Exception] = None
+        try:
+            async with self.client.beta.chat.completions.stream(
+                model=model,
+                messages=messages,
+                response_format=response_model,
+                temperature=temperature,
+                stream_options={"include_usage": True},
+            ) as stream:
+                async for event in stream:
+                    if event.type == "content.delta":
+                        if first_token_at is None:
+                            first_token_at = time.perf_counter()
+                        parser.feed(event.delta)
+                completion = await stream.get_final_completion()
+
+            result = completion.choices[0].message.parsed
+            if result is None:
+                raise ValueError("Model failed to adhere to the required JSON schema.")
+            succeeded = True
         except Exception as e:
+            overloaded = self._is_overload_error(e)
+            failure = e
+        finally:
+            llm_metrics.record_call(
+                call_site, model, time.perf_counter() - started, error=failure,
+                ttft=first_token_at - started if first_token_at else None,
+                prompt_tokens=getattr(completion.usage, "prompt_tokens", None) if succeeded else None,
+                completion_tokens=getattr(completion.usage, "completion_tokens", None) if succeeded else None,
+            )
+            await self.limiter.release(overloaded=overloaded, succeeded=succeeded)
+
+        if failure is not None:
+            if parser.ready:
+                # The caller has already acted on the early fields; a silent substitute would diverge
+                logger.error(f"ReasoningEngine structured stream failed after early fields were emitted: {failure}")
+                raise RuntimeError(f"Engine stream error: {failure}")
+            if overloaded:
+                # Nothing delivered yet: retry through the backpressured non-streaming path
+                return emit_from(await self.generate_response(
+                    system_prompt, user_prompt, temperature, response_model, model_override,
+                    call_site=call_site, static_context=static_context
+                ))
+            return emit_from(await self._handle_generation_error(failure, user_prompt, response_model))
+
+        usage = completion.usage.total_tokens if completion.usage else self.tokens.count_tokens(parser.text)
+        self._track_prompt_usage(completion.usage)
+        self.tokens.track_usage(usage)
+        if llm_cassette.recording:
+            llm_cassette.record(model, messages, temperature, response_model, result, usage)
+        await self._store_in_cache(request_key, result, response_model, usage, time.perf_counter() - started)
+        return emit_from(result)
+
+    async def _handle_generation_error(self, e: Exception, user_prompt: str, response_model: Optional[type[BaseModel]]) -> Any:
+        """
+        Classifies a provider failure. Returns a simulated response when auto-fallback applies, otherwise raises.
+        """
+        err_msg = str(e).lower()
+
+        # 1. Detect Quota/Billing Exhaustion (429)
+        if "insufficient_quota" in err_msg or "quota_exceeded" in err_msg:
+            logger.critical("CRITICAL: OpenAI API Quota Exceeded. Verify billing at https://platform.openai.com/account/billing")
+
+            if config.ENABLE_AUTO_MOCK_FALLBACK:
+                logger.warning("AUTO-FALLBACK: Engaging Simulation Mode (Mock) to maintain platform availability.")
+                config.USE_MOCK = True
+                return await self._generate_mock_response(user_prompt, response_model)
+
+            raise RuntimeError("MISSION_FAILED: LLM Provider Quota Exceeded. Please check OpenAI billing.")
+
+        # 2. General OpenAI API Errors
+        if "openai" in err_msg:
+            logger.error(f"ReasoningEngine hit provider error: {e}")
+            raise RuntimeError(f"Engine provider error: {e}")
+
+        # 3. Generic Fallback
+        logger.error(f"ReasoningEngine failed during generation: {e}")
+        raise RuntimeError(f"Engine generation error: {e}")
+
+    async def _generate_upstream(
+        self,
+        messages: List[Dict[str, str]],
+        model: str,
+        temperature: float,
+        response_model: Optional[type[BaseModel]],
+        request_key: Optional[str]
+    ) -> Any:
+        """
+        Budget-checked provider call that tracks usage and populates the response cache.
+        """
+        # Enforce token limit check before generation
+        if not self.tokens.check_limit():
+            raise RuntimeError("Token limit reached. Aborting generation.")
+
+        started = time.perf_counter()
+        role = role_for_call_site(current_call_site.get())
+        if config.ENABLE_REQUEST_HEDGING and role in config.HEDGE_ROLES:
+            hedge_model = config.SECONDARY_MODEL if config.HEDGE_TARGET == "secondary" else model
+            result, usage, loser_usage = await request_hedger.run(
+                role,
+                lambda: self._call_with_backpressure(messages, model, temperature, response_model),
+                lambda: self._call_with_backpressure(messages, hedge_model, temperature, response_model),
+            )
+            # The cancelled duplicate was billed too; charge it to the same budget scope
+            self.tokens.track_usage(loser_usage)
+        else:
+            result, usage = await self._call_with_backpressure(messages, model, temperature, response_model)
+            # Keep latency history warm so hedging has a p90 to work from once enabled
+            request_hedger.record_latency(role, time.perf_counter() - started)
+        self.tokens.track_usage(usage or 0)
+        if llm_cassette.recording:
+            llm_cassette.record(model, messages, temperature, response_model, result, usage)
+        await self._store_in_cache(request_key, result, response_model, usage, time.perf_counter() - started)
+        return result
+
+    async def _generate_batched(
+        self,
+        messages: List[Dict[str, str]],
+        model: str,
+        temperature: float,
+        response_model: Optional[type[BaseModel]],
+        request_key: Optional[str]
+    ) -> Any:
+        """
+        Queues the request on the offline batch queue and waits for its batch to resolve.
+        """
+        if not self.tokens.check_limit():
+            raise RuntimeError("Token limit reached. Aborting generation.")
+
+        started = time.perf_counter()
+        body = build_chat_body(messages, model, temperature, response_model)
+        result, usage = await get_batch_queue().submit(body, response_model)
+        self.tokens.track_usage(usage or 0)
+        if llm_cassette.recording:
+            llm_cassette.record(model, messages, temperature, response_model, result, usage)
+        await self._store_in_cache(request_key, result, response_model, usage, time.perf_counter() - started)
+        return result
+
+    async def _store_in_cache(
+        self,
+        request_key: Optional[str],
+        result: Any,
+        response_model: Optional[type[BaseModel]],
+        usage: int,
+        latency: float
+    ) -> None:
+        if config.ENABLE_RESPONSE_CACHE and request_key and result is not None:
+            await response_cache.put(
+                request_key,
+                kind="text" if response_model is None else "model",
+                payload=result if response_model is None else result.model_dump_json(),
+                tokens=usage,
+                latency=latency
+            )
+
+    async def _call_with_backpressure(
+        self,
+        messages: List[Dict[str, str]],
+        model: str,
+        temperature: float,
+        response_model: Optional[type[BaseModel]]
+    ) -> Tuple[Any, int]:
+        """
+        Runs the provider call under the adaptive concurrency limiter.
+        Rate-limit and timeout signals shrink the provider's concurrency and the call is
+        retried with backoff until its queue deadline; other errors propagate immediately.
+        """
+        deadline = time.monotonic() + config.LLM_QUEUE_DEADLINE
+        attempt = 0
+        while True:
+            try:
+                await self.limiter.acquire(timeout=deadline - time.monotonic())
+            except asyncio.TimeoutError:
+                raise RuntimeError(f"LLM request deadline exceeded after {config.LLM_QUEUE_DEADLINE:.0f}s in queue")
+
+            try:
+                result = await self._call_provider(messages, model, temperature, response_model)
+            except asyncio.CancelledError:
+                # Cancelled mid-flight (e.g. a hedge loser): free the slot without an AIMD signal
+                await asyncio.shield(self.limiter.release(succeeded=False))
+                raise
+            except Exception as e:
+                overloaded = self._is_overload_error(e)
+                await self.limiter.release(overloaded=overloaded, succeeded=False)
+                if not overloaded:
+                    raise
+
+                attempt += 1
+                backoff = self._retry_after(e) or min(0.5 * (2 ** attempt), 30.0)
+                backoff += random.uniform(0, backoff * 0.25)
+                if time.monotonic() + backoff >= deadline:
+                    raise
+                logger.warning(f"ReasoningEngine backing off {backoff:.1f}s after provider overload (attempt {attempt}): {e}")
+                await asyncio.sleep(backoff)
+                continue
+
+            await self.limiter.release(succeeded=True)
+            return result
+
+    @staticmethod
+    def _is_overload_error(e: Exception) -> bool:
+        """Ordinary 429s and timeouts are backpressure signals; quota exhaustion is not."""
+        if isinstance(e, (openai.APITimeoutError, asyncio.TimeoutError)):
+            return True
+        if isinstance(e, openai.RateLimitError):
             err_msg = str(e).lower()
-            
-            # 1. Detect Quota/Billing Exhaustion (429)
-            if "insufficient_quota" in err_msg or "quota_exceeded" in err_msg:
-                logger.critical("CRITICAL: OpenAI API Quota Exceeded. Verify billing at https://platform.openai.com/account/billing")
-                
-                if config.ENABLE_AUTO_MOCK_FALLBACK:
-                    logger.warning("AUTO-FALLBACK: Engaging Simulation Mode (Mock) to maintain platform availability.")
-                    config.USE_MOCK = True
-                    return await self._generate_mock_response(user_prompt, response_model)
-                
-                raise RuntimeError("MISSION_FAILED: LLM Provider Quota Exceeded. Please check OpenAI billing.")
-
-            # 2. General OpenAI API Errors
-            if "openai" in err_msg:
-                logger.error(f"ReasoningEngine hit provider error: {e}")
-                raise RuntimeError(f"Engine provider error: {e}")
-
-            # 3. Generic Fallback
-            logger.error(f"ReasoningEngine failed during generation: {e}")
-            raise RuntimeError(f"Engine generation error: {e}")
+            return "insufficient_quota" not in err_msg and "quota_exceeded" not in err_msg
+        return False
 
+    @staticmethod
+    def _retry_after(e: Exception) -> Optional[float]:
+        response = getattr(e, "response", None)
+        headers = getattr(response, "headers", None)
+        if not headers:
+            return None
+        try:
+            return float(headers.get("retry-after"))
+        except (TypeError, ValueError):
+            return None
+
+    async def _call_provider(
+        self,
+        messages: List[Dict[str, str]],
+        model: str,
+        temperature: float,
+        response_model: Optional[type[BaseModel]]
+    ) -> Tuple[Any, int]:
+        """
+        Performs a single upstream completion and returns (result, total_tokens).
+        Every attempt is recorded in the LLM call metrics under the active call site.
+        """
+        started = time.perf_counter()
+        try:
+            result, usage, usage_detail = await self._request_completion(messages, model, temperature, response_model)
+        except Exception as e:
+            llm_metrics.record_call(current_call_site.get(), model, time.perf_counter() - started, error=e)
+            raise
+
+        llm_metrics.record_call(
+            current_call_site.get(), model, time.perf_counter() - started,
+            prompt_tokens=getattr(usage_detail, "prompt_tokens", None),
+            completion_tokens=getattr(usage_detail, "completion_tokens", None),
+        )
+        return result, usage
+
+    async def _request_completion(
+        self,
+        messages: List[Dict[str, str]],
+        model: str,
+        temperature: float,
+        response_model: Optional[type[BaseModel]]
+    ) -> Tuple[Any, int, Any]:
+        """
+        Issues the completion request and returns (result, total_tokens, raw usage payload).
+        """
+        # Standard text generation
+        if response_model is None:
+            response = await self.client.chat.completions.create(
+                model=model,
+                messages=messages,
+                temperature=temperature,
+            )
+            content = response.choices[0].message.content
+            usage = response.usage.total_tokens if response.usage else self.tokens.count_tokens(content)
+            self._track_prompt_usage(response.usage)
+            return content, usage, response.usage
+
+        # Structured JSON parsing
+        response = await self.client.beta.chat.completions.parse(
+            model=model,
+            messages=messages,
+            response_format=response_model,
+            temperature=temperature,
+        )
+        parsed_response = response.choices[0].message.parsed
+        if parsed_response is None:
+            raise ValueError("Model failed to adhere to the required JSON schema.")
+
+        usage = response.usage.total_tokens if hasattr(response, 'usage') and response.usage else self.tokens.count_tokens(str(parsed_response))
+        self._track_prompt_usage(getattr(response, 'usage', None))
+        return parsed_response, usage, getattr(response, 'usage', None)
+
+    def _track_prompt_usage(self, usage: Any) -> None:
+        """Splits prompt tokens into provider-cached and uncached from the usage payload."""
+        if not usage or not getattr(usage, "prompt_tokens", None):
+            return
+        details = getattr(usage, "prompt_tokens_details", None)
+        cached = (getattr(details, "cached_tokens", 0) or 0) if details else 0
+        self.tokens.track_prompt_cache(usage.prompt_tokens, cached)
+
+    def _decode_cached(self, entry: Dict[str, Any], response_model: Optional[type[BaseModel]]) -> Any:
+        """Rehydrates a cache entry into the shape the caller asked for."""
+        if response_model is None:
+            return entry["payload"]
+        return response_model.model_validate_json(entry["payload"])
 
     async def _generate_mock_response(self, prompt: str, response_model: Optional[type[BaseModel]]) -> Any:
         """
@@ -187,6 +720,30 @@ class ReasoningEngine:
                 ]
             )
 
+        # Mocking for swarm reviewers (ReviewReport)
+        if response_model and response_model.__name__ == "ReviewReport":
+            from core.swarm_orchestrator import ReviewReport
+            return ReviewReport(approved=True, summary="Simulation review: no blocking issues found.", issues=[])
+
+        # Mocking for Forge branch scoring (StageScore)
+        if response_model and response_model.__name__ == "StageScore":
+            from core.forge_pruning import StageScore
+            return StageScore(score=self._calculate_weighted_confidence(prompt) * 10, rationale="Simulation score.")
+
+        # Mocking for Forge benchmark harnesses (BenchmarkHarness)
+        if response_model and response_model.__name__ == "BenchmarkHarness":
+            from core.forge_benchmark import BenchmarkHarness, VariantBinding
+            bindings = []
+            for section in prompt.split("## Variant: ")[1:]:
+                label = section.split("\n", 1)[0].strip()
+                entry = re.search(r"^(?:def|class) (\w+)", section, re.MULTILINE)
+                bindings.append(VariantBinding(label=label, module="solution", attribute=entry.group(1) if entry else "main"))
+            return BenchmarkHarness(
+                test_code="def run_tests(impl):\n    assert callable(impl)\n",
+                workload_code="def make_input():\n    return list(range(1000))\n\ndef workload(impl, data):\n    sum(data)\n",
+                bindings=bindings
+            )
+
         # Mocking for Agent Spawner (Biosynthesis)
         if "Generate a specialized AGI Agent Profile" in prompt:
             return json.dumps({
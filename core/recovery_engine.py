@@ -43,7 +43,8 @@ class RecoveryEngine:
                 system_prompt=system_prompt,
                 user_prompt=user_prompt,
                 temperature=0.2,
-                response_model=FailureAnalysis
+                response_model=FailureAnalysis,
+                call_site="recovery.analyze_failure"
             )
             logger.info(f"RECOVERY: LLM Root Cause identified: {analysis_result.error_type}")
             return analysis_result
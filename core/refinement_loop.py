@@ -42,17 +42,17 @@ class RefinementLoop:
 
     async def _analysis_pass(self, task: str, context: str) -> str:
         prompt = f"Perform a structural analysis of the following task and code context. Identify dependencies, architectural constraints, and potential pitfalls.\nTask: {task}\nContext: {context}"
-        return await self.engine.generate_response("You are a senior AGI systems architect. Focus on structural reasoning and architecture.", prompt)
+        return await self.engine.generate_response("You are a senior AGI systems architect. Focus on structural reasoning and architecture.", prompt, call_site="refinement.analysis")
 
     async def _draft_pass(self, task: str, analysis: str) -> str:
         prompt = f"Generate a robust implementation based on the following analysis.\nTask: {task}\nAnalysis: {analysis}"
-        return await self.engine.generate_response("You are an expert software engineer. Write clean, modular, and well-documented code.", prompt)
+        return await self.engine.generate_response("You are an expert software engineer. Write clean, modular, and well-documented code.", prompt, call_site="refinement.draft")
 
     async def _critique_pass(self, draft: str) -> str:
         prompt = f"Critique the following code for bugs, edge cases, and architectural flaws. Then provide the improved code.\nCode:\n{draft}"
-        return await self.engine.generate_response("You are a rigorous code reviewer. Be pedantic and identify hidden regressions.", prompt)
+        return await self.engine.generate_response("You are a rigorous code reviewer. Be pedantic and identify hidden regressions.", prompt, call_site="refinement.critique")
 
     async def _optimization_pass(self, code: str) -> str:
         # Here we could call CodeIntelligence to check complexity before/after
         prompt = f"Optimize the following code for performance and token efficiency. Ensure it remains readable but highly condensed.\nCode:\n{code}"
-        return await self.engine.generate_response("You are a performance engineer. Optimize for speed, memory, and token budget.", prompt)
+        return await self.engine.generate_response("You are a performance engineer. Optimize for speed, memory, and token budget.", prompt, call_site="refinement.optimization")
@@ -0,0 +1,83 @@
+"""
+Single-flight coalescing for identical in-flight LLM requests.
+Concurrent callers with the same request key share one upstream call instead of
+each paying for a duplicate completion.
+"""
+import asyncio
+from typing import Any, Awaitable, Callable, Dict
+
+from pydantic import BaseModel
+
+from utils.logger import logger
+
+
+class _InFlight:
+    """One shared upstream call and the number of callers currently awaiting it."""
+
+    def __init__(self, task: asyncio.Task):
+        self.task = task
+        self.waiters = 0
+
+
+class RequestCoalescer:
+    """
+    Maps request keys to a single shared upstream task.
+    The task is shielded from individual waiters and only cancelled once every
+    waiter has gone away, so one impatient caller can't fail the others.
+    Waiter counts live on the in-flight entry, so a caller still unwinding from a
+    finished call never touches the count of a newer call for the same key.
+    """
+
+    def __init__(self):
+        self._inflight: Dict[str, _InFlight] = {}
+        self.leaders = 0
+        self.coalesced = 0
+
+    async def run(self, key: str, factory: Callable[[], Awaitable[Any]]) -> Any:
+        """
+        Awaits the shared result for `key`, starting the upstream call via `factory` if none is in flight.
+        """
+        entry = self._inflight.get(key)
+        is_leader = entry is None
+        if is_leader:
+            entry = _InFlight(asyncio.ensure_future(factory()))
+            self._inflight[key] = entry
+            entry.task.add_done_callback(lambda _t, k=key, e=entry: self._release(k, e))
+            self.leaders += 1
+        else:
+            self.coalesced += 1
+            logger.debug(f"COALESCER: Joined in-flight request {key[:12]} ({entry.waiters + 1} waiters)")
+
+        task = entry.task
+        entry.waiters += 1
+        try:
+            result = await asyncio.shield(task)
+        except asyncio.CancelledError:
+            if not task.done() and entry.waiters <= 1:
+                # Last interested caller left; abort the upstream request
+                task.cancel()
+            raise
+        finally:
+            entry.waiters -= 1
+
+        # Followers get their own copy so a caller mutating its result can't leak into another's
+        if not is_leader and isinstance(result, BaseModel):
+            return result.model_copy(deep=True)
+        return result
+
+    def _release(self, key: str, entry: _InFlight) -> None:
+        if self._inflight.get(key) is entry:
+            self._inflight.pop(key, None)
+
+    def get_stats(self) -> Dict[str, Any]:
+        total = self.leaders + self.coalesced
+        return {
+            "upstream_calls": self.leaders,
+            "coalesced_calls": self.coalesced,
+            "in_flight": len(self._inflight),
+            "dedup_ratio": round(self.coalesced / total, 4) if total else 0.0,
+        }
+
+
+# Process-wide coalescer shared by every ReasoningEngine instance
+request_coalescer = RequestCoalescer()
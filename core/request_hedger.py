@@ -0,0 +1,126 @@
+"""
+Hedged LLM requests for latency-critical roles.
+When a call outlives its role's rolling p90 latency, a duplicate request is fired and
+whichever finishes first wins; the loser is cancelled and its spend reported so the caller
+can charge it. Extra spend is capped as a percentage of primary token spend.
+"""
+import asyncio
+import time
+from collections import deque
+from typing import Any, Awaitable, Callable, Deque, Dict, Optional, Tuple
+
+from core_config import config
+from utils.logger import logger
+
+CallFactory = Callable[[], Awaitable[Tuple[Any, int]]]
+
+
+class RequestHedger:
+    """
+    Per-role latency tracker and hedging controller.
+
+    Latencies are kept in a bounded rolling window per role; no hedge fires until
+    `min_samples` calls have been observed for that role.
+    """
+
+    def __init__(self, window: int = 200, min_samples: int = 20, quantile: float = 0.9, budget_pct: float = 10.0):
+        self.window = window
+        self.min_samples = min_samples
+        self.quantile = quantile
+        self.budget_pct = budget_pct
+
+        self._latencies: Dict[str, Deque[float]] = {}
+        self.primary_tokens = 0
+        self.hedge_tokens = 0
+        self.hedges_fired = 0
+        self.hedges_won = 0
+        self.hedges_skipped_budget = 0
+
+    def record_latency(self, role: str, seconds: float) -> None:
+        if role not in self._latencies:
+            self._latencies[role] = deque(maxlen=self.window)
+        self._latencies[role].append(seconds)
+
+    def hedge_delay(self, role: str) -> Optional[float]:
+        """Returns the role's rolling p90 latency, or None while there is too little history."""
+        samples = self._latencies.get(role)
+        if not samples or len(samples) < self.min_samples:
+            return None
+        ordered = sorted(samples)
+        return ordered[min(len(ordered) - 1, int(len(ordered) * self.quantile))]
+
+    def _budget_allows(self) -> bool:
+        return self.hedge_tokens < self.primary_tokens * self.budget_pct / 100.0
+
+    async def run(self, role: str, primary: CallFactory, hedge: CallFactory) -> Tuple[Any, int, int]:
+        """
+        Runs `primary`, firing `hedge` if it is still pending after the role's p90 latency.
+
+        Returns:
+            Tuple[Any, int, int]: The winning (result, total_tokens) plus the loser's tokens.
+            A loser that completed reports its actual usage; one cancelled mid-flight is billed
+            for the same prompt and at most a full completion, so it is charged the winner's total.
+        """
+        started = time.perf_counter()
+        delay = self.hedge_delay(role)
+        primary_task = asyncio.ensure_future(primary())
+        hedge_task: Optional[asyncio.Future] = None
+        try:
+            if delay is not None:
+                await asyncio.wait({primary_task}, timeout=delay)
+
+            if primary_task.done() or delay is None or not self._budget_allows():
+                if delay is not None and not primary_task.done():
+                    self.hedges_skipped_budget += 1
+                result, tokens = await primary_task
+                self._settle(role, started, tokens, loser_tokens=0)
+                return result, tokens, 0
+
+            self.hedges_fired += 1
+            logger.info(f"HEDGE: [{role}] Call exceeded p90 ({delay:.2f}s). Firing hedge request.")
+            hedge_task = asyncio.ensure_future(hedge())
+            pending = {primary_task, hedge_task}
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    if task.exception() is None:
+                        if task is hedge_task:
+                            self.hedges_won += 1
+                        result, tokens = task.result()
+                        loser_tokens = self._loser_tokens(hedge_task if task is primary_task else primary_task, tokens)
+                        self._settle(role, started, tokens, loser_tokens)
+                        return result, tokens, loser_tokens
+            # Both failed: surface the primary's error
+            raise primary_task.exception()
+        finally:
+            # Cancel the loser (or everything, if the caller itself was cancelled)
+            for task in (primary_task, hedge_task):
+                if task is not None and not task.done():
+                    task.cancel()
+
+    @staticmethod
+    def _loser_tokens(loser: asyncio.Future, winner_tokens: int) -> int:
+        if not loser.done():
+            # Still generating when cancelled: same prompt, partial completion
+            return winner_tokens or 0
+        if loser.cancelled() or loser.exception() is not None:
+            return 0
+        return loser.result()[1] or 0
+
+    def _settle(self, role: str, started: float, tokens: int, loser_tokens: int) -> None:
+        self.record_latency(role, time.perf_counter() - started)
+        self.primary_tokens += tokens or 0
+        self.hedge_tokens += loser_tokens
+
+    def get_diagnostics(self) -> Dict[str, Any]:
+        return {
+            "hedges_fired": self.hedges_fired,
+            "hedges_won": self.hedges_won,
+            "hedges_skipped_budget": self.hedges_skipped_budget,
+            "extra_spend_pct": round(100.0 * self.hedge_tokens / self.primary_tokens, 2) if self.primary_tokens else 0.0,
+            "p90_by_role": {role: self.hedge_delay(role) for role in self._latencies},
+        }
+
+
+# Singleton hedger
+request_hedger = RequestHedger(min_samples=config.HEDGE_MIN_SAMPLES, budget_pct=config.HEDGE_BUDGET_PCT)
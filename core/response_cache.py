@@ -0,0 +1,298 @@
+"""
+Content-addressed response cache for the Reasoning Engine.
+Two tiers: an in-process LRU for hot prompts and a persistent on-disk store
+with TTL and size-based eviction, so replayed prompts skip the provider entirely.
+"""
+import asyncio
+import hashlib
+import json
+import os
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Type
+
+from pydantic import BaseModel
+
+from core_config import config
+from utils.logger import logger
+
+
+def build_request_key(
+    model: str,
+    system_prompt: str,
+    user_prompt: str,
+    temperature: float,
+    response_model: Optional[Type[BaseModel]] = None
+) -> str:
+    """
+    Derives a stable SHA-256 key from everything that determines the completion.
+    The response schema is part of the key so a schema change never serves stale shapes.
+    """
+    schema = response_model.model_json_schema() if response_model else None
+    payload = json.dumps(
+        {
+            "model": model,
+            "system": system_prompt,
+            "user": user_prompt,
+            "temperature": round(float(temperature), 4),
+            "schema": schema,
+        },
+        sort_keys=True,
+        separators=(",", ":"),
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class CacheStats(BaseModel):
+    memory_hits: int = 0
+    disk_hits: int = 0
+    misses: int = 0
+    writes: int = 0
+    evictions: int = 0
+    tokens_saved: int = 0
+    latency_saved_s: float = 0.0
+
+    @property
+    def hit_rate(self) -> float:
+        lookups = self.memory_hits + self.disk_hits + self.misses
+        return (self.memory_hits + self.disk_hits) / lookups if lookups else 0.0
+
+
+class _DiskEntry:
+    """Index record for one disk-tier file."""
+
+    __slots__ = ("created_at", "last_used", "size")
+
+    def __init__(self, created_at: float, last_used: float, size: int):
+        self.created_at = created_at
+        self.last_used = last_used
+        self.size = size
+
+
+class ResponseCache:
+    """
+    Two-tier LRU + disk cache for LLM completions.
+    Entries are plain dicts: {"kind", "payload", "tokens", "latency", "created_at"}.
+
+    Disk I/O runs on worker threads so lookups never block the event loop. The disk tier is
+    tracked by an in-memory index (size, write time, last use per file) built by one scan on
+    first use, so eviction never walks the cache directory.
+    """
+
+    def __init__(
+        self,
+        max_memory_entries: int = 512,
+        disk_path: Optional[str] = None,
+        ttl_seconds: int = 86400,
+        max_disk_mb: int = 256,
+    ):
+        self.max_memory_entries = max_memory_entries
+        self.disk_path = disk_path
+        self.ttl_seconds = ttl_seconds
+        self.max_disk_bytes = max_disk_mb * 1024 * 1024
+
+        self._memory: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._disk_index: Optional[Dict[str, _DiskEntry]] = None  # Path -> entry, built on first disk access
+        self._disk_bytes = 0
+        self.stats = CacheStats()
+
+    def _is_expired(self, entry: Dict[str, Any]) -> bool:
+        return self.ttl_seconds > 0 and (time.time() - entry.get("created_at", 0)) > self.ttl_seconds
+
+    def _disk_file(self, key: str) -> str:
+        return os.path.join(self.disk_path, key[:2], f"{key}.json")
+
+    async def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """Looks up a key in memory first, then on disk (promoting disk hits into memory)."""
+        with self._lock:
+            entry = self._memory.get(key)
+            if entry is not None:
+                if self._is_expired(entry):
+                    self._memory.pop(key, None)
+                else:
+                    self._memory.move_to_end(key)
+                    self._record_hit(entry, tier="memory")
+                    return entry
+
+        entry = await asyncio.to_thread(self._read_disk, key) if self.disk_path else None
+        if entry is not None:
+            with self._lock:
+                self._remember(key, entry)
+                self._record_hit(entry, tier="disk")
+            return entry
+
+        with self._lock:
+            self.stats.misses += 1
+        return None
+
+    async def put(self, key: str, kind: str, payload: str, tokens: int = 0, latency: float = 0.0) -> None:
+        """Stores a completion in both tiers."""
+        entry = {
+            "kind": kind,
+            "payload": payload,
+            "tokens": int(tokens or 0),
+            "latency": float(latency or 0.0),
+            "created_at": time.time(),
+        }
+        with self._lock:
+            self._remember(key, entry)
+            self.stats.writes += 1
+        if self.disk_path:
+            await asyncio.to_thread(self._write_disk, key, entry)
+
+    def clear(self) -> None:
+        """Drops the in-process tier. The disk tier expires via TTL/eviction."""
+        with self._lock:
+            self._memory.clear()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Returns hit/miss counters and estimated savings for the admin dashboard."""
+        with self._lock:
+            data = self.stats.model_dump()
+            data["hit_rate"] = round(self.stats.hit_rate, 4)
+            data["memory_entries"] = len(self._memory)
+            data["disk_entries"] = len(self._disk_index) if self._disk_index is not None else None
+            data["disk_bytes"] = self._disk_bytes if self._disk_index is not None else None
+        data["disk_enabled"] = bool(self.disk_path)
+        return data
+
+    def _record_hit(self, entry: Dict[str, Any], tier: str) -> None:
+        if tier == "memory":
+            self.stats.memory_hits += 1
+        else:
+            self.stats.disk_hits += 1
+        self.stats.tokens_saved += entry.get("tokens", 0)
+        self.stats.latency_saved_s += entry.get("latency", 0.0)
+
+    def _remember(self, key: str, entry: Dict[str, Any]) -> None:
+        self._memory[key] = entry
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.max_memory_entries:
+            self._memory.popitem(last=False)
+            self.stats.evictions += 1
+
+    # Disk tier: every method below runs on a worker thread
+
+    def _index(self) -> Dict[str, _DiskEntry]:
+        """Returns the disk index, scanning the cache directory once on first use."""
+        with self._lock:
+            if self._disk_index is not None:
+                return self._disk_index
+        index: Dict[str, _DiskEntry] = {}
+        for path in self._iter_disk_files():
+            try:
+                st = os.stat(path)
+            except OSError:
+                continue
+            index[path] = _DiskEntry(st.st_mtime, max(st.st_atime, st.st_mtime), st.st_size)
+        with self._lock:
+            if self._disk_index is None:
+                self._disk_index = index
+                self._disk_bytes = sum(item.size for item in index.values())
+            return self._disk_index
+
+    def _read_disk(self, key: str) -> Optional[Dict[str, Any]]:
+        index = self._index()
+        path = self._disk_file(key)
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                entry = json.load(f)
+        except (OSError, ValueError):
+            return None
+
+        if self._is_expired(entry):
+            self._remove_disk_file(path)
+            return None
+        now = time.time()
+        with self._lock:
+            item = index.get(path)
+            if item is not None:
+                item.last_used = now
+        # Mirror the use in atime (mtime stays the write time TTL is measured from) for the next startup scan
+        try:
+            os.utime(path, (now, os.stat(path).st_mtime))
+        except OSError:
+            pass
+        return entry
+
+    def _write_disk(self, key: str, entry: Dict[str, Any]) -> None:
+        index = self._index()
+        path = self._disk_file(key)
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            data = json.dumps(entry, separators=(",", ":"))
+            tmp_path = f"{path}.tmp"
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                f.write(data)
+            os.replace(tmp_path, path)
+        except OSError as e:
+            logger.warning(f"RESPONSE_CACHE: Disk write failed for {key[:12]}: {e}")
+            return
+
+        now = time.time()
+        with self._lock:
+            replaced = index.get(path)
+            self._disk_bytes += len(data) - (replaced.size if replaced else 0)
+            index[path] = _DiskEntry(now, now, len(data))
+            over_budget = self._disk_bytes > self.max_disk_bytes
+        if over_budget:
+            self._evict_disk()
+
+    def _iter_disk_files(self):
+        for root, _, files in os.walk(self.disk_path):
+            for name in files:
+                if name.endswith(".json"):
+                    yield os.path.join(root, name)
+
+    def _remove_disk_file(self, path: str) -> None:
+        try:
+            os.remove(path)
+        except OSError:
+            pass
+        with self._lock:
+            item = self._disk_index.pop(path, None) if self._disk_index is not None else None
+            if item is not None:
+                self._disk_bytes -= item.size
+
+    def _evict_disk(self) -> None:
+        """
+        Purges expired files, then removes the least recently used entries until the
+        store is back under 90% of its byte budget. Works from the index alone.
+        """
+        now = time.time()
+        with self._lock:
+            items = sorted(self._index_items(), key=lambda pair: pair[1].last_used)
+        expired = [path for path, item in items if self.ttl_seconds > 0 and now - item.created_at > self.ttl_seconds]
+        for path in expired:
+            self._remove_disk_file(path)
+
+        target = int(self.max_disk_bytes * 0.9)
+        evicted = 0
+        for path, _ in items:
+            with self._lock:
+                if self._disk_bytes <= target:
+                    break
+                if path not in self._disk_index:
+                    continue
+            self._remove_disk_file(path)
+            evicted += 1
+
+        with self._lock:
+            self.stats.evictions += evicted
+            total = self._disk_bytes
+        if evicted:
+            logger.info(f"RESPONSE_CACHE: Evicted {evicted} disk entries ({total} bytes retained).")
+
+    def _index_items(self):
+        return list(self._disk_index.items()) if self._disk_index is not None else []
+
+
+# Process-wide cache shared by every ReasoningEngine instance
+response_cache = ResponseCache(
+    max_memory_entries=config.RESPONSE_CACHE_MEMORY_ENTRIES,
+    disk_path=config.RESPONSE_CACHE_PATH or None,
+    ttl_seconds=config.RESPONSE_CACHE_TTL_SECONDS,
+    max_disk_mb=config.RESPONSE_CACHE_MAX_DISK_MB,
+)
@@ -1,15 +1,59 @@
 import asyncio
+import ctypes
 import logging
 import subprocess
 import os
 import signal
+import sys
 import time
 import tempfile
 from typing import Dict, Any, List, Optional
 from pydantic import BaseModel
 
+from core.mission_registry import check_cancelled
+
+try:
+    import resource  # POSIX only
+except ImportError:
+    resource = None
+
 logger = logging.getLogger(__name__)
 
+# Linux unshare(2) flags: a new user namespace lets an unprivileged child create its own,
+# interface-less network namespace
+_CLONE_NEWUSER = 0x10000000
+_CLONE_NEWNET = 0x40000000
+
+# Runs the entry script and records the process's peak RSS (KiB on Linux, bytes on macOS) to a side file.
+# Unless network access is allowed, IP sockets are refused in-process as well, as a fallback for
+# hosts where the child cannot get its own network namespace.
+_BOOTSTRAP = """
+import atexit, runpy, sys
+entry, rss_path, block_network = sys.argv[1], sys.argv[2], sys.argv[3] == "1"
+if block_network:
+    import socket
+    _IP_FAMILIES = (-1, socket.AF_INET, socket.AF_INET6)
+    class _NoNetworkSocket(socket.socket):
+        def __init__(self, family=-1, type=-1, proto=-1, fileno=None):
+            if fileno is None and family in _IP_FAMILIES:
+                raise PermissionError("Network access is disabled in the sandbox.")
+            super().__init__(family, type, proto, fileno)
+    socket.socket = _NoNetworkSocket
+def _report_rss():
+    try:
+        import resource
+        with open(rss_path, "w") as f:
+            f.write(str(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss))
+    except Exception:
+        pass
+atexit.register(_report_rss)
+sys.argv = [entry]
+runpy.run_path(entry, run_name="__main__")
+"""
+
+# Environment variables passed through to sandboxed code; proxies and credentials are not
+_ENV_ALLOWLIST = ("PATH", "LANG", "LC_ALL", "PYTHONHASHSEED", "SYSTEMROOT")
+
 class SandboxResult(BaseModel):
     stdout: str
     stderr: str
@@ -28,32 +72,71 @@ class SandboxManager:
         self.config = config or {}
         self.default_timeout = self.config.get("timeout", 5.0)
         self.max_memory_mb = self.config.get("max_memory_mb", 128)
+        self.strict_isolation = self.config.get("strict_isolation", True)
+        self.allow_network = self.config.get("allow_network", False)
 
-    async def execute_python_isolated(self, code: str, timeout: Optional[float] = None) -> SandboxResult:
+    def _prepare_child(self) -> None:
+        """
+        Runs in the child before exec: caps the address space at max_memory_mb (strict isolation)
+        and, unless network access is allowed, moves the child into an empty network namespace.
+        """
+        if self.strict_isolation and resource is not None:
+            limit = int(self.max_memory_mb * 1024 * 1024)
+            resource.setrlimit(resource.RLIMIT_AS, (limit, limit))
+        if not self.allow_network and sys.platform.startswith("linux"):
+            try:
+                # Fails without user-namespace support; the bootstrap's socket guard still applies
+                ctypes.CDLL(None, use_errno=True).unshare(_CLONE_NEWUSER | _CLONE_NEWNET)
+            except Exception:
+                pass
+
+    async def execute_python_isolated(self, code: str, timeout: Optional[float] = None, files: Optional[Dict[str, str]] = None) -> SandboxResult:
         """
         Executes Python code in a strictly isolated subprocess with resource constraints.
+        The code runs as `main.py` in a fresh temporary directory; `files` (relative path -> content)
+        are written next to it so the entry script can import them.
         """
+        check_cancelled()
         timeout = timeout or self.default_timeout
         start_time = time.time()
         
         logger.info(f"SANDBOX: Initiating isolated execution (Timeout: {timeout}s, Mem: {self.max_memory_mb}MB)")
         
-        with tempfile.NamedTemporaryFile(suffix=".py", mode='w', delete=False) as tmp:
-            tmp.write(code)
-            tmp_path = tmp.name
+        workdir = tempfile.TemporaryDirectory(prefix="sandbox_")
+        entry_path = os.path.join(workdir.name, "main.py")
+        rss_path = os.path.join(workdir.name, ".peak_rss")
 
         try:
+            for rel_path, content in (files or {}).items():
+                target = os.path.realpath(os.path.join(workdir.name, rel_path))
+                if not target.startswith(os.path.realpath(workdir.name) + os.sep):
+                    raise ValueError(f"Sandbox file path escapes the work directory: {rel_path}")
+                os.makedirs(os.path.dirname(target), exist_ok=True)
+                with open(target, "w") as f:
+                    f.write(content)
+            with open(entry_path, "w") as f:
+                f.write(code)
+
             # We use a subprocess with a preexec_fn to set limits (Linux/Mac specific)
             # In production, this would be a gRPC call to a Docker sidecar.
             process = await asyncio.create_subprocess_exec(
-                "python3", tmp_path,
+                sys.executable, "-c", _BOOTSTRAP, entry_path, rss_path, "0" if self.allow_network else "1",
+                cwd=workdir.name,
+                env={key: os.environ[key] for key in _ENV_ALLOWLIST if key in os.environ},
                 stdout=asyncio.subprocess.PIPE,
-                stderr=asyncio.subprocess.PIPE
+                stderr=asyncio.subprocess.PIPE,
+                preexec_fn=self._prepare_child if os.name == "posix" else None
             )
 
             try:
                 stdout_data, stderr_data = await asyncio.wait_for(process.communicate(), timeout=timeout)
                 is_timeout = False
+            except asyncio.CancelledError:
+                # Mission cancelled mid-run: never leave the child behind
+                process.kill()
+                await asyncio.shield(process.wait())
+                logger.warning("SANDBOX: Execution aborted by mission cancellation.")
+                raise
             except asyncio.TimeoutError:
                 process.kill()
                 stdout_data, stderr_data = await process.communicate()
@@ -63,11 +146,11 @@ class SandboxManager:
             end_time = time.time()
             
             return SandboxResult(
-                stdout=stdout_data.decode(),
-                stderr=stderr_data.decode(),
+                stdout=stdout_data.decode(errors="replace"),
+                stderr=stderr_data.decode(errors="replace"),
                 exit_code=process.returncode or 0,
                 execution_time=end_time - start_time,
-                memory_peak_mb=12.5, # Mock: Peak memory tracking requires platform-specific shm/cgroups
+                memory_peak_mb=self._read_peak_rss(rss_path),
                 is_timeout=is_timeout
             )
 
@@ -82,8 +165,17 @@ class SandboxManager:
                 is_timeout=False
             )
         finally:
-            if os.path.exists(tmp_path):
-                os.remove(tmp_path)
+            workdir.cleanup()
+
+    @staticmethod
+    def _read_peak_rss(rss_path: str) -> float:
+        """Peak RSS in MB as reported by the child, or 0.0 if it was killed before reporting."""
+        try:
+            with open(rss_path) as f:
+                raw = float(f.read().strip())
+        except (OSError, ValueError):
+            return 0.0
+        return raw / (1024 * 1024) if sys.platform == "darwin" else raw / 1024
 
     async def get_resource_telemetry(self) -> Dict[str, Any]:
         """
@@ -0,0 +1,199 @@
+"""
+Semantic cache for swarm stage outputs (planner and architect).
+Entries are keyed by an embedding of the normalized objective within a namespace of
+(tenant scope, agent, agent profile), so missions whose objectives differ only trivially reuse a
+prior stage result outright, or hand it to a cheaper model as a warm-start draft.
+"""
+import hashlib
+import re
+import time
+from collections import OrderedDict
+from typing import Awaitable, Callable, Dict, List, Optional, Tuple
+
+import numpy as np
+from pydantic import BaseModel
+
+from core_config import config
+from core.llm_client_registry import llm_client_registry
+from utils.logger import logger
+
+Embedder = Callable[[str], Awaitable[List[float]]]
+
+LOCAL_EMBEDDING_DIM = 512
+
+
+def normalize_objective(text: str) -> str:
+    """Lowercases, drops punctuation and collapses whitespace."""
+    return re.sub(r"\s+", " ", re.sub(r"[^\w\s]", " ", text.lower())).strip()
+
+
+def profile_fingerprint(name: str, system_prompt: str) -> str:
+    return hashlib.sha256(f"{name}\n{system_prompt}".encode("utf-8")).hexdigest()[:16]
+
+
+async def local_embedding(text: str) -> List[float]:
+    """
+    Offline fallback: hashed word and character-trigram counts. Good enough to match
+    objectives that differ by wording, not to judge deep semantic equivalence.
+    """
+    vector = np.zeros(LOCAL_EMBEDDING_DIM, dtype=np.float32)
+    words = text.split()
+    features = words + [text[i:i + 3] for i in range(max(0, len(text) - 2))]
+    for feature in features:
+        digest = hashlib.blake2b(feature.encode("utf-8"), digest_size=8).digest()
+        vector[int.from_bytes(digest, "little") % LOCAL_EMBEDDING_DIM] += 1.0
+    return vector.tolist()
+
+
+async def openai_embedding(text: str) -> List[float]:
+    client = llm_client_registry.get_client("openai", config.OPENAI_API_KEY)
+    response = await client.embeddings.create(model=config.EMBEDDING_MODEL, input=text)
+    return response.data[0].embedding
+
+
+class StageCacheHit(BaseModel):
+    """A cached stage output and how closely its objective matches."""
+    output: str
+    objective: str
+    similarity: float
+    mode: str  # 'reuse' or 'warm_start'
+
+
+class _Entry:
+    __slots__ = ("vector", "output", "objective", "created_at")
+
+    def __init__(self, vector: np.ndarray, output: str, objective: str):
+        self.vector = vector
+        self.output = output
+        self.objective = objective
+        self.created_at = time.time()
+
+
+class StageResultCache:
+    """
+    In-process semantic cache. Each namespace holds at most `max_entries` entries (LRU) and
+    lookups scan its unit vectors with one matrix product.
+    """
+
+    def __init__(
+        self,
+        embedder: Optional[Embedder] = None,
+        reuse_threshold: float = 0.97,
+        warm_start_threshold: float = 0.9,
+        max_entries: int = 256,
+        ttl_seconds: int = 7 * 86400,
+    ):
+        self._embedder = embedder
+        self.reuse_threshold = reuse_threshold
+        self.warm_start_threshold = warm_start_threshold
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+
+        self._namespaces: Dict[Tuple[str, str, str], "OrderedDict[str, _Entry]"] = {}
+        self._vectors: "OrderedDict[str, np.ndarray]" = OrderedDict()
+        self._stats: Dict[str, Dict[str, int]] = {}
+
+    def _embedder_fn(self) -> Embedder:
+        if self._embedder is None:
+            use_local = config.STAGE_CACHE_EMBEDDER == "local" or config.USE_MOCK
+            self._embedder = local_embedding if use_local else openai_embedding
+        return self._embedder
+
+    async def _embed(self, objective: str) -> np.ndarray:
+        """Unit vector for a normalized objective; recent vectors are memoized."""
+        vector = self._vectors.get(objective)
+        if vector is not None:
+            self._vectors.move_to_end(objective)
+            return vector
+        raw = np.asarray(await self._embedder_fn()(objective), dtype=np.float32)
+        norm = float(np.linalg.norm(raw))
+        vector = raw / norm if norm else raw
+        self._vectors[objective] = vector
+        if len(self._vectors) > 256:
+            self._vectors.popitem(last=False)
+        return vector
+
+    def _count(self, agent_key: str, outcome: str) -> None:
+        stats = self._stats.setdefault(agent_key, {"reuse": 0, "warm_start": 0, "miss": 0, "stores": 0, "errors": 0})
+        stats[outcome] += 1
+
+    @staticmethod
+    def _namespace_key(scope: str, agent_key: str, profile: str) -> Tuple[str, str, str]:
+        if not scope:
+            raise ValueError("Stage cache access requires a tenant scope (org or user).")
+        return (scope, agent_key, profile)
+
+    async def lookup(self, scope: str, agent_key: str, profile: str, objective: str, allow_reuse: bool = True) -> Optional[StageCacheHit]:
+        """
+        Returns the closest entry above the warm-start threshold within the tenant `scope`.
+        With `allow_reuse` off, even a near-identical match is only offered as a warm start.
+        """
+        namespace = self._namespaces.get(self._namespace_key(scope, agent_key, profile))
+        normalized = normalize_objective(objective)
+        if not namespace:
+            self._count(agent_key, "miss")
+            return None
+        try:
+            query = await self._embed(normalized)
+        except Exception as e:
+            self._count(agent_key, "errors")
+            logger.warning(f"STAGE_CACHE: Embedding failed ({e}); bypassing cache.")
+            return None
+
+        now = time.time()
+        for key in [key for key, entry in namespace.items() if now - entry.created_at > self.ttl_seconds]:
+            del namespace[key]
+        if not namespace:
+            self._count(agent_key, "miss")
+            return None
+
+        keys = list(namespace)
+        matrix = np.stack([namespace[key].vector for key in keys])
+        similarities = matrix @ query
+        best = int(np.argmax(similarities))
+        similarity = float(similarities[best])
+        if similarity < self.warm_start_threshold:
+            self._count(agent_key, "miss")
+            return None
+
+        namespace.move_to_end(keys[best])
+        entry = namespace[keys[best]]
+        mode = "reuse" if allow_reuse and similarity >= self.reuse_threshold else "warm_start"
+        self._count(agent_key, mode)
+        logger.info(f"STAGE_CACHE: {mode} hit for {agent_key} (similarity {similarity:.3f}).")
+        return StageCacheHit(output=entry.output, objective=entry.objective, similarity=round(similarity, 4), mode=mode)
+
+    async def store(self, scope: str, agent_key: str, profile: str, objective: str, output: str) -> None:
+        key = self._namespace_key(scope, agent_key, profile)
+        normalized = normalize_objective(objective)
+        try:
+            vector = await self._embed(normalized)
+        except Exception as e:
+            self._count(agent_key, "errors")
+            logger.warning(f"STAGE_CACHE: Embedding failed ({e}); result not cached.")
+            return
+        namespace = self._namespaces.setdefault(key, OrderedDict())
+        namespace[normalized] = _Entry(vector, output, objective)
+        namespace.move_to_end(normalized)
+        while len(namespace) > self.max_entries:
+            namespace.popitem(last=False)
+        self._count(agent_key, "stores")
+
+    def get_stats(self) -> Dict[str, Dict[str, float]]:
+        report: Dict[str, Dict[str, float]] = {}
+        for agent_key, stats in self._stats.items():
+            lookups = stats["reuse"] + stats["warm_start"] + stats["miss"]
+            report[agent_key] = {
+                **stats,
+                "hit_rate": round((stats["reuse"] + stats["warm_start"]) / lookups, 4) if lookups else 0.0,
+            }
+        return report
+
+
+# Singleton stage cache
+stage_result_cache = StageResultCache(
+    reuse_threshold=config.STAGE_CACHE_REUSE_THRESHOLD,
+    warm_start_threshold=config.STAGE_CACHE_WARM_START_THRESHOLD,
+    max_entries=config.STAGE_CACHE_MAX_ENTRIES,
+    ttl_seconds=config.STAGE_CACHE_TTL_SECONDS,
+)
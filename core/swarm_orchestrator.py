@@ -3,8 +3,8 @@ Swarm Orchestrator for Project Ascension.
 Manages the lifecycle, communication, and task delegation of a multi-agent workforce.
 """
 import asyncio
-from typing import List, Dict, Any, Optional
-from pydantic import BaseModel
+from typing import List, Dict, Any, Optional, Callable, Awaitable
+from pydantic import BaseModel, Field
 
 from core.reasoning_engine import ReasoningEngine
 from agents.swarm_profiles import AGENT_REGISTRY, AgentProfile, SwarmCommunication
@@ -13,11 +13,90 @@ from core.stability_engine import StabilityEngine
 from core.consensus_engine import ConsensusEngine, SwarmDecision
 from core.recovery_engine import RecoveryEngine, FailureAnalysis
 from core.knowledge_bridge import KnowledgeBridge
+from core.budget_scope import budget_scope
+from core.trace_writer import trace_writer
+from core.mission_checkpoint import mission_checkpoints, StageCheckpoint, is_valid_mission_id
+from core.forge_pruning import SuccessiveHalvingGate, BranchPruned, StageScore
+from core.forge_benchmark import ForgeBenchmarker
+from core.mission_registry import mission_registry, check_cancelled, acknowledge_cancellation, MissionCancelled
+from core.stage_cache import stage_result_cache, profile_fingerprint, StageCacheHit
 from utils.logger import logger
 import json
 import uuid
 import datetime
 
+# Async callback receiving live mission events (stage transitions and streamed deltas)
+EventSink = Callable[[Dict[str, Any]], Awaitable[None]]
+
+# Async callback invoked with (stage, output) after each core stage; may raise to stop the mission
+StageGate = Callable[[str, str], Awaitable[None]]
+
+# Architectural biases explored by parallel Forge branches
+FORGE_BIASES: List[Dict[str, str]] = [
+    {"label": "Performance", "hint": "Prioritize low latency, caching, and memory efficiency."},
+    {"label": "Scalability", "hint": "Prioritize horizontal scaling, statelessness, and pub-sub patterns."},
+    {"label": "Elegance", "hint": "Prioritize clean code, functional patterns, and minimal dependencies."}
+]
+
+# Mission config used when the caller supplies none
+DEFAULT_SWARM_CONFIG: Dict[str, Any] = {"agents": {"auditor": True, "optimizer": True, "critic": True}, "creativity": 0.5, "strictness": 0.8}
+
+# Stage label -> (SSE status, user-facing message)
+STAGE_EVENTS: Dict[str, tuple] = {
+    "Planning": ("PLANNING", "Swarm calibrating for objective..."),
+    "Architecture": ("DESIGN", "Architecting structural implementation..."),
+    "Implementation": ("IMPLEMENT", "Implementer agent generating code base..."),
+    "Revision": ("IMPLEMENT", "Implementer applying consolidated review findings..."),
+}
+
+# Post-implementation reviewers, run concurrently over the same artifact
+REVIEW_AGENTS = ("critic", "optimizer", "auditor")
+SEVERITY_RANK = {"critical": 0, "major": 1, "minor": 2}
+
+class PlanningPrefetch(BaseModel):
+    """Planning inputs gathered speculatively while a mission is still being admitted."""
+    knowledge: List[Dict[str, Any]] = Field(default_factory=list)
+    plan_hit: Optional[StageCacheHit] = None
+
+class ReviewIssue(BaseModel):
+    """A single actionable finding raised by a reviewer."""
+    severity: str = Field(description="One of: critical, major, minor.")
+    location: str = Field(description="File, function or region of the implementation the issue applies to.")
+    problem: str = Field(description="What is wrong.")
+    fix: str = Field(description="The concrete change the implementer should make.")
+    reviewer: str = Field(default="", description="Filled in by the orchestrator.")
+
+class ReviewReport(BaseModel):
+    """Structured verdict of one reviewer."""
+    approved: bool = Field(description="True if the implementation can ship without changes.")
+    summary: str = Field(description="One or two sentence assessment.")
+    issues: List[ReviewIssue] = Field(default_factory=list)
+
+class PatchRequest(BaseModel):
+    """Deduplicated findings of every reviewer, handed to the implementer as one revision round."""
+    issues: List[ReviewIssue]
+    reviewers: List[str]
+
+    @classmethod
+    def merge(cls, reports: Dict[str, ReviewReport], max_issues: int) -> "PatchRequest":
+        seen = set()
+        issues: List[ReviewIssue] = []
+        for reviewer, report in reports.items():
+            for issue in report.issues:
+                key = (issue.location.strip().lower(), issue.problem.strip().lower())
+                if key in seen:
+                    continue
+                seen.add(key)
+                issues.append(issue.model_copy(update={"reviewer": reviewer, "severity": issue.severity.lower()}))
+        issues.sort(key=lambda issue: SEVERITY_RANK.get(issue.severity, len(SEVERITY_RANK)))
+        return cls(issues=issues[:max_issues], reviewers=list(reports))
+
+    def render(self) -> str:
+        return "\n".join(
+            f"{i}. [{issue.severity.upper()}] ({issue.reviewer}) {issue.location}: {issue.problem}\n   Fix: {issue.fix}"
+            for i, issue in enumerate(self.issues, 1)
+        )
+
 class SwarmOrchestrator:
     """
     Coordinates interactions between specialized agents to solve complex objectives.
@@ -30,24 +109,43 @@ class SwarmOrchestrator:
         # Stability & Monitoring Modules
         self.stability = StabilityEngine()
         self.consensus = ConsensusEngine(cluster_ids=[]) 
-        self.recovery = RecoveryEngine(config={"max_corrective_depth": 3})
+        self.recovery = RecoveryEngine(config={"max_corrective_depth": 3}, reasoning_engine=reasoning_engine)
         self.knowledge = KnowledgeBridge()
+
+        from core_config import config as global_config
+        self.benchmarker = ForgeBenchmarker(
+            reasoning_engine,
+            workers=global_config.FORGE_BENCH_WORKERS,
+            samples=global_config.FORGE_BENCH_SAMPLES,
+            warmup=global_config.FORGE_BENCH_WARMUP,
+            timeout=global_config.FORGE_BENCH_TIMEOUT
+        )
         
         logger.info(f"SwarmOrchestrator online with {len(self.active_agents)} specialized agent profiles.")
 
-    async def execute_forge_session(self, user_id: str, objective: str) -> Dict[str, Any]:
+    async def execute_forge_session(self, user_id: str, objective: str, biases: Optional[List[Dict[str, str]]] = None) -> Dict[str, Any]:
         """
-        [THE FORGE] Spawns 3 parallel swarms with distinct architectural biases.
+        [THE FORGE] Spawns parallel swarms with distinct architectural biases (FORGE_BIASES by default).
+        With FORGE_PRUNING enabled, branches are scored at the FORGE_PRUNE_STAGES gates and only
+        the better half continues past each gate.
+        With FORGE_SHARED_PLAN enabled, the bias-independent plan is produced once for the unbiased
+        objective and every branch forks from it at the architecture stage.
         """
+        from core_config import config as global_config
+
         forge_id = str(uuid.uuid4())
         logger.info(f"FORGE: Initiating parallel evolution for session {forge_id}")
+        biases = biases or FORGE_BIASES
+        labels = [bias["label"] for bias in biases]
+
+        gate = None
+        if global_config.ENABLE_FORGE_PRUNING:
+            hints = {bias["label"]: bias["hint"] for bias in biases}
 
-        # Define architectural "biases" for the parallel swarms
-        biases = [
-            {"label": "Performance", "hint": "Prioritize low latency, caching, and memory efficiency."},
-            {"label": "Scalability", "hint": "Prioritize horizontal scaling, statelessness, and pub-sub patterns."},
-            {"label": "Elegance", "hint": "Prioritize clean code, functional patterns, and minimal dependencies."}
-        ]
+            async def score(label: str, stage: str, output: str) -> float:
+                return await self._score_branch_stage(objective, hints[label], stage, output)
+
+            gate = SuccessiveHalvingGate(labels, score, global_config.FORGE_PRUNE_STAGES, min_survivors=global_config.FORGE_MIN_SURVIVORS)
 
         # 1. Register Forge Session
         with SessionLocal() as db:
@@ -55,23 +153,72 @@ class SwarmOrchestrator:
             db.add(branch)
             db.commit()
 
-        # 2. Run Parallel Swarms
-        tasks = []
-        for bias in biases:
-            branch_objective = f"{objective}. [ARCH_BIAS: {bias['hint']}]"
-            tasks.append(self.execute_swarm_objective(branch_objective, mission_id=f"{forge_id}_{bias['label'].lower()}"))
+        # Biased objectives must not share stage outputs through the stage cache
+        branch_config = {**DEFAULT_SWARM_CONFIG, "stage_cache": False}
+        shared_plan: Optional[str] = None
+        shared_plan_tokens: Optional[int] = None
+
+        # 2. Run Parallel Swarms (each branch opens its own mission scope under the forge scope)
+        async def run_branch(bias: Dict[str, str]) -> Dict[str, Any]:
+            label = bias["label"]
+            with budget_scope(f"branch:{label}") as branch_budget:
+                try:
+                    return await self.execute_swarm_objective(
+                        f"{objective}. [ARCH_BIAS: {bias['hint']}]",
+                        config=branch_config,
+                        mission_id=f"{forge_id}_{label.lower()}",
+                        stage_gate=gate.for_branch(label) if gate else None,
+                        shared_plan=shared_plan
+                    )
+                except BranchPruned as pruned:
+                    return {"pruned": pruned, "token_usage": {"used": branch_budget.used}}
+                except BaseException:
+                    # Don't hold surviving branches at a gate this branch will never reach
+                    if gate:
+                        gate.withdraw(label)
+                    raise
 
-        results = await asyncio.gather(*tasks)
+        with mission_registry.track(forge_id) as cancel_token, budget_scope(f"forge:{forge_id}") as forge_budget:
+            try:
+                if global_config.ENABLE_FORGE_SHARED_PLAN:
+                    with budget_scope("branch:shared_plan") as plan_budget:
+                        shared_plan, _ = await self._plan_stage(objective, branch_config, forge_id, None, None)
+                    shared_plan_tokens = plan_budget.used
+                    logger.info(f"FORGE: Shared base plan ready ({shared_plan_tokens} tokens); forking {len(biases)} branches.")
+                results = await asyncio.gather(*[run_branch(bias) for bias in biases])
+
+                # 3. Performance Duel: sandboxed test gate, repeated timings and peak RSS per surviving variant.
+                # Kept inside the forge scope so harness generation is charged and cancellable with the session.
+                finished = {biases[i]["label"]: res for i, res in enumerate(results) if "pruned" not in res}
+                with budget_scope("benchmark"):
+                    benchmarks = await self.benchmarker.benchmark(objective, finished)
+            except (asyncio.CancelledError, MissionCancelled):
+                if not cancel_token.cancelled:
+                    raise
+                acknowledge_cancellation()
+                raise MissionCancelled(forge_id, cancel_token.cancel_reason, forge_budget.get_report()) from None
 
-        # 3. Performance Duel Metrics (Mock Benchmarking)
         metrics = {}
         for i, res in enumerate(results):
             label = biases[i]['label']
+            if "pruned" in res:
+                metrics[label] = {
+                    "pruned_at": res["pruned"].stage,
+                    "stage_score": res["pruned"].score,
+                    "tokens_used": res["token_usage"]["used"]
+                }
+                continue
+            bench = benchmarks[label]
             metrics[label] = {
-                "latency_ms": 10 + (i * 5),
-                "complexity_score": 0.8 - (i * 0.1),
-                "security_rating": "A+" if i == 0 else "A",
-                "tokens_used": len(res.get("content", "")) // 4
+                "latency_ms": bench.mean_ms,
+                "latency_ci95_ms": bench.ci95_ms,
+                "latency_samples": len(bench.samples_ms),
+                "peak_rss_mb": bench.peak_rss_mb,
+                "tests_passed": bench.tests_passed,
+                "rank": bench.rank,
+                "benchmark_error": bench.error,
+                "cyclomatic_complexity": bench.complexity,
+                "tokens_used": res["token_usage"]["used"]
             }
 
         with SessionLocal() as db:
@@ -80,26 +227,48 @@ class SwarmOrchestrator:
                 branch.metrics_json = json.dumps(metrics)
                 db.commit()
 
-        return {"forge_id": forge_id, "branches": metrics}
+        winner = next((label for label, bench in benchmarks.items() if bench.rank == 1), None)
+        if winner:
+            significance = "significant" if benchmarks[winner].significant else "within confidence intervals of the runner-up"
+            logger.info(f"FORGE: {winner} is fastest ({benchmarks[winner].mean_ms}ms, {significance}).")
+        return {"forge_id": forge_id, "branches": metrics, "winner": winner, "shared_plan_tokens": shared_plan_tokens}
+
+    async def _score_branch_stage(self, objective: str, bias_hint: str, stage: str, output: str) -> float:
+        """
+        Cheap successive-halving scorer: rates one branch's stage output with SECONDARY_MODEL.
+        """
+        from core_config import config as global_config
+
+        verdict = await self.reasoning.generate_response(
+            system_prompt=(
+                "You are a strict technical reviewer ranking competing designs. "
+                "Score how well the output serves the objective and its stated architectural bias: "
+                "correctness, completeness and feasibility matter more than style."
+            ),
+            user_prompt=f"Objective: {objective}\nArchitectural Bias: {bias_hint}\nStage: {stage}\n\nOutput:\n{output}",
+            temperature=0.0,
+            response_model=StageScore,
+            model_override=global_config.SECONDARY_MODEL,
+            call_site="forge.score_stage"
+        )
+        return verdict.score
 
     async def _record_trace_step(self, mission_id: str, step_index: int, agent_role: str, label: str, reasoning: str, code: str):
         """
-        [CHRONOS ENGINE] Persists a single reasoning thought and code snapshot.
+        [CHRONOS ENGINE] Queues a single reasoning thought and code snapshot for write-behind persistence.
         """
         if not mission_id: return
         
         try:
-            with SessionLocal() as db:
-                trace = MissionTraceStep(
-                    mission_id=mission_id,
-                    step_index=step_index,
-                    agent_role=agent_role,
-                    label=label,
-                    reasoning_content=reasoning,
-                    code_snapshot=code
-                )
-                db.add(trace)
-                db.commit()
+            await trace_writer.enqueue(MissionTraceStep(
+                mission_id=mission_id,
+                step_index=step_index,
+                agent_role=agent_role,
+                label=label,
+                reasoning_content=reasoning,
+                code_snapshot=code,
+                timestamp=datetime.datetime.utcnow()  # Stamp now, not at flush time
+            ))
         except Exception as e:
             logger.error(f"CHRONOS: Failed to record trace step: {e}")
 
@@ -116,54 +285,140 @@ class SwarmOrchestrator:
         [HEARTBEAT] Emits a live diagnostic pulse to the global audit stream.
         """
         try:
-            with SessionLocal() as db:
-                log = AuditLog(
-                    user_id="SYSTEM",  # Internal orchestrator pulse
-                    action=f"HEARTBEAT:{agent_role}:{action}",
-                    metadata_json=json.dumps({"mission_id": mission_id, "severity": severity, "timestamp": str(datetime.datetime.utcnow())})
-                )
-                db.add(log)
-                db.commit()
+            now = datetime.datetime.utcnow()
+            await trace_writer.enqueue(AuditLog(
+                user_id="SYSTEM",  # Internal orchestrator pulse
+                action=f"HEARTBEAT:{agent_role}:{action}",
+                metadata_json=json.dumps({"mission_id": mission_id, "severity": severity, "timestamp": str(now)}),
+                timestamp=now
+            ))
         except Exception as e:
             logger.error(f"ORCHESTRATOR: Heartbeat failure: {e}")
 
-    async def execute_swarm_objective(self, objective: str, config: dict | None = None, mission_id: str | None = None, org_id: str | None = None) -> Dict[str, Any]:
+    async def _emit_event(self, event_sink: Optional[EventSink], event: Dict[str, Any]):
+        """
+        Forwards a live mission event to the caller's sink, if one is attached.
+        """
+        if event_sink is None:
+            return
+        try:
+            await event_sink(event)
+        except Exception as e:
+            logger.warning(f"ORCHESTRATOR: Event sink rejected {event.get('status')}: {e}")
+
+    async def execute_swarm_objective(self, objective: str, config: dict | None = None, mission_id: str | None = None, org_id: str | None = None, event_sink: Optional[EventSink] = None, stage_gate: Optional[StageGate] = None, shared_plan: Optional[str] = None, prefetch: Optional["asyncio.Future[PlanningPrefetch]"] = None, user_id: str | None = None) -> Dict[str, Any]:
         """
         Hierarchical execution objective through the swarm.
         Supports TRACE instrumentation for the Chronos Engine.
+        When an `event_sink` is attached, stage transitions and streamed LLM deltas are pushed to it live.
+        Token spend is accounted in a mission budget scope and reported under `token_usage`.
+        A `stage_gate` is awaited after the planning, architecture and implementation stages.
+        A `shared_plan` computed by the caller replaces the planning stage; the objective is then
+        passed to the architect alongside it.
+        A `prefetch` task started with `prefetch_planning` supplies the planning stage's inputs.
+        The mission is registered in the mission registry; cancelling it there raises MissionCancelled.
+        Stage checkpoints are owned by `user_id` and deleted once the mission completes.
         """
+        from core_config import config as global_config
+
+        registry_id = mission_id or f"adhoc-{uuid.uuid4().hex[:8]}"
+        with mission_registry.track(registry_id) as cancel_token, \
+                budget_scope(f"mission:{mission_id or 'adhoc'}", limit=global_config.GLOBAL_TOKEN_BUDGET) as mission_budget:
+            try:
+                result = await self._run_swarm_objective(objective, config, mission_id, org_id, event_sink, stage_gate, shared_plan, prefetch, user_id)
+            except asyncio.CancelledError:
+                if not cancel_token.cancelled:
+                    raise
+                # Registry cancellation is an expected outcome, not a cancelled caller
+                acknowledge_cancellation()
+                logger.warning(f"ORCHESTRATOR: Mission {registry_id} cancelled after {mission_budget.used} tokens.")
+                asyncio.ensure_future(self._emit_heartbeat(mission_id, "orchestrator", "MISSION_CANCELLED", severity="WARNING"))
+                raise MissionCancelled(registry_id, cancel_token.cancel_reason, mission_budget.get_report()) from None
+        result["token_usage"] = mission_budget.get_report()
+        if mission_id and global_config.ENABLE_MISSION_CHECKPOINTS:
+            await mission_checkpoints.clear(mission_id, retention_hours=global_config.MISSION_CHECKPOINT_RETENTION_HOURS)
+        return result
+
+    async def _run_swarm_objective(self, objective: str, config: dict | None, mission_id: str | None, org_id: str | None, event_sink: Optional[EventSink], stage_gate: Optional[StageGate] = None, shared_plan: Optional[str] = None, prefetch: Optional["asyncio.Future[PlanningPrefetch]"] = None, user_id: str | None = None) -> Dict[str, Any]:
         self.knowledge.org_id = org_id # Bound knowledge to org context
-        config = config or {"agents": {"auditor": True, "optimizer": True, "critic": True}, "creativity": 0.5, "strictness": 0.8}
+        config = config or dict(DEFAULT_SWARM_CONFIG)
+        cache_scope = self._tenant_scope(org_id, user_id)
         logger.info(f"Swarm mobilization triggered for objective: {objective}")
         
         step_idx = 0
 
-        # 0. RETRIEVE PERSISTENT MEMORY
-        past_knowledge = await self.knowledge.retrieve_relevant_knowledge(objective)
-        memory_context = self.knowledge.format_knowledge_context(past_knowledge)
-        
-        # 1. PLAN
-        await self._emit_heartbeat(mission_id, "planner", "START_PLANNING")
-        await self._broadcast_telepresence(mission_id, "PLANNING_INITIATED", {"objective": objective}, org_id)
-        
-        plan = await self._execute_with_recovery("planner", f"{objective}\n\n{memory_context}", config, mission_id, "Planning")
-        await self._record_trace_step(mission_id, step_idx, "planner", "Planning", plan, "")
-        step_idx += 1
+        # Stages this mission ID already completed (same objective and config) are skipped
+        checkpoints = await self._load_checkpoints(mission_id, objective, config, event_sink, user_id)
+
+        async def checkpoint(stage: str, output: str) -> None:
+            if mission_id and checkpoints is not None:
+                await mission_checkpoints.save(mission_id, objective, config, StageCheckpoint(stage=stage, output=output, next_step_index=step_idx), user_id=user_id)
+
+        check_cancelled()
+        plan_reused = False
+        resumed = checkpoints.get("planning") if checkpoints else None
+        if prefetch is not None and (resumed or shared_plan is not None):
+            prefetch.cancel()  # Speculative planning inputs are not needed
+        if resumed:
+            plan, step_idx = resumed.output, resumed.next_step_index
+        else:
+            if shared_plan is not None:
+                plan = shared_plan
+                await self._emit_event(event_sink, {"status": "PLANNING", "message": "Adopting the shared base plan...", "stage": "planner", "shared": True})
+            else:
+                prefetched = await self._settle_prefetch(prefetch)
+                plan, plan_reused = await self._plan_stage(objective, config, mission_id, org_id, event_sink, prefetched, cache_scope)
+            await self._record_trace_step(mission_id, step_idx, "planner", "Planning", plan, "")
+            step_idx += 1
+            await checkpoint("planning", plan)
+        # A shared plan is identical across branches, so there is nothing to gate on
+        if stage_gate and shared_plan is None:
+            await stage_gate("planning", plan)
 
         # 2. DESIGN
-        await self._emit_heartbeat(mission_id, "architect", "START_DESIGNING")
-        design = await self._execute_with_recovery("architect", f"Design: {plan}", config, mission_id, "Architecture")
-        await self._record_trace_step(mission_id, step_idx, "architect", "Architecture", design, "")
-        step_idx += 1
+        check_cancelled()
+        resumed = checkpoints.get("architecture") if checkpoints else None
+        if resumed:
+            design, step_idx = resumed.output, resumed.next_step_index
+        else:
+            await self._emit_heartbeat(mission_id, "architect", "START_DESIGNING")
+            # A cached design is only valid verbatim on top of the plan it was made for
+            design_hit = await self._lookup_stage_cache("architect", objective, config, cache_scope, allow_reuse=plan_reused)
+            # With a shared plan, the mission's own objective (e.g. a Forge bias) enters at this stage
+            prompt = f"Design: {plan}" if shared_plan is None else f"Objective: {objective}\n\nDesign: {plan}"
+            design = await self._adopt_cached_stage("architect", "Architecture", prompt, design_hit, config, mission_id, event_sink) if design_hit else None
+            if design is None:
+                design = await self._execute_with_recovery("architect", prompt, config, mission_id, "Architecture", event_sink)
+            if not (design_hit and design_hit.mode == "reuse"):
+                await self._store_stage_cache("architect", objective, config, cache_scope, design)
+            await self._record_trace_step(mission_id, step_idx, "architect", "Architecture", design, "")
+            step_idx += 1
+            await checkpoint("architecture", design)
+        if stage_gate:
+            await stage_gate("architecture", design)
 
         # 3. IMPLEMENT
-        await self._emit_heartbeat(mission_id, "implementer", "START_IMPLEMENTATION")
-        implementation = await self._execute_with_recovery("implementer", f"Execute design: {design}", config, mission_id, "Implementation")
-        await self._record_trace_step(mission_id, step_idx, "implementer", "Implementation", "Initial Code Draft Generated", implementation)
-        step_idx += 1
+        check_cancelled()
+        resumed = checkpoints.get("implementation") if checkpoints else None
+        if resumed:
+            implementation, step_idx = resumed.output, resumed.next_step_index
+        else:
+            await self._emit_heartbeat(mission_id, "implementer", "START_IMPLEMENTATION")
+            implementation = await self._execute_with_recovery("implementer", f"Execute design: {design}", config, mission_id, "Implementation", event_sink)
+            await self._record_trace_step(mission_id, step_idx, "implementer", "Implementation", "Initial Code Draft Generated", implementation)
+            step_idx += 1
+            await checkpoint("implementation", implementation)
+        if stage_gate:
+            await stage_gate("implementation", implementation)
         
-        # ... logic for critic, optimizer etc ...
-        final_result = implementation
+        # 4. REVIEW (critic / optimizer / auditor fan-out) and a single REVISION round
+        check_cancelled()
+        resumed = checkpoints.get("review") if checkpoints else None
+        if resumed:
+            final_result, step_idx = resumed.output, resumed.next_step_index
+        else:
+            final_result, step_idx = await self._review_and_revise(objective, implementation, config, mission_id, step_idx, event_sink)
+            await checkpoint("review", final_result)
         
         logger.info("Swarm objective cycle finalized.")
         
@@ -187,6 +442,248 @@ class SwarmOrchestrator:
             
             return {"is_multifile": False, "content": final_result, "file_map": {}}
 
+    async def _load_checkpoints(self, mission_id: str | None, objective: str, config: dict, event_sink: Optional[EventSink], user_id: str | None = None) -> Optional[Dict[str, StageCheckpoint]]:
+        """
+        Returns the mission's completed stages, or None when checkpointing is off for this run.
+        Only checkpoints written for the same `user_id` are resumed.
+        """
+        from core_config import config as global_config
+
+        if not mission_id or not global_config.ENABLE_MISSION_CHECKPOINTS:
+            return None
+        checkpoints = await mission_checkpoints.load(mission_id, objective, config, user_id=user_id)
+        if checkpoints:
+            mission_checkpoints.stages_resumed += len(checkpoints)
+            stages = sorted(checkpoints, key=lambda stage: checkpoints[stage].next_step_index)
+            logger.info(f"CHECKPOINT: Resuming mission {mission_id}; skipping completed stages {stages}.")
+            await self._emit_heartbeat(mission_id, "orchestrator", f"RESUMED:{','.join(stages)}")
+            await self._emit_event(event_sink, {"status": "RESUMED", "message": f"Resuming mission from checkpoint ({', '.join(stages)} complete).", "stages": stages})
+        return checkpoints
+
+    async def prefetch_planning(self, objective: str, config: dict | None = None, org_id: str | None = None, user_id: str | None = None) -> PlanningPrefetch:
+        """
+        Gathers the planning stage's inputs (persistent memory and the plan-cache lookup) concurrently.
+        Meant to run as a task while the mission is being admitted; cancel it if admission is denied.
+        """
+        config = config or dict(DEFAULT_SWARM_CONFIG)
+        plan_hit, knowledge = await asyncio.gather(
+            self._lookup_stage_cache("planner", objective, config, self._tenant_scope(org_id, user_id)),
+            self.knowledge.retrieve_relevant_knowledge(objective, org_id=org_id)
+        )
+        return PlanningPrefetch(knowledge=knowledge, plan_hit=plan_hit)
+
+    async def _settle_prefetch(self, prefetch: Optional["asyncio.Future[PlanningPrefetch]"]) -> Optional[PlanningPrefetch]:
+        """Awaits a speculative prefetch; None (plan from scratch) if it was cancelled or failed."""
+        if prefetch is None or prefetch.cancelled():
+            return None
+        try:
+            return await prefetch
+        except Exception as e:
+            logger.warning(f"ORCHESTRATOR: Planning prefetch failed ({e}); retrieving inline.")
+            return None
+
+    async def _plan_stage(self, objective: str, config: dict, mission_id: str | None, org_id: str | None, event_sink: Optional[EventSink], prefetched: Optional[PlanningPrefetch] = None, cache_scope: str | None = None) -> tuple:
+        """
+        Runs the planning stage (persistent memory retrieval, then the planner) and returns
+        (plan, reused_from_cache). Inputs already `prefetched` are not fetched again.
+        """
+        # A near-identical objective planned earlier in this org is reused without a model call
+        if prefetched is not None:
+            plan_hit = prefetched.plan_hit
+        else:
+            plan_hit = await self._lookup_stage_cache("planner", objective, config, cache_scope)
+        if plan_hit and plan_hit.mode == "reuse":
+            return await self._adopt_cached_stage("planner", "Planning", objective, plan_hit, config, mission_id, event_sink), True
+
+        # 0. RETRIEVE PERSISTENT MEMORY
+        if prefetched is not None:
+            past_knowledge = prefetched.knowledge
+        else:
+            past_knowledge = await self.knowledge.retrieve_relevant_knowledge(objective)
+        memory_context = self.knowledge.format_knowledge_context(past_knowledge)
+
+        # 1. PLAN
+        await self._emit_heartbeat(mission_id, "planner", "START_PLANNING")
+        await self._broadcast_telepresence(mission_id, "PLANNING_INITIATED", {"objective": objective}, org_id)
+
+        prompt = f"{objective}\n\n{memory_context}"
+        plan = await self._adopt_cached_stage("planner", "Planning", prompt, plan_hit, config, mission_id, event_sink) if plan_hit else None
+        if plan is None:
+            plan = await self._execute_with_recovery("planner", prompt, config, mission_id, "Planning", event_sink)
+        await self._store_stage_cache("planner", objective, config, cache_scope, plan)
+        return plan, False
+
+    @staticmethod
+    def _tenant_scope(org_id: str | None, user_id: str | None) -> Optional[str]:
+        """Stage cache namespace of a mission: its org, else its user, else None (no caching)."""
+        if org_id:
+            return f"org:{org_id}"
+        if user_id:
+            return f"user:{user_id}"
+        return None
+
+    def _stage_cache_profile(self, agent_key: str, config: dict) -> Optional[str]:
+        """
+        Cache profile of an agent (its name and persona prompt), or None when the stage cache is
+        off globally or for this mission (`{"stage_cache": false}`).
+        """
+        from core_config import config as global_config
+
+        agent = self.active_agents.get(agent_key)
+        if agent is None or not global_config.ENABLE_STAGE_CACHE or config.get("stage_cache") is False:
+            return None
+        return profile_fingerprint(agent.name, agent.system_prompt)
+
+    async def _lookup_stage_cache(self, agent_key: str, objective: str, config: dict, scope: str | None, allow_reuse: bool = True) -> Optional[StageCacheHit]:
+        """Missions without a tenant scope never read from the shared cache."""
+        profile = self._stage_cache_profile(agent_key, config)
+        if profile is None or scope is None:
+            return None
+        return await stage_result_cache.lookup(scope, agent_key, profile, objective, allow_reuse=allow_reuse)
+
+    async def _store_stage_cache(self, agent_key: str, objective: str, config: dict, scope: str | None, output: str):
+        profile = self._stage_cache_profile(agent_key, config)
+        if profile is not None and scope is not None:
+            await stage_result_cache.store(scope, agent_key, profile, objective, output)
+
+    async def _adopt_cached_stage(self, agent_key: str, step_label: str, prompt: str, hit: StageCacheHit, config: dict, mission_id: str | None, event_sink: Optional[EventSink]) -> Optional[str]:
+        """
+        Produces a stage output from a cache hit. A 'reuse' hit is replayed as-is; a 'warm_start'
+        hit is handed to SECONDARY_MODEL as a draft to adapt to `prompt`. Returns None if the warm
+        start fails, in which case the caller runs the stage normally.
+        """
+        from core_config import config as global_config
+
+        status, message = STAGE_EVENTS.get(step_label, (step_label.upper(), f"{step_label} in progress..."))
+        await self._emit_heartbeat(mission_id, agent_key, f"STAGE_CACHE_{hit.mode.upper()}:{hit.similarity}")
+        await self._emit_event(event_sink, {"status": status, "message": message, "stage": agent_key, "cache": hit.mode, "similarity": hit.similarity})
+        if hit.mode == "reuse":
+            await self._emit_event(event_sink, {"status": "DELTA", "stage": status, "delta": hit.output})
+            return hit.output
+
+        agent = self.active_agents[agent_key]
+        warm_prompt = (
+            f"{prompt}\n\n"
+            f"--- DRAFT FROM A CLOSELY RELATED OBJECTIVE ---\n"
+            f"Objective: {hit.objective}\n\n{hit.output}\n\n"
+            f"Adapt the draft to the request above: keep what still applies, correct what differs, "
+            f"and return only the complete revised output."
+        )
+        try:
+            with budget_scope(f"agent:{agent_key}", limit=agent.independent_token_budget):
+                chunks: List[str] = []
+                async for delta in self.reasoning.stream_response(
+                    system_prompt=agent.system_prompt,
+                    user_prompt=warm_prompt,
+                    temperature=0.1 + (config.get("creativity", 0.5) * 0.8),
+                    model_override=global_config.SECONDARY_MODEL,
+                    call_site=f"swarm.{agent_key}.warm_start"
+                ):
+                    chunks.append(delta)
+                    await self._emit_event(event_sink, {"status": "DELTA", "stage": status, "delta": delta})
+            adapted = "".join(chunks)
+            if len(adapted) < 50:
+                raise ValueError("Warm-start output too short.")
+            return adapted
+        except Exception as e:
+            logger.warning(f"STAGE_CACHE: Warm start for {agent_key} failed ({e}); running the stage from scratch.")
+            await self._emit_event(event_sink, {"status": "STAGE_RETRY", "stage": status, "attempt": 1})
+            return None
+
+    async def resume_mission(self, mission_id: str, user_id: str | None, org_id: str | None = None, event_sink: Optional[EventSink] = None) -> Dict[str, Any]:
+        """
+        Re-runs a checkpointed mission with its original objective and config, continuing from
+        the first incomplete stage. Only the mission's owner may resume it.
+        """
+        if not is_valid_mission_id(mission_id):
+            raise ValueError(f"Invalid mission ID {mission_id!r}.")
+        spec = await mission_checkpoints.get_mission_spec(mission_id)
+        if spec is None or await mission_checkpoints.get_owner(mission_id) != user_id:
+            raise ValueError(f"No checkpoints found for mission {mission_id}.")
+        return await self.execute_swarm_objective(spec["objective"], config=spec["config"], mission_id=mission_id, org_id=org_id, event_sink=event_sink, user_id=user_id)
+
+    async def _review_and_revise(self, objective: str, implementation: str, config: dict, mission_id: str | None, step_idx: int, event_sink: Optional[EventSink]) -> tuple:
+        """
+        Runs the enabled reviewers concurrently over the implementation, merges their findings
+        into one PatchRequest and, if anything must change, gives the implementer one revision round.
+        Returns the (possibly revised) implementation and the next trace step index.
+        """
+        from core_config import config as global_config
+
+        enabled = config.get("agents", {})
+        reviewers = [key for key in REVIEW_AGENTS if enabled.get(key) and key in self.active_agents]
+        if not reviewers:
+            return implementation, step_idx
+
+        await self._emit_heartbeat(mission_id, "orchestrator", f"START_REVIEW:{','.join(reviewers)}")
+        await self._emit_event(event_sink, {"status": "AUDIT", "message": f"{len(reviewers)} reviewers auditing implementation...", "stage": "review"})
+
+        async def review(agent_key: str) -> Optional[ReviewReport]:
+            report = await self._request_review(agent_key, objective, implementation, config)
+            if report is not None:
+                await self._emit_event(event_sink, {
+                    "status": "CRITIQUE",
+                    "stage": agent_key,
+                    "approved": report.approved,
+                    "message": report.summary,
+                    "issues": len(report.issues)
+                })
+            return report
+
+        results = await asyncio.gather(*[review(key) for key in reviewers])
+        reports = {key: report for key, report in zip(reviewers, results) if report is not None}
+        for agent_key, report in reports.items():
+            await self._record_trace_step(mission_id, step_idx, agent_key, "Review", report.model_dump_json(indent=2), "")
+            step_idx += 1
+
+        patch = PatchRequest.merge(reports, max_issues=global_config.SWARM_REVIEW_MAX_ISSUES)
+        if not patch.issues:
+            logger.info(f"REVIEW: Implementation approved by {list(reports)}.")
+            return implementation, step_idx
+
+        check_cancelled()
+        logger.info(f"REVIEW: {len(patch.issues)} findings from {patch.reviewers}; requesting one revision round.")
+        await self._emit_heartbeat(mission_id, "implementer", "START_REVISION")
+        revision_prompt = (
+            f"Objective: {objective}\n\n"
+            f"Current Implementation:\n{implementation}\n\n"
+            f"Consolidated Review Findings (most severe first):\n{patch.render()}\n\n"
+            "Apply every fix that is correct for the objective. Return the complete revised implementation "
+            "in exactly the same format as the current one."
+        )
+        try:
+            revised = await self._execute_with_recovery("implementer", revision_prompt, config, mission_id, "Revision", event_sink)
+        except Exception as e:
+            logger.error(f"REVIEW: Revision round failed ({e}); keeping the reviewed implementation.")
+            return implementation, step_idx
+
+        await self._record_trace_step(mission_id, step_idx, "implementer", "Revision", patch.render(), revised)
+        return revised, step_idx + 1
+
+    async def _request_review(self, agent_key: str, objective: str, implementation: str, config: dict) -> Optional[ReviewReport]:
+        """
+        Asks one reviewer for a structured report. Reviews are advisory: a failed reviewer yields None.
+        """
+        agent = self.active_agents[agent_key]
+        prompt = (
+            f"Objective: {objective}\n\n"
+            f"Implementation Under Review:\n{implementation}\n\n"
+            "Review it strictly within your specialization. Report only actionable issues, each with a concrete fix. "
+            "Approve if nothing needs to change."
+        )
+        try:
+            with budget_scope(f"agent:{agent_key}", limit=agent.independent_token_budget):
+                return await self.reasoning.generate_response(
+                    system_prompt=agent.system_prompt,
+                    user_prompt=prompt,
+                    response_model=ReviewReport,
+                    temperature=0.1 + (1.0 - config.get("strictness", 0.8)) * 0.4,
+                    call_site=f"swarm.{agent_key}.review"
+                )
+        except Exception as e:
+            logger.warning(f"REVIEW: {agent_key} review failed: {e}")
+            return None
+
     async def recursive_optimize(self, mission_telemetry: List[Dict[str, Any]]):
         """
         Self-modification hook. Analyzes past telemetry to propose improvements
@@ -207,17 +704,29 @@ class SwarmOrchestrator:
         # Integrate with MetaGovernance for authorization
         return proposal
 
-    async def _execute_with_recovery(self, agent_key: str, prompt: str, config: dict, mission_id: str, step_label: str) -> str:
+    async def _execute_with_recovery(self, agent_key: str, prompt: str, config: dict, mission_id: str, step_label: str, event_sink: Optional[EventSink] = None) -> str:
         """
         Wraps agent delegation with an autonomous self-correction loop.
+        With an `event_sink`, the agent's output is streamed to it as DELTA events.
         """
         attempts = 0
         max_attempts = self.recovery.max_corrective_depth
         current_prompt = prompt
 
+        status, message = STAGE_EVENTS.get(step_label, (step_label.upper(), f"{step_label} in progress..."))
+        on_delta = None
+        if event_sink is not None:
+            await self._emit_event(event_sink, {"status": status, "message": message, "stage": agent_key})
+
+            async def on_delta(delta: str):
+                await self._emit_event(event_sink, {"status": "DELTA", "stage": status, "delta": delta})
+
         while attempts < max_attempts:
             try:
-                response = await self._delegate_to_agent(agent_key, current_prompt, config)
+                if attempts > 0:
+                    # Clients discard the partial stream of the failed attempt
+                    await self._emit_event(event_sink, {"status": "STAGE_RETRY", "stage": status, "attempt": attempts + 1})
+                response = await self._delegate_to_agent(agent_key, current_prompt, config, on_delta=on_delta)
                 
                 # Heuristic: Check if the response seems like a failure or is too short
                 if len(response) < 50 or "error" in response.lower() or "failed" in response.lower():
@@ -243,11 +752,11 @@ class SwarmOrchestrator:
         
         return "" # Should not reach here due to raise e
 
-    async def _delegate_to_agent(self, agent_key: str, prompt: str, config: dict | None = None) -> str:
+    async def _delegate_to_agent(self, agent_key: str, prompt: str, config: dict | None = None, on_delta: Optional[Callable[[str], Awaitable[None]]] = None) -> str:
         """
         Routes a subtask to a specific specialized agent.
+        If `on_delta` is given, the completion is streamed and each content delta is forwarded to it.
         """
-        from core_config import config as global_config
         config = config or {"creativity": 0.5, "strictness": 0.8}
         
         agent = self.active_agents.get(agent_key)
@@ -262,29 +771,36 @@ class SwarmOrchestrator:
 
         logger.debug(f"Delegating to {agent.name} (Role: {agent.role})...")
         
-        # Override the global task limit with the agent's independent heavy-duty budget
-        original_limit = global_config.TASK_TOKEN_LIMIT
-        global_config.TASK_TOKEN_LIMIT = agent.independent_token_budget
-        self.reasoning.tokens.reset_task_usage()
-        
-        try:
+        # The agent's independent heavy-duty budget is scoped to this delegation (and its task),
+        # so concurrent branches never see each other's limits or counters
+        with budget_scope(f"agent:{agent_key}", limit=agent.independent_token_budget):
             # Adjust temperature based on creativity (creativity 0..1 -> temp 0.1..0.9)
             temp = 0.1 + (config.get("creativity", 0.5) * 0.8)
 
             # We wrap the reasoning request with the agent's specific persona
-            response = await self.reasoning.generate_response(
-                system_prompt=agent.system_prompt,
-                user_prompt=prompt,
-                temperature=temp 
-            )
+            if on_delta is None:
+                response = await self.reasoning.generate_response(
+                    system_prompt=agent.system_prompt,
+                    user_prompt=prompt,
+                    temperature=temp,
+                    call_site=f"swarm.{agent_key}"
+                )
+            else:
+                chunks: List[str] = []
+                async for delta in self.reasoning.stream_response(
+                    system_prompt=agent.system_prompt,
+                    user_prompt=prompt,
+                    temperature=temp,
+                    call_site=f"swarm.{agent_key}"
+                ):
+                    chunks.append(delta)
+                    await on_delta(delta)
+                response = "".join(chunks)
             
             # Bottleneck Detection Logic
             if "REASONING_FRAGMENTED" in response:
                 logger.warning("ORCHESTRATOR: Reasoning bottleneck detected. Spawning specialist...")
                 await self.spawner.biosynthesize_specialist(prompt, "Output indicated reasoning fragmentation.")
-                
-        finally:
-            global_config.TASK_TOKEN_LIMIT = original_limit
             
         return response
 
@@ -297,17 +813,18 @@ class SwarmOrchestrator:
         
         logger.info(f"CONSENSUS: Dispatching {agent_key} task to {len(models)} models in parallel.")
         
-        tasks = []
-        for model in models:
-            # Note: Assuming reasoning_engine can take a specific model string
-            tasks.append(self.reasoning.generate_response(
-                system_prompt=agent.system_prompt,
-                user_prompt=prompt,
-                temperature=0.1 + (config.get("creativity", 0.5) * 0.8),
-                model_override=model
-            ))
+        async def ask(model: str) -> str:
+            # Each model votes under its own copy of the agent budget
+            with budget_scope(f"agent:{agent_key}:{model}", limit=agent.independent_token_budget):
+                return await self.reasoning.generate_response(
+                    system_prompt=agent.system_prompt,
+                    user_prompt=prompt,
+                    temperature=0.1 + (config.get("creativity", 0.5) * 0.8),
+                    model_override=model,
+                    call_site=f"swarm.{agent_key}.consensus"
+                )
         
-        responses = await asyncio.gather(*tasks)
+        responses = await asyncio.gather(*[ask(model) for model in models])
         
         decisions = []
         for i, resp in enumerate(responses):
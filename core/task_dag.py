@@ -0,0 +1,158 @@
+"""
+Dependency-aware concurrent executor for GoalPlanner plans.
+Runs each task as soon as its prerequisites succeed, up to a concurrency cap, and hands
+the prerequisites' outputs to the dependent task.
+"""
+import asyncio
+from typing import Awaitable, Callable, Dict, List, Optional
+
+from pydantic import BaseModel
+
+from core.goal_planner import Plan, TaskDefinition
+from utils.logger import logger
+
+
+class PlanCycleError(ValueError):
+    """Raised when a plan's dependencies do not form a DAG."""
+
+
+class TaskOutcome(BaseModel):
+    """
+    Result of a single plan task.
+    """
+    task_id: str
+    success: bool
+    output: str = ""
+    error: Optional[str] = None
+    skipped: bool = False
+    steps: int = 0  # Decision steps the task consumed
+
+
+TaskRunner = Callable[[TaskDefinition, Dict[str, str]], Awaitable[TaskOutcome]]
+
+
+class DAGExecutor:
+    """
+    Schedules plan tasks by dependency.
+
+    When a task fails, its transitive dependents are skipped. With `fail_fast`, the first
+    failure also stops new launches and cancels tasks still running.
+    """
+
+    def __init__(self, run_task: TaskRunner, max_concurrency: int = 4, fail_fast: bool = True):
+        self.run_task = run_task
+        self.max_concurrency = max(1, max_concurrency)
+        self.fail_fast = fail_fast
+
+    @staticmethod
+    def resolve_dependencies(plan: Plan) -> Dict[str, List[str]]:
+        """
+        Returns task id -> known prerequisite ids, raising PlanCycleError if the graph has a cycle.
+        Dependencies on ids that are not in the plan are dropped with a warning.
+        """
+        ids = [task.id for task in plan.tasks]
+        if len(set(ids)) != len(ids):
+            raise PlanCycleError(f"Plan contains duplicate task ids: {sorted({i for i in ids if ids.count(i) > 1})}")
+
+        known = set(ids)
+        deps: Dict[str, List[str]] = {}
+        for task in plan.tasks:
+            unknown = [d for d in task.dependencies if d not in known]
+            if unknown:
+                logger.warning(f"DAG: Task {task.id} depends on unknown tasks {unknown}; ignoring them.")
+            deps[task.id] = [d for d in dict.fromkeys(task.dependencies) if d in known]
+
+        # Kahn's algorithm; anything left unvisited sits on a cycle
+        indegree = {task_id: len(d) for task_id, d in deps.items()}
+        dependents: Dict[str, List[str]] = {task_id: [] for task_id in deps}
+        for task_id, prereqs in deps.items():
+            for prereq in prereqs:
+                dependents[prereq].append(task_id)
+        frontier = [task_id for task_id, n in indegree.items() if n == 0]
+        visited = 0
+        while frontier:
+            current = frontier.pop()
+            visited += 1
+            for child in dependents[current]:
+                indegree[child] -= 1
+                if indegree[child] == 0:
+                    frontier.append(child)
+        if visited != len(deps):
+            cyclic = sorted(task_id for task_id, n in indegree.items() if n > 0)
+            raise PlanCycleError(f"Plan dependencies contain a cycle among: {cyclic}")
+        return deps
+
+    async def execute(self, plan: Plan) -> Dict[str, TaskOutcome]:
+        """
+        Runs the plan and returns the outcome of every task, keyed by task id.
+        """
+        deps = self.resolve_dependencies(plan)
+        tasks = {task.id: task for task in plan.tasks}
+        dependents: Dict[str, List[str]] = {task_id: [] for task_id in deps}
+        for task_id, prereqs in deps.items():
+            for prereq in prereqs:
+                dependents[prereq].append(task_id)
+
+        waiting = {task_id: len(prereqs) for task_id, prereqs in deps.items()}
+        # Preserve plan order among tasks that become ready together
+        ready: List[str] = [task.id for task in plan.tasks if waiting[task.id] == 0]
+        outcomes: Dict[str, TaskOutcome] = {}
+        running: Dict[asyncio.Future, str] = {}
+        halted = False
+
+        def skip_dependents(task_id: str, reason: str) -> None:
+            stack = list(dependents[task_id])
+            while stack:
+                child = stack.pop()
+                if child in outcomes:
+                    continue
+                outcomes[child] = TaskOutcome(task_id=child, success=False, skipped=True, error=reason)
+                stack.extend(dependents[child])
+
+        try:
+            while (ready and not halted) or running:
+                while ready and not halted and len(running) < self.max_concurrency:
+                    task_id = ready.pop(0)
+                    if task_id in outcomes:
+                        continue
+                    dep_outputs = {d: outcomes[d].output for d in deps[task_id]}
+                    logger.info(f"DAG: Launching task {task_id} ({len(running) + 1}/{self.max_concurrency} slots)")
+                    running[asyncio.ensure_future(self.run_task(tasks[task_id], dep_outputs))] = task_id
+
+                if not running:
+                    continue
+
+                done, _ = await asyncio.wait(running.keys(), return_when=asyncio.FIRST_COMPLETED)
+                for future in done:
+                    task_id = running.pop(future)
+                    if future.cancelled():
+                        outcomes[task_id] = TaskOutcome(task_id=task_id, success=False, skipped=True, error="Cancelled after an earlier failure")
+                        continue
+                    try:
+                        outcome = future.result()
+                    except Exception as e:
+                        outcome = TaskOutcome(task_id=task_id, success=False, error=str(e))
+                    outcomes[task_id] = outcome
+
+                    if outcome.success:
+                        for child in dependents[task_id]:
+                            waiting[child] -= 1
+                            if waiting[child] == 0 and child not in outcomes:
+                                ready.append(child)
+                        continue
+
+                    logger.error(f"DAG: Task {task_id} failed: {outcome.error}")
+                    skip_dependents(task_id, f"Prerequisite {task_id} failed")
+                    if self.fail_fast and not halted:
+                        halted = True
+                        for pending in running:
+                            pending.cancel()
+        finally:
+            for pending in running:
+                pending.cancel()
+
+        # Anything never launched because of fail-fast
+        for task_id in deps:
+            if task_id not in outcomes:
+                outcomes[task_id] = TaskOutcome(task_id=task_id, success=False, skipped=True, error="Plan halted after an earlier failure")
+        return outcomes
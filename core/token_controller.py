@@ -2,11 +2,116 @@
 Token budget controller and context optimizer.
 Manages token limits, estimates usage, and enforces hierarchical context compression.
 """
+import hashlib
+import threading
+from collections import OrderedDict
 import tiktoken
 from typing import List, Dict, Any, Optional
 from core_config import config
+from core.budget_scope import current_budget_scope
 from utils.logger import logger
 
+# Process-wide encoders, keyed by encoding name and loaded on first use
+_encoders: Dict[str, tiktoken.Encoding] = {}
+_encoder_lock = threading.Lock()
+
+
+def get_encoding(model_name: str) -> tiktoken.Encoding:
+    """
+    Returns the shared tiktoken encoder for a model, loading its BPE ranks once per process.
+    """
+    try:
+        encoding_name = tiktoken.encoding_name_for_model(model_name)
+    except KeyError:
+        logger.warning(f"Model {model_name} not found in tiktoken, falling back to cl100k_base.")
+        encoding_name = "cl100k_base"
+
+    encoding = _encoders.get(encoding_name)
+    if encoding is None:
+        with _encoder_lock:
+            encoding = _encoders.get(encoding_name)
+            if encoding is None:
+                encoding = tiktoken.get_encoding(encoding_name)
+                _encoders[encoding_name] = encoding
+    return encoding
+
+
+class TokenCountCache:
+    """
+    Bounded LRU of token counts keyed by (encoding, content hash).
+    Context segments repeat across steps, so most counts are served without re-encoding.
+    """
+
+    def __init__(self, max_entries: int = 4096):
+        self.max_entries = max_entries
+        self._counts: "OrderedDict[tuple, int]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def count(self, encoding: tiktoken.Encoding, text: str) -> int:
+        key = (encoding.name, hashlib.blake2b(text.encode("utf-8"), digest_size=16).digest())
+        with self._lock:
+            cached = self._counts.get(key)
+            if cached is not None:
+                self._counts.move_to_end(key)
+                self.hits += 1
+                return cached
+
+        tokens = len(encoding.encode(text))
+        with self._lock:
+            self.misses += 1
+            self._counts[key] = tokens
+            if len(self._counts) > self.max_entries:
+                self._counts.popitem(last=False)
+        return tokens
+
+    def get_stats(self) -> Dict[str, Any]:
+        total = self.hits + self.misses
+        return {
+            "entries": len(self._counts),
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / total, 4) if total else 0.0,
+        }
+
+
+# Shared across every TokenController in the process
+token_count_cache = TokenCountCache(max_entries=config.TOKEN_COUNT_CACHE_SIZE)
+
+
+class PromptCacheStats:
+    """
+    Process-wide provider prompt-cache counters (input tokens only), summed over every
+    TokenController so the admin metrics see all engines, not just one.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.calls = 0
+        self.prompt_tokens = 0
+        self.cached_prompt_tokens = 0
+
+    def record(self, prompt_tokens: int, cached_tokens: int) -> None:
+        with self._lock:
+            self.calls += 1
+            self.prompt_tokens += prompt_tokens
+            self.cached_prompt_tokens += cached_tokens
+
+    def get_stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "calls": self.calls,
+                "prompt_tokens": self.prompt_tokens,
+                "cached_prompt_tokens": self.cached_prompt_tokens,
+                "uncached_prompt_tokens": self.prompt_tokens - self.cached_prompt_tokens,
+                "cached_ratio": round(self.cached_prompt_tokens / self.prompt_tokens, 4) if self.prompt_tokens else 0.0,
+            }
+
+
+prompt_cache_stats = PromptCacheStats()
+
+
 class TokenController:
     """
     Manages the lifecycle of token usage for the AGI core.
@@ -15,45 +120,94 @@ class TokenController:
 
     def __init__(self, model_name: str = config.DEFAULT_MODEL):
         self.model_name = model_name
-        try:
-            self.encoding = tiktoken.encoding_for_model(model_name)
-        except KeyError:
-            logger.warning(f"Model {model_name} not found in tiktoken, falling back to cl100k_base.")
-            self.encoding = tiktoken.get_encoding("cl100k_base")
-            
+        # Legacy limits for calls made outside any budget scope; scoped calls are bounded by their scopes
         self.global_usage = 0
         self.task_usage = 0
+        self.lifetime_usage = 0  # Every tracked token, scoped or not (telemetry only)
         self.bandwidth_scores: List[float] = []
 
+        # Provider prompt-cache accounting (input tokens only)
+        self.prompt_tokens = 0
+        self.cached_prompt_tokens = 0
+
+    @property
+    def encoding(self) -> tiktoken.Encoding:
+        """The process-wide encoder for this controller's model (loaded lazily)."""
+        return get_encoding(self.model_name)
+
     def count_tokens(self, text: str) -> int:
-        """Counts tokens in a string."""
-        return len(self.encoding.encode(text))
+        """Counts tokens in a string, memoized by content hash."""
+        if not text:
+            return 0
+        return token_count_cache.count(self.encoding, text)
 
     def reset_task_usage(self):
         """Resets the usage counter for a new individual task."""
         self.task_usage = 0
 
     def track_usage(self, tokens: int):
-        """Logs tokens consumed by a generation step."""
+        """
+        Logs tokens consumed by a generation step. Charges the active budget scope, or the
+        controller-wide task/global counters when no scope is active.
+        """
+        self.lifetime_usage += tokens
+        scope = current_budget_scope()
+        if scope is not None:
+            scope.charge(tokens)
+            logger.debug(f"Token Consumption -> Step: {tokens} | Scope '{scope.name}': {scope.used} | Lifetime: {self.lifetime_usage}")
+            return
+
         self.global_usage += tokens
         self.task_usage += tokens
-        
-        # Log usage to telemetry
         logger.debug(f"Token Consumption -> Step: {tokens} | Task: {self.task_usage}/{config.TASK_TOKEN_LIMIT} | Global: {self.global_usage}")
 
+    def track_prompt_cache(self, prompt_tokens: int, cached_tokens: int):
+        """Records how many input tokens of a call were served from the provider's prompt cache."""
+        self.prompt_tokens += prompt_tokens
+        self.cached_prompt_tokens += cached_tokens
+        prompt_cache_stats.record(prompt_tokens, cached_tokens)
+        logger.debug(f"Prompt Cache -> Cached: {cached_tokens}/{prompt_tokens} | Lifetime Hit Ratio: {self.get_prompt_cache_stats()['cached_ratio']:.2f}")
+
+    def get_prompt_cache_stats(self) -> Dict[str, Any]:
+        """Cached vs uncached input tokens, used to verify prefix-stable prompt layouts pay off."""
+        return {
+            "prompt_tokens": self.prompt_tokens,
+            "cached_prompt_tokens": self.cached_prompt_tokens,
+            "uncached_prompt_tokens": self.prompt_tokens - self.cached_prompt_tokens,
+            "cached_ratio": (self.cached_prompt_tokens / self.prompt_tokens) if self.prompt_tokens else 0.0,
+        }
+
+    def usage_ratio(self) -> float:
+        """Fraction of the current budget consumed: the active scope chain if any, else the task limit."""
+        scope = current_budget_scope()
+        if scope is not None:
+            return scope.usage_ratio()
+        if config.TASK_TOKEN_LIMIT <= 0:
+            return 0.0
+        return self.task_usage / config.TASK_TOKEN_LIMIT
+
     def get_bandwidth_score(self) -> float:
         """
         Calculates the Cognitive Bandwidth Score:
         1.0 - (current_task_usage / task_limit)
         """
-        if config.TASK_TOKEN_LIMIT <= 0:
-            return 1.0
-        score = max(0.0, 1.0 - (self.task_usage / config.TASK_TOKEN_LIMIT))
+        score = max(0.0, 1.0 - self.usage_ratio())
         self.bandwidth_scores.append(score)
         return score
 
     def check_limit(self, estimated_next_tokens: int = 0) -> bool:
-        """Verifies if the next generation would exceed local or global limits."""
+        """
+        Verifies if the next generation would exceed local or global limits.
+        Inside a budget scope, the scope chain (agent -> mission) replaces the controller-wide counters.
+        """
+        scope = current_budget_scope()
+        if scope is not None:
+            exhausted = scope.exhausted_by(estimated_next_tokens)
+            if exhausted is not None:
+                logger.error(f"Budget scope '{exhausted.name}' exhausted: {exhausted.used}/{exhausted.limit} tokens.")
+                return False
+            return True
+
         if (self.task_usage + estimated_next_tokens) > config.TASK_TOKEN_LIMIT:
             logger.error(f"Task token limit exceeded: {self.task_usage} tokens.")
             return False
@@ -66,8 +220,12 @@ class TokenController:
         """
         Hierarchically compresses context based on priority.
         Priority: Goal > Task (Immediate) > Short Memory > Long Memory
+
+        Each segment is counted once (memoized) and the running total is kept additively.
+        Segments are newline-delimited, so BPE merges across boundaries are negligible.
         """
-        current_context = ""
+        segments: List[str] = []
+        current_tokens = 0
         # component_keys follows config.CONTEXT_PRIORITY
         for key in config.CONTEXT_PRIORITY:
             content = components.get(key, "")
@@ -75,17 +233,19 @@ class TokenController:
                 continue
                 
             proposed_content = f"[{key.upper()}]\n{content}\n"
-            current_tokens = self.count_tokens(current_context + proposed_content)
+            proposed_tokens = self.count_tokens(proposed_content)
             
-            if current_tokens > max_tokens:
+            if current_tokens + proposed_tokens > max_tokens:
                 # If we're over, we attempt to truncate or skip this component
                 # Note: 'goal' and 'task' are usually protected from truncation in high-budget scenarios
                 if key in ["goal", "task"]:
                     # Forced inclusion for critical items
-                    current_context += proposed_content
+                    segments.append(proposed_content)
+                    current_tokens += proposed_tokens
                 else:
                     logger.warning(f"Context overflow. Skipping component: {key}")
             else:
-                current_context += proposed_content
+                segments.append(proposed_content)
+                current_tokens += proposed_tokens
                 
-        return current_context
+        return "".join(segments)
@@ -2,15 +2,20 @@
 Token Ledger Service for the Ascension Intelligence Economy.
 Handles cryptographically signed execution credits and reputation transactions.
 """
+import asyncio
 import hmac
 import hashlib
 import json
+import threading
 import time
 from typing import Optional
 from sqlalchemy.orm import Session
 from api.usage_db import TokenLedger, Organization, UserAccount, SessionLocal
 from utils.logger import logger
 
+# Balance updates are read-modify-write; transactions run one at a time across worker threads
+_TRANSACTION_LOCK = threading.Lock()
+
 class TokenLedgerService:
     """
     Production-grade ledger for tracking intelligence economy transactions.
@@ -47,9 +52,13 @@ class TokenLedgerService:
     async def process_transaction(self, user_id: str, amount: float, tx_type: str, reason: str) -> bool:
         """
         Atomic transaction: Updates balance (Org or User) and records signed ledger entry.
+        The database work runs in a worker thread so concurrent requests keep being served.
         """
+        return await asyncio.to_thread(self._process_transaction, user_id, amount, tx_type, reason)
+
+    def _process_transaction(self, user_id: str, amount: float, tx_type: str, reason: str) -> bool:
         try:
-            with SessionLocal() as db:
+            with _TRANSACTION_LOCK, SessionLocal() as db:
                 # 1. Resolve Org Affinity
                 user_info = db.query(UserAccount).filter(UserAccount.id == user_id).first()
                 org_id = user_info.org_id if user_info else None
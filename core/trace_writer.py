@@ -0,0 +1,213 @@
+"""
+Write-behind persistence for Chronos trace steps and orchestrator heartbeats.
+Rows are queued in-process and a background flusher inserts them in multi-row
+transactions on a worker thread, so mission stages never wait on a DB round-trip.
+"""
+import asyncio
+import atexit
+import time
+from typing import Any, Callable, Dict, List, Optional
+
+from core_config import config
+from utils.logger import logger
+
+
+class _LoopChannel:
+    """Queue and flusher bound to one event loop."""
+
+    def __init__(self, loop: asyncio.AbstractEventLoop, max_size: int):
+        self.loop = loop
+        self.queue: asyncio.Queue = asyncio.Queue(maxsize=max_size)
+        self.flusher: Optional[asyncio.Task] = None
+        # Rows the flusher has dequeued but not yet handed to a writer thread
+        self.in_hand: List[Any] = []
+
+
+class TraceWriteBehindQueue:
+    """
+    Bounded queue of ORM rows with a single background flusher per event loop.
+
+    Producers block once `max_size` rows are pending (backpressure). If the queue stays
+    full for `enqueue_timeout` seconds the row is dropped and counted, so a stalled
+    database degrades trace fidelity instead of stalling missions. Rows still queued
+    when their loop closes or the process exits are written synchronously.
+    """
+
+    def __init__(
+        self,
+        session_factory: Optional[Callable[[], Any]] = None,
+        max_size: int = 1000,
+        batch_size: int = 50,
+        flush_interval: float = 0.5,
+        enqueue_timeout: float = 5.0,
+    ):
+        self._session_factory = session_factory
+        self.max_size = max_size
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.enqueue_timeout = enqueue_timeout
+
+        self._channels: Dict[asyncio.AbstractEventLoop, _LoopChannel] = {}
+
+        self.rows_enqueued = 0
+        self.rows_written = 0
+        self.rows_dropped = 0
+        self.batches_written = 0
+        self.batches_failed = 0
+
+        atexit.register(self.flush_sync)
+
+    def _session(self) -> Any:
+        if self._session_factory is None:
+            from api.usage_db import SessionLocal
+            self._session_factory = SessionLocal
+        return self._session_factory()
+
+    def _ensure_flusher(self) -> asyncio.Queue:
+        loop = asyncio.get_running_loop()
+        # Rows stranded on loops that have since closed are written before they are forgotten
+        for stale in [ch for ch in self._channels.values() if ch.loop.is_closed()]:
+            self._flush_channel_sync(stale)
+            del self._channels[stale.loop]
+
+        channel = self._channels.get(loop)
+        if channel is None:
+            channel = self._channels[loop] = _LoopChannel(loop, self.max_size)
+        if channel.flusher is None or channel.flusher.done():
+            channel.flusher = loop.create_task(self._run(channel))
+        return channel.queue
+
+    async def enqueue(self, row: Any) -> bool:
+        """
+        Queues an unattached ORM row for insertion. Returns False if it was dropped.
+        """
+        queue = self._ensure_flusher()
+        try:
+            queue.put_nowait(row)
+        except asyncio.QueueFull:
+            logger.warning(f"TRACE_WRITER: Queue full ({self.max_size}); applying backpressure.")
+            try:
+                await asyncio.wait_for(queue.put(row), timeout=self.enqueue_timeout)
+            except asyncio.TimeoutError:
+                self.rows_dropped += 1
+                logger.error(f"TRACE_WRITER: Dropped {type(row).__name__} row after {self.enqueue_timeout}s of backpressure.")
+                return False
+        self.rows_enqueued += 1
+        return True
+
+    async def _run(self, channel: _LoopChannel) -> None:
+        queue = channel.queue
+        while True:
+            batch = channel.in_hand = [await queue.get()]
+            handed_off = False
+            try:
+                deadline = time.monotonic() + self.flush_interval
+                while len(batch) < self.batch_size:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        break
+                    # asyncio.wait, unlike wait_for, never swallows a cancellation that races the get
+                    getter = asyncio.ensure_future(queue.get())
+                    try:
+                        done, _ = await asyncio.wait({getter}, timeout=remaining)
+                    finally:
+                        if not getter.done():
+                            getter.cancel()
+                        elif not getter.cancelled():
+                            batch.append(getter.result())
+                    if not done:
+                        break
+                handed_off, channel.in_hand = True, []
+                await asyncio.to_thread(self._write_batch, batch)
+            except asyncio.CancelledError:
+                # Rows already taken off the queue are not lost on shutdown
+                if not handed_off:
+                    channel.in_hand = []
+                    self._write_batch(batch)
+                raise
+            finally:
+                for _ in batch:
+                    queue.task_done()
+
+    def _write_batch(self, rows: List[Any]) -> None:
+        """Inserts a batch in one transaction. Runs on a worker thread."""
+        try:
+            with self._session() as db:
+                db.add_all(rows)
+                db.commit()
+            self.rows_written += len(rows)
+            self.batches_written += 1
+        except Exception as e:
+            self.batches_failed += 1
+            self.rows_dropped += len(rows)
+            logger.error(f"TRACE_WRITER: Failed to persist batch of {len(rows)} rows: {e}")
+
+    def _flush_channel_sync(self, channel: _LoopChannel) -> int:
+        """Writes whatever is still queued on a channel from the calling thread."""
+        flushed = 0
+        if channel.in_hand:
+            # The loop stopped while its flusher was collecting a batch
+            batch, channel.in_hand = channel.in_hand, []
+            self._write_batch(batch)
+            flushed += len(batch)
+        while True:
+            batch = []
+            while len(batch) < self.batch_size:
+                try:
+                    batch.append(channel.queue.get_nowait())
+                except asyncio.QueueEmpty:
+                    break
+            if not batch:
+                return flushed
+            self._write_batch(batch)
+            for _ in batch:
+                channel.queue.task_done()
+            flushed += len(batch)
+
+    def flush_sync(self) -> None:
+        """Writes every queued row synchronously. Registered with atexit."""
+        flushed = sum(self._flush_channel_sync(channel) for channel in list(self._channels.values()))
+        if flushed:
+            logger.info(f"TRACE_WRITER: Flushed {flushed} pending rows at exit.")
+
+    async def drain(self, timeout: float = 10.0) -> None:
+        """
+        Waits for everything queued on the current loop to be written, then stops its flusher.
+        The writer stays usable: a later enqueue starts a fresh flusher.
+        """
+        channel = self._channels.pop(asyncio.get_running_loop(), None)
+        if channel is None:
+            return
+        if channel.flusher is not None and not channel.flusher.done():
+            try:
+                await asyncio.wait_for(channel.queue.join(), timeout=timeout)
+            except asyncio.TimeoutError:
+                logger.error(f"TRACE_WRITER: Drain timed out with {channel.queue.qsize()} rows pending.")
+            channel.flusher.cancel()
+            try:
+                await channel.flusher
+            except asyncio.CancelledError:
+                pass
+        # Rows that raced the flusher shutdown
+        await asyncio.to_thread(self._flush_channel_sync, channel)
+        logger.info(f"TRACE_WRITER: Drained. {self.rows_written} rows written, {self.rows_dropped} dropped.")
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            "pending": sum(channel.queue.qsize() for channel in self._channels.values()),
+            "max_size": self.max_size,
+            "rows_enqueued": self.rows_enqueued,
+            "rows_written": self.rows_written,
+            "rows_dropped": self.rows_dropped,
+            "batches_written": self.batches_written,
+            "batches_failed": self.batches_failed,
+        }
+
+
+# Singleton write-behind queue
+trace_writer = TraceWriteBehindQueue(
+    max_size=config.TRACE_QUEUE_MAX_SIZE,
+    batch_size=config.TRACE_BATCH_SIZE,
+    flush_interval=config.TRACE_FLUSH_INTERVAL,
+    enqueue_timeout=config.TRACE_ENQUEUE_TIMEOUT,
+)
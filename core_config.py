@@ -24,6 +24,57 @@ class AscensionConfig(BaseSettings):
     ENABLE_AUTO_MOCK_FALLBACK: bool = True  # Automatically switch to mock on 429 errors
     DISABLE_REFINEMENT: bool = False  # Set to True to save API quota by skipping cognitive passes
     SECONDARY_MODEL: str = "gpt-4o-mini" # Fallback if primary is unavailable
+    ENABLE_MODEL_CASCADE: bool = True  # Cheap call sites try SECONDARY_MODEL first (see core/model_cascade.py)
+
+    # Response Cache & Coalescing Settings
+    ENABLE_RESPONSE_CACHE: bool = False  # Opt-in
+    RESPONSE_CACHE_MEMORY_ENTRIES: int = 512
+    RESPONSE_CACHE_PATH: str = "./data/response_cache"  # Empty string disables the disk tier
+    RESPONSE_CACHE_TTL_SECONDS: int = 86400
+    RESPONSE_CACHE_MAX_DISK_MB: int = 256
+    ENABLE_REQUEST_COALESCING: bool = True  # Share one upstream call across identical in-flight requests
+
+    # Semantic Stage Cache (planner / architect outputs)
+    ENABLE_STAGE_CACHE: bool = False  # Scoped per org (or user); missions opt out with swarm config {"stage_cache": false}
+    STAGE_CACHE_EMBEDDER: str = "local"  # "local" (hashed n-grams, no round-trip) or "openai" (EMBEDDING_MODEL)
+    STAGE_CACHE_REUSE_THRESHOLD: float = 0.97  # Cosine similarity to reuse a cached output as-is
+    STAGE_CACHE_WARM_START_THRESHOLD: float = 0.9  # Cosine similarity to adapt it with SECONDARY_MODEL
+    STAGE_CACHE_MAX_ENTRIES: int = 256  # Per (org, agent, profile) namespace
+    STAGE_CACHE_TTL_SECONDS: int = 604800
+
+    # Provider Connection Pool
+    LLM_MAX_CONNECTIONS: int = 64  # Per provider, shared by every ReasoningEngine in the process
+    LLM_MAX_KEEPALIVE_CONNECTIONS: int = 32
+    LLM_KEEPALIVE_EXPIRY: float = 30.0
+    LLM_REQUEST_TIMEOUT: float = 120.0
+
+    # Adaptive (AIMD) Concurrency Control
+    LLM_INITIAL_CONCURRENCY: int = 8
+    LLM_MIN_CONCURRENCY: int = 1
+    LLM_MAX_CONCURRENCY: int = 64
+    LLM_QUEUE_DEADLINE: float = 90.0  # Seconds a request may wait/retry before failing
+
+    # Hedged Requests (latency-critical roles)
+    ENABLE_REQUEST_HEDGING: bool = False  # Opt-in; duplicates slow calls past the role's rolling p90
+    HEDGE_ROLES: list = ["planner", "architect", "implementer"]
+    HEDGE_TARGET: str = "same"  # "same" model or "secondary" (SECONDARY_MODEL)
+    HEDGE_BUDGET_PCT: float = 10.0  # Max extra token spend from hedges, as % of primary spend
+    HEDGE_MIN_SAMPLES: int = 20  # Latency history required before a role can hedge
+
+    # Offline Batch Inference (non-interactive workloads only)
+    ENABLE_BATCH_INFERENCE: bool = False  # Opt-in; results may take up to the provider's completion window
+    BATCH_PROVIDER: str = "openai"  # "openai" (Batch API) or "local" (in-process fake)
+    BATCH_MAX_SIZE: int = 100
+    BATCH_MAX_WAIT_SECONDS: float = 30.0  # Flush a partial batch after this long
+    BATCH_POLL_INTERVAL: float = 30.0
+
+    # Trace Persistence (write-behind)
+    TRACE_QUEUE_MAX_SIZE: int = 1000  # Pending trace/heartbeat rows before producers block
+    TRACE_BATCH_SIZE: int = 50  # Rows inserted per transaction
+    TRACE_FLUSH_INTERVAL: float = 0.5  # Max seconds a partial batch waits before flushing
+    TRACE_ENQUEUE_TIMEOUT: float = 5.0  # Backpressure wait before a row is dropped
+    ENABLE_MISSION_CHECKPOINTS: bool = True  # Commit each swarm stage's output so a mission ID can resume
+    MISSION_CHECKPOINT_RETENTION_HOURS: int = 72  # Checkpoints of abandoned missions are purged after this
 
     # Memory Settings
     VECTOR_DB_TYPE: str = "faiss"  # Or "chroma"
@@ -32,18 +83,37 @@ class AscensionConfig(BaseSettings):
 
     # Engine Constraints
     MAX_PLANNING_STEPS: int = 10
+    PLAN_MAX_CONCURRENCY: int = 4  # Plan tasks executed concurrently once their dependencies finish
+    PLAN_FAIL_FAST: bool = True  # Stop the whole plan on the first failed task
     MAX_TOOL_RETRIES: int = 3
+    ENABLE_EARLY_TOOL_DISPATCH: bool = False  # Start tools once the streamed verdict names them
+    EARLY_DISPATCH_SAFE_TOOLS: list = ["file_system:read", "file_system:list", "git_manager:status", "web_search"]  # Read-only "tool" or "tool:action" entries eligible for early dispatch
+    SWARM_REVIEW_MAX_ISSUES: int = 12  # Cap on merged reviewer findings sent back to the implementer
+    ENABLE_FORGE_PRUNING: bool = False  # Successive halving: drop the weaker half of Forge branches at each gate
+    FORGE_PRUNE_STAGES: list = ["architecture"]  # Stages after which branches are scored by SECONDARY_MODEL
+    FORGE_MIN_SURVIVORS: int = 1
+    ENABLE_FORGE_SHARED_PLAN: bool = True  # Plan once for the unbiased objective; branches fork at architecture
 
     # Token & Budget Control
     GLOBAL_TOKEN_BUDGET: int = 100000  # Total tokens per overarching goal
     TASK_TOKEN_LIMIT: int = 10000      # Tokens per individual task
     ADAPTIVE_COMPRESSION_THRESHOLD: float = 0.8  # Compress if > 80% usage
+    WORKING_MEMORY_TOKEN_BUDGET: int = 6000  # Per-task working memory sent to the DecisionEngine
+    COMPACTION_KEEP_RECENT_STEPS: int = 3  # Steps kept verbatim; older ones are summarized
+    COMPACTION_TOOL_OUTPUT_CHARS: int = 4000  # Tool outputs above this keep only head and tail
+    COMPACTION_MIN_NEW_STEPS: int = 2  # Steps added since the last compaction before another can trigger
+    COMPACTION_RATIO_MARGIN: float = 0.05  # Budget-ratio growth since the last compaction needed to re-trigger on it
     CONTEXT_PRIORITY: list = ["goal", "task", "short_memory", "long_memory"]
+    TOKEN_COUNT_CACHE_SIZE: int = 4096  # Memoized segment token counts shared by every TokenController
 
     # Sandbox Security Settings
     SANDBOX_TIMEOUT: float = 5.0
     SANDBOX_MAX_MEMORY_MB: int = 128
     ENABLE_STRICT_ISOLATION: bool = True
+    FORGE_BENCH_WORKERS: int = 2  # Concurrent sandbox processes benchmarking Forge variants
+    FORGE_BENCH_SAMPLES: int = 15  # Timed workload runs per variant
+    FORGE_BENCH_WARMUP: int = 3
+    FORGE_BENCH_TIMEOUT: float = 30.0  # Per-variant sandbox wall clock, tests and samples included
 
     model_config = SettingsConfigDict(
         env_file=".env",
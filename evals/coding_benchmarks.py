@@ -35,7 +35,7 @@ class CodingBenchmarkRunner:
             goal = f"Objective: {bm.target_objective}\nCode to improve:\n{bm.initial_code}"
             
             # Track tokens specifically for this benchmark
-            self.core.reasoning.tokens.reset_task_usage()
+            tokens_before = self.core.reasoning.tokens.lifetime_usage
             await self.core.execute_goal(goal)
             
             # 3. Capture improved code (assuming last tool call or final response)
@@ -46,7 +46,7 @@ class CodingBenchmarkRunner:
             post_analysis = self.intelligence.parse_source(improved_code)
             
             complexity_delta = post_analysis.get("complexity", 0) - baseline.get("complexity", 0)
-            tokens_used = self.core.reasoning.tokens.task_usage
+            tokens_used = self.core.reasoning.tokens.lifetime_usage - tokens_before
             bandwidth = self.core.reasoning.tokens.get_bandwidth_score()
             
             # 5. Verify correctness via unit tests (mocked for now)
@@ -4,6 +4,7 @@ Updates internal models or heuristic databases based on Reflection Reports.
 from typing import Dict, Any, List
 import json
 import os
+import time
 
 from learning.self_reflection import ReflectionReport
 from core_config import config
@@ -15,20 +16,44 @@ class PerformanceAnalyzer:
     designated as `system_heuristics`. This acts as a reinforcement layer over time.
     """
 
-    def __init__(self):
+    def __init__(self, refresh_interval: float = 30.0):
         """
         Bootstraps a local file representing "learned rules" for the Decision Engine to inject.
         """
         self.heuristics_file = f"{config.MEMORY_INDEX_PATH}_heuristics.json"
+        self.refresh_interval = refresh_interval
+        self._file_mtime = self._mtime()
+        self._checked_at = time.monotonic()
         self.learned_rules = self._load()
         logger.info(f"PerformanceAnalyzer loaded {len(self.learned_rules)} learned rules.")
 
+    def _mtime(self) -> float:
+        try:
+            return os.path.getmtime(self.heuristics_file)
+        except OSError:
+            return 0.0
+
     def _load(self) -> List[str]:
         if os.path.exists(self.heuristics_file):
             with open(self.heuristics_file, 'r') as f:
                 return json.load(f)
         return []
 
+    def refresh(self) -> None:
+        """
+        Reloads the rules if another process rewrote the heuristics file.
+        The file is checked at most once per `refresh_interval` seconds.
+        """
+        now = time.monotonic()
+        if now - self._checked_at < self.refresh_interval:
+            return
+        self._checked_at = now
+        mtime = self._mtime()
+        if mtime != self._file_mtime:
+            self._file_mtime = mtime
+            self.learned_rules = self._load()
+            logger.info(f"PerformanceAnalyzer reloaded {len(self.learned_rules)} learned rules.")
+
     def _save(self):
         os.makedirs(os.path.dirname(self.heuristics_file), exist_ok=True)
         with open(self.heuristics_file, 'w') as f:
@@ -46,6 +71,7 @@ class PerformanceAnalyzer:
         if rule not in self.learned_rules:
             self.learned_rules.append(rule)
             self._save()
+            self._file_mtime = self._mtime()
             logger.info(f"Learned rule applied to system heuristics: {rule[:50]}...")
         else:
             logger.debug("Rule was already present in system heuristics. Ignoring.")
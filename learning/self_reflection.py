@@ -54,6 +54,8 @@ class SelfReflectionModule:
             system_prompt=sys_prompt,
             user_prompt=user_prompt,
             temperature=0.2, # Low hallucination for pure facts
-            response_model=ReflectionReport
+            response_model=ReflectionReport,
+            call_site="reflection.generate_reflection",
+            batch=True  # Post-mission retrospective; nothing waits on it interactively
         )
         return report
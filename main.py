@@ -57,16 +57,17 @@ async def interactive_shell():
             print(f"\n[{agent.agent_id} IS THINKING...]")
             # Note: actual execution requires the LLM loop implementation to be wired
             # internally. This triggers the highest-level plan generation:
+            tokens = agent.cognition.reasoning.tokens
+            tokens_before = tokens.lifetime_usage
             result = await agent.cognition.execute_goal(goal)
             
             # Display Telemetry
-            tokens = agent.cognition.reasoning.tokens
             bandwidth = tokens.get_bandwidth_score()
             from metrics.telemetry import tracker
             
             print("\n========================================")
             print("[+] MISSION COMPLETE")
-            print(f"[#] Tokens Consumed: {tokens.task_usage}")
+            print(f"[#] Tokens Consumed: {tokens.lifetime_usage - tokens_before}")
             print(f"[#] Bandwidth Score: {bandwidth:.2f}")
             print(f"[#] Swarm Health: 100% (Alpha-Registry Active)")
             print(f"[#] Governance Mode: {agent.cognition.gov.config.mode.value.upper()}")
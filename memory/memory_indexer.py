@@ -71,7 +71,9 @@ class MemoryIndexer:
             system_prompt=sys_prompt,
             user_prompt=user_prompt,
             temperature=0.2,
-            response_model=resp_model
+            response_model=resp_model,
+            call_site="memory.compress_episode",
+            batch=True  # Consolidation is offline; eligible for the batch API when enabled
         )
         
         logger.info(f"Episode compressed regarding: {summary.core_topic}")
@@ -5,11 +5,11 @@ Provides local fast semantic search capabilities.
 import os
 import faiss
 import numpy as np
-import openai
 from typing import List, Dict, Any, Tuple
 import json
 
 from core_config import config
+from core.llm_client_registry import llm_client_registry
 from utils.logger import logger
 
 class VectorStore:
@@ -41,7 +41,7 @@ class VectorStore:
             self.metadata = []
             logger.info(f"Initialized empty VectorStore (dim={self.dimension}).")
 
-        self.client = openai.AsyncOpenAI(api_key=config.OPENAI_API_KEY)
+        self.client = llm_client_registry.get_client("openai", config.OPENAI_API_KEY)
 
     async def get_embedding(self, text: str) -> List[float]:
         """
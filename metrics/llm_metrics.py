@@ -0,0 +1,173 @@
+"""
+Per-call LLM performance metrics.
+Aggregates wall time, time-to-first-token and token counts into fixed-bucket histograms
+(bounded memory regardless of traffic) and renders them in the Prometheus text format.
+"""
+import threading
+from contextvars import ContextVar
+from typing import Dict, List, Optional, Tuple
+
+# Call site of the generate_response() currently executing in this task, for provider-level metrics
+current_call_site: ContextVar[Optional[str]] = ContextVar("current_call_site", default=None)
+
+LATENCY_BUCKETS = (0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 20.0, 40.0, 80.0, 160.0)
+TOKEN_BUCKETS = (64, 256, 512, 1024, 2048, 4096, 8192, 16384, 32768, 65536)
+
+CALL_LABELS = ("role", "model", "call_site")
+OVERFLOW_LABEL = "other"
+
+
+def role_for_call_site(call_site: Optional[str]) -> str:
+    """
+    Maps a call site to its agent role: 'swarm.architect' -> 'architect', 'planner.create_plan' -> 'planner'.
+    """
+    if not call_site:
+        return "unknown"
+    parts = call_site.split(".")
+    if parts[0] == "swarm" and len(parts) > 1:
+        return parts[1]
+    return parts[0]
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(names: Tuple[str, ...], values: Tuple[str, ...], extra: str = "") -> str:
+    pairs = [f'{name}="{_escape(value)}"' for name, value in zip(names, values)]
+    if extra:
+        pairs.append(extra)
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+class Histogram:
+    """
+    Cumulative fixed-bucket histogram keyed by label values. Once `max_series` label
+    combinations exist, new combinations are folded into a single overflow series.
+    """
+
+    def __init__(self, name: str, help_text: str, label_names: Tuple[str, ...], buckets: Tuple[float, ...], max_series: int):
+        self.name = name
+        self.help_text = help_text
+        self.label_names = label_names
+        self.buckets = tuple(sorted(buckets))
+        self.max_series = max_series
+        # label values -> [bucket counts..., +Inf count, sum]
+        self._series: Dict[Tuple[str, ...], List[float]] = {}
+
+    def observe(self, labels: Tuple[str, ...], value: float) -> None:
+        series = self._series.get(labels)
+        if series is None:
+            if len(self._series) >= self.max_series:
+                labels = tuple(OVERFLOW_LABEL for _ in self.label_names)
+                series = self._series.get(labels)
+            if series is None:
+                series = [0.0] * (len(self.buckets) + 2)
+                self._series[labels] = series
+
+        for i, bound in enumerate(self.buckets):
+            if value <= bound:
+                series[i] += 1
+        series[-2] += 1
+        series[-1] += value
+
+    def render(self) -> List[str]:
+        lines = [f"# HELP {self.name} {self.help_text}", f"# TYPE {self.name} histogram"]
+        for labels, series in sorted(self._series.items()):
+            for bound, count in zip(self.buckets, series):
+                le = 'le="%g"' % bound
+                lines.append(f"{self.name}_bucket{_format_labels(self.label_names, labels, le)} {count:g}")
+            le = 'le="+Inf"'
+            lines.append(f"{self.name}_bucket{_format_labels(self.label_names, labels, le)} {series[-2]:g}")
+            plain = _format_labels(self.label_names, labels)
+            lines.append(f"{self.name}_sum{plain} {series[-1]:g}")
+            lines.append(f"{self.name}_count{plain} {series[-2]:g}")
+        return lines
+
+
+class Counter:
+    """
+    Monotonic counter keyed by label values, with the same overflow folding as Histogram.
+    """
+
+    def __init__(self, name: str, help_text: str, label_names: Tuple[str, ...], max_series: int):
+        self.name = name
+        self.help_text = help_text
+        self.label_names = label_names
+        self.max_series = max_series
+        self._series: Dict[Tuple[str, ...], float] = {}
+
+    def inc(self, labels: Tuple[str, ...], amount: float = 1.0) -> None:
+        if labels not in self._series and len(self._series) >= self.max_series:
+            labels = tuple(OVERFLOW_LABEL for _ in self.label_names)
+        self._series[labels] = self._series.get(labels, 0.0) + amount
+
+    def render(self) -> List[str]:
+        lines = [f"# HELP {self.name} {self.help_text}", f"# TYPE {self.name} counter"]
+        for labels, value in sorted(self._series.items()):
+            lines.append(f"{self.name}{_format_labels(self.label_names, labels)} {value:g}")
+        return lines
+
+
+class LLMMetrics:
+    """
+    Process-wide registry of LLM call metrics. Thread-safe; every operation is O(buckets).
+    """
+
+    def __init__(self, max_series: int = 500):
+        self._lock = threading.Lock()
+        self.duration = Histogram(
+            "llm_request_duration_seconds", "Wall time of upstream LLM calls.",
+            CALL_LABELS + ("outcome",), LATENCY_BUCKETS, max_series
+        )
+        self.ttft = Histogram(
+            "llm_time_to_first_token_seconds", "Time until the first streamed content token.",
+            CALL_LABELS, LATENCY_BUCKETS, max_series
+        )
+        self.prompt_tokens = Histogram(
+            "llm_prompt_tokens", "Prompt tokens per LLM call.",
+            CALL_LABELS, TOKEN_BUCKETS, max_series
+        )
+        self.completion_tokens = Histogram(
+            "llm_completion_tokens", "Completion tokens per LLM call.",
+            CALL_LABELS, TOKEN_BUCKETS, max_series
+        )
+        self.requests = Counter(
+            "llm_requests_total", "Upstream LLM calls by outcome and error class.",
+            CALL_LABELS + ("error_class",), max_series
+        )
+
+    def record_call(
+        self,
+        call_site: Optional[str],
+        model: str,
+        duration: float,
+        ttft: Optional[float] = None,
+        prompt_tokens: Optional[int] = None,
+        completion_tokens: Optional[int] = None,
+        error: Optional[BaseException] = None
+    ) -> None:
+        """Records one upstream call. `error` is the exception it raised, if any."""
+        labels = (role_for_call_site(call_site), model or "unknown", call_site or "unknown")
+        error_class = type(error).__name__ if error is not None else "none"
+        with self._lock:
+            self.duration.observe(labels + ("error" if error is not None else "success",), duration)
+            self.requests.inc(labels + (error_class,))
+            if ttft is not None:
+                self.ttft.observe(labels, ttft)
+            if prompt_tokens is not None:
+                self.prompt_tokens.observe(labels, prompt_tokens)
+            if completion_tokens is not None:
+                self.completion_tokens.observe(labels, completion_tokens)
+
+    def render_prometheus(self) -> str:
+        """Renders every metric in the Prometheus text exposition format (v0.0.4)."""
+        with self._lock:
+            lines: List[str] = []
+            for metric in (self.requests, self.duration, self.ttft, self.prompt_tokens, self.completion_tokens):
+                lines.extend(metric.render())
+        return "\n".join(lines) + "\n"
+
+
+# Singleton metrics registry
+llm_metrics = LLMMetrics()
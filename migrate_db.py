@@ -4,7 +4,7 @@ Handles structural updates for swarm lineage, federated clusters, and the token
 """
 import os
 from sqlalchemy import create_engine, inspect, text
-from api.usage_db import engine, SwarmMission, SwarmCluster, FederatedMemory, UserBalance, TokenLedger, APIKey, ResearchArtifact, Organization, ValidatorNode, BenchmarkChallenge, MissionKnowledge, KnowledgeTag
+from api.usage_db import engine, SwarmMission, SwarmCluster, FederatedMemory, UserBalance, TokenLedger, APIKey, ResearchArtifact, Organization, ValidatorNode, BenchmarkChallenge, MissionKnowledge, KnowledgeTag, MissionCheckpoint
 from utils.logger import logger
 
 def migrate():
@@ -103,5 +103,18 @@ def migrate():
             logger.info("MIGRATION: Added 'expires_at' column to 'api_keys' table.")
         conn.commit()
 
+    # Mission checkpoints: owner column for resume authorization
+    inspector = inspect(engine)
+    if "mission_checkpoints" not in inspector.get_table_names():
+        MissionCheckpoint.__table__.create(engine)
+        logger.info("MIGRATION: Created 'mission_checkpoints' table.")
+    else:
+        with engine.connect() as conn:
+            columns = [c['name'] for c in inspector.get_columns("mission_checkpoints")]
+            if "user_id" not in columns:
+                conn.execute(text("ALTER TABLE mission_checkpoints ADD COLUMN user_id VARCHAR"))
+                logger.info("MIGRATION: Added 'user_id' column to 'mission_checkpoints' table.")
+            conn.commit()
+
 if __name__ == "__main__":
     migrate()
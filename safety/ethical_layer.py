@@ -39,7 +39,8 @@ class EthicalLayer:
             system_prompt=sys_prompt,
             user_prompt=user_prompt,
             temperature=0.0,
-            response_model=EthicalCheck
+            response_model=EthicalCheck,
+            call_site="safety.evaluate_action"
         )
 
         if not result.is_safe:
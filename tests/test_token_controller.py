@@ -0,0 +1,30 @@
+"""
+Token budget accounting: scoped charges must not leak into the unscoped limits.
+"""
+from core.budget_scope import budget_scope
+from core.token_controller import TokenController
+from core_config import config
+
+
+def test_unscoped_check_after_scoped_spend():
+    tokens = TokenController()
+    spend = config.TASK_TOKEN_LIMIT + 2000
+
+    with budget_scope("mission", limit=spend * 2):
+        with budget_scope("agent:planner") as agent:
+            tokens.track_usage(spend)
+            assert agent.used == spend
+
+    assert tokens.task_usage == 0
+    assert tokens.global_usage == 0
+    assert tokens.lifetime_usage == spend
+    assert tokens.check_limit()
+
+
+def test_unscoped_spend_still_enforces_task_limit():
+    tokens = TokenController()
+    tokens.track_usage(config.TASK_TOKEN_LIMIT + 1)
+
+    assert not tokens.check_limit()
+    with budget_scope("mission", limit=config.TASK_TOKEN_LIMIT):
+        assert tokens.check_limit()
@@ -8,6 +8,7 @@ from typing import Type
 from pydantic import BaseModel, Field
 
 from tools.base_tool import BaseTool
+from core.mission_registry import check_cancelled
 from utils.logger import logger
 
 class CodeExecutionInput(BaseModel):
@@ -47,6 +48,7 @@ class CodeExecutionTool(BaseTool):
             if f"import {forbidden}" in code or f"from {forbidden}" in code:
                 return f"Sandbox Violation: Import of '{forbidden}' is restricted."
 
+        check_cancelled()
         logger.warning(f"EXECUTING HARDENED SANDBOX CODE: {len(code)} bytes.")
 
         # Wrap code in exception summarizer to save tokens on error
@@ -75,6 +77,11 @@ except Exception as e:
 
             try:
                 stdout, stderr = await asyncio.wait_for(process.communicate(), timeout=timeout)
+            except asyncio.CancelledError:
+                # Mission cancelled mid-run: never leave the child behind
+                process.kill()
+                await asyncio.shield(process.wait())
+                raise
             except asyncio.TimeoutError:
                 process.kill()
                 await process.communicate()